@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""
+benchScanner.py
+
+Tarayıcı motorları için kıyaslama (benchmark) aracı.
+127.0.0.0/8 üzerinde yerel bir sahte sunucu filosu başlatır ve her motoru bu filoya karşı çalıştırır:
+
+    open    : hemen kabul eder, banner gönderir
+    closed  : dinleyen yok (RST)
+    slow    : bağlantıyı gecikmeli kabul eder (accept gecikmesi)
+    banner  : hemen kabul eder, banner'ı gecikmeli gönderir
+
+Rapor: saniyedeki deneme (probes/sec), p50/p99 deneme gecikmesi, tepe RSS ve doğruluk.
+Sonuçlar JSON olarak kaydedilebilir; --compare ile önceki bir çalıştırmayla karşılaştırılır.
+
+Kullanım:
+    python benchScanner.py
+    python benchScanner.py --open 100 --closed 100 --slow 10 --banner 10 --json bench.json
+    python benchScanner.py --compare bench.json
+
+consoleScanner'daki 'bench' komutu da bunu kullanır.
+"""
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import heapq
+import json
+import platform
+import selectors
+import socket
+import sys
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+BANNER = b"SSH-2.0-OTP-bench\r\n"
+KINDS = ("open", "closed", "slow", "banner")
+DEFAULT_FLEET = {"open": 20, "closed": 20, "slow": 5, "banner": 5}
+
+# ----------------------------
+# Stand-in server fleet
+# ----------------------------
+class StandInFleet:
+    """
+    Yerel dinleyici filosu; tüm dinleyiciler tek bir selector thread'inde çalışır.
+    counts: {kind: adet}, targets: [(ip, port, kind)] — kind: open/closed/slow/banner.
+    Linux'ta her hedef kendi 127.0.0.x adresini alır; bağlanamayan sistemlerde 127.0.0.1 kullanılır.
+    """
+
+    def __init__(self, counts: Optional[Dict[str, int]] = None, delay: float = 0.2, backlog: int = 128):
+        self.counts = dict(DEFAULT_FLEET, **(counts or {}))
+        self.delay = delay
+        self.backlog = backlog
+        self.targets: List[Tuple[str, int, str]] = []
+        self._sel = selectors.DefaultSelector()
+        self._timers: list = []   # heap of (due, seq, fn)
+        self._seq = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._wake_r, self._wake_w = socket.socketpair()
+
+    # --- setup ---
+    def _addresses(self):
+        n = 2
+        while True:
+            yield f"127.0.{n // 254}.{n % 254 + 1}"
+            n += 1
+
+    def _bind(self, addrs) -> socket.socket:
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind((next(addrs), 0))
+        except OSError:
+            s.bind(("127.0.0.1", 0))  # 127/8 sadece 127.0.0.1 olarak yapılandırılmış (macOS, Windows)
+        return s
+
+    def start(self) -> "StandInFleet":
+        addrs = self._addresses()
+        for kind in KINDS:
+            for _ in range(max(0, self.counts[kind])):
+                s = self._bind(addrs)
+                ip, port = s.getsockname()
+                if kind == "closed":
+                    s.close()  # port boş kalır: bağlantı RST ile reddedilir
+                else:
+                    s.listen(self.backlog)
+                    s.setblocking(False)
+                    self._sel.register(s, selectors.EVENT_READ, (self._on_listener, kind))
+                self.targets.append((ip, port, kind))
+        self._sel.register(self._wake_r, selectors.EVENT_READ, (None, None))
+        self._thread = threading.Thread(target=self._run, name="bench-fleet", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        try:
+            self._wake_w.send(b"x")
+        except OSError:
+            pass
+        if self._thread:
+            self._thread.join(2)
+        for key in list(self._sel.get_map().values()):
+            try:
+                key.fileobj.close()
+            except OSError:
+                pass
+        self._sel.close()
+        self._wake_w.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # --- event loop ---
+    def _later(self, delay: float, fn: Callable[[], None]) -> None:
+        self._seq += 1
+        heapq.heappush(self._timers, (time.monotonic() + delay, self._seq, fn))
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            timeout = None
+            if self._timers:
+                timeout = max(0.0, self._timers[0][0] - time.monotonic())
+            for key, _ in self._sel.select(timeout):
+                handler, arg = key.data
+                if handler is None:
+                    return  # stop() uyandırdı
+                handler(key.fileobj, arg)
+            now = time.monotonic()
+            while self._timers and self._timers[0][0] <= now:
+                heapq.heappop(self._timers)[2]()
+
+    def _on_listener(self, lsock: socket.socket, kind: str) -> None:
+        if kind == "slow":
+            # kabulü geciktir; o sürede dinleyiciyi izleme
+            self._sel.unregister(lsock)
+            self._later(self.delay, lambda: self._slow_accept(lsock))
+            return
+        self._accept(lsock, kind)
+
+    def _slow_accept(self, lsock: socket.socket) -> None:
+        self._accept(lsock, "slow")
+        try:
+            self._sel.register(lsock, selectors.EVENT_READ, (self._on_listener, "slow"))
+        except (KeyError, ValueError, OSError):
+            pass
+
+    def _accept(self, lsock: socket.socket, kind: str) -> None:
+        while True:
+            try:
+                conn, _ = lsock.accept()
+            except (BlockingIOError, OSError):
+                return
+            conn.setblocking(False)
+            self._sel.register(conn, selectors.EVENT_READ, (self._on_conn, None))
+            if kind == "banner":
+                self._later(self.delay, lambda c=conn: self._send_banner(c))
+            else:
+                self._send_banner(conn)
+
+    def _send_banner(self, conn: socket.socket) -> None:
+        try:
+            conn.send(BANNER)
+        except OSError:
+            pass
+
+    def _on_conn(self, conn: socket.socket, _arg) -> None:
+        # istemcinin gönderdiğini oku; kapattığında biz de kapatırız (RST yerine düzgün kapanış)
+        try:
+            data = conn.recv(4096)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data:
+            self._sel.unregister(conn)
+            conn.close()
+
+# ----------------------------
+# Measurement helpers
+# ----------------------------
+class RssSampler:
+    """Çalışma süresince tepe RSS (bayt): /proc/self/status varsa örnekler, yoksa ru_maxrss."""
+
+    def __init__(self, interval: float = 0.02):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def current() -> int:
+        try:
+            with open("/proc/self/status", "rb") as f:
+                for line in f:
+                    if line.startswith(b"VmRSS:"):
+                        return int(line.split()[1]) * 1024
+        except OSError:
+            pass
+        try:
+            import resource
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return rss if sys.platform == "darwin" else rss * 1024
+        except ImportError:
+            return 0
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, self.current())
+
+    def __enter__(self):
+        self.peak = self.current()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, self.current())
+
+
+def percentile(sorted_values: List[float], q: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    i = min(len(sorted_values) - 1, max(0, int(round(q / 100 * (len(sorted_values) - 1)))))
+    return sorted_values[i]
+
+# ----------------------------
+# Engines
+# ----------------------------
+ProbeFn = Callable[[str, int, float], Tuple[bool, str]]
+
+def default_engines() -> Dict[str, ProbeFn]:
+    """Kıyaslanacak motorlar: ad -> probe(ip, port, timeout) -> (is_open, banner)."""
+    import consoleScanner
+    import menuScanner
+    return {
+        "consoleScanner.check_port": consoleScanner.check_port,
+        "menuScanner.scan_port": menuScanner.scan_port,
+    }
+
+
+def run_engine(probe: ProbeFn, targets: List[Tuple[str, int, str]], timeout: float = 1.0,
+               workers: int = 50, rounds: int = 1) -> dict:
+    """Tek motoru filoya karşı çalıştırır ve ölçümleri döndürür (scan_hosts gibi thread havuzu)."""
+    jobs = [t for _ in range(rounds) for t in targets]
+    latencies: List[float] = []
+    correct = false_open = false_closed = banners = banner_expected = 0
+
+    def one(target):
+        ip, port, kind = target
+        t0 = time.perf_counter()
+        is_open, banner = probe(ip, port, timeout)
+        return kind, is_open, banner, time.perf_counter() - t0
+
+    with RssSampler() as rss:
+        start = time.perf_counter()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(workers, len(jobs)))) as exe:
+            for kind, is_open, banner, took in exe.map(one, jobs):
+                latencies.append(took)
+                expected_open = kind != "closed"
+                if is_open == expected_open:
+                    correct += 1
+                elif is_open:
+                    false_open += 1
+                else:
+                    false_closed += 1
+                if expected_open:
+                    banner_expected += 1
+                    if is_open and banner.startswith(BANNER.decode().strip()):
+                        banners += 1
+        elapsed = time.perf_counter() - start
+    latencies.sort()
+    n = len(jobs)
+    return {
+        "probes": n,
+        "seconds": round(elapsed, 4),
+        "probes_per_sec": round(n / elapsed, 1) if elapsed > 0 else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3) if latencies else None,
+        "peak_rss": rss.peak,
+        "accuracy": round(correct / n, 4) if n else None,
+        "false_open": false_open,
+        "false_closed": false_closed,
+        "banner_rate": round(banners / banner_expected, 4) if banner_expected else None,
+    }
+
+
+def run_bench(counts: Optional[Dict[str, int]] = None, delay: float = 0.2,
+              timeout: float = 1.0, workers: int = 50, rounds: int = 1,
+              engines: Optional[Dict[str, ProbeFn]] = None, only: Optional[List[str]] = None,
+              log: Callable[[str], None] = print) -> dict:
+    """Filoyu başlatır, motorları sırayla çalıştırır; JSON'a yazılabilir bir rapor döndürür."""
+    engines = engines or default_engines()
+    if only:
+        engines = {k: v for k, v in engines.items() if any(o in k for o in only)}
+    report = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "config": {},
+        "engines": {},
+    }
+    with StandInFleet(counts, delay) as fleet:
+        c = fleet.counts
+        report["config"] = dict(c, delay=delay, timeout=timeout, workers=workers, rounds=rounds)
+        log(f"Filo hazır: {len(fleet.targets)} hedef ({c['open']} açık, {c['closed']} kapalı, "
+            f"{c['slow']} yavaş kabul, {c['banner']} gecikmeli banner; gecikme {delay}s)")
+        for name, probe in engines.items():
+            log(f"{name} çalışıyor...")
+            report["engines"][name] = run_engine(probe, fleet.targets, timeout, workers, rounds)
+    return report
+
+# ----------------------------
+# Reporting
+# ----------------------------
+def _fmt(v, unit: str = "") -> str:
+    return "-" if v is None else f"{v}{unit}"
+
+
+def format_report(report: dict, previous: Optional[dict] = None) -> str:
+    lines = [f"{'motor':<28} {'deneme/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'tepe RSS':>10} {'doğruluk':>9} {'banner':>7}"]
+    prev = (previous or {}).get("engines", {})
+    for name, r in report["engines"].items():
+        lines.append(f"{name:<28} {_fmt(r['probes_per_sec']):>10} {_fmt(r['p50_ms']):>9} {_fmt(r['p99_ms']):>9} "
+                     f"{r['peak_rss'] / 1048576:>8.1f}MB {_fmt(r['accuracy']):>9} {_fmt(r['banner_rate']):>7}")
+        old = prev.get(name)
+        if old and old.get("probes_per_sec") and r["probes_per_sec"]:
+            change = (r["probes_per_sec"] / old["probes_per_sec"] - 1) * 100
+            p99 = ""
+            if old.get("p99_ms") and r["p99_ms"]:
+                p99 = f", p99 {(r['p99_ms'] / old['p99_ms'] - 1) * 100:+.1f}%"
+            lines.append(f"{'':<28} önceki çalıştırmaya göre: deneme/s {change:+.1f}%{p99}")
+    return "\n".join(lines)
+
+
+def load_report(path: str) -> Optional[dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_report(report: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+# ----------------------------
+# CLI
+# ----------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Scanner engine benchmark against local stand-in servers.")
+    parser.add_argument("--open", type=int, default=DEFAULT_FLEET["open"], help="open listeners (immediate banner)")
+    parser.add_argument("--closed", type=int, default=DEFAULT_FLEET["closed"], help="closed ports (RST)")
+    parser.add_argument("--slow", type=int, default=DEFAULT_FLEET["slow"], help="listeners that accept after --delay")
+    parser.add_argument("--banner", type=int, default=DEFAULT_FLEET["banner"],
+                        help="listeners that send the banner after --delay")
+    parser.add_argument("--delay", type=float, default=0.2, help="slow accept / banner delay in seconds")
+    parser.add_argument("--timeout", type=float, default=1.0, help="connect timeout passed to the engines")
+    parser.add_argument("--workers", type=int, default=50, help="parallel probes")
+    parser.add_argument("--rounds", type=int, default=1, help="probe every target this many times")
+    parser.add_argument("--engines", default="", help="comma separated name filter (default: all)")
+    parser.add_argument("--json", default="", help="write the report to this JSON file")
+    parser.add_argument("--compare", default="", help="previous JSON report to compare against")
+    args = parser.parse_args()
+
+    previous = load_report(args.compare) if args.compare else None
+    if args.compare and previous is None:
+        print(f"Karşılaştırma dosyası okunamadı: {args.compare}")
+    only = [e.strip() for e in args.engines.split(",") if e.strip()]
+    counts = {"open": args.open, "closed": args.closed, "slow": args.slow, "banner": args.banner}
+    report = run_bench(counts, args.delay, args.timeout, args.workers, args.rounds, only=only)
+    print(format_report(report, previous))
+    if args.json:
+        save_report(report, args.json)
+        print(f"Kaydedildi: {args.json}")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nÇıkış (Ctrl+C)")
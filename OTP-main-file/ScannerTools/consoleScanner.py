@@ -1,309 +1,2000 @@
-#!/usr/bin/env python3
-"""
-scanner_console.py
-Geliştirilmiş komut kabuğu (REPL) tarayıcı — IP aralığı ve hedef dosyası desteği ile.
-"""
-def show_banner():
-    GREEN = "\033[32m"
-    RED   = "\033[31m"
-    RESET = "\033[0m"
-
-    logo = f"""
-{GREEN}54{RESET}society       _____ ____   ____  _____
-{GREEN}54{RESET}society      |  ___|  _ \\ / ___|| ____|
-{GREEN}54{RESET}society      | |_  | | | | |  _ |  _|
-{GREEN}54{RESET}society      |  _| | |_| | |_| || |___
-{GREEN}54{RESET}society      |_|   |____/ \\____||_____|
-"""
-    print(logo)
-import cmd,socket,concurrent.futures,csv,time,re,ipaddress
-
-
-def parse_ports(s):
-    s = (s or "").replace(" ", "")
-    parts = s.split(",")
-    ports = set()
-    for p in parts:
-        if not p:
-            continue
-        if "-" in p:
-            try:
-                a, b = p.split("-", 1)
-                a = int(a); b = int(b)
-                if a > b:
-                    a, b = b, a
-                a = max(1, a); b = min(65535, b)
-                ports.update(range(a, b+1))
-            except ValueError:
-                continue
-        else:
-            try:
-                val = int(p)
-                if 1 <= val <= 65535:
-                    ports.add(val)
-            except ValueError:
-                continue
-    return sorted(ports)
-
-def expand_targets(spec):
-    spec = (spec or "").strip()
-    if not spec:
-        return []
-    # CIDR
-    try:
-        if '/' in spec:
-            net = ipaddress.ip_network(spec, strict=False)
-            return [str(ip) for ip in net.hosts()]
-    except Exception:
-        pass
-    # range a-b
-    if '-' in spec and not any(c.isalpha() for c in spec):
-        try:
-            a,b = spec.split('-',1)
-            start = ipaddress.IPv4Address(a.strip())
-            end = ipaddress.IPv4Address(b.strip())
-            if int(start) > int(end):
-                start, end = end, start
-            alist = []
-            cur = int(start)
-            while cur <= int(end):
-                alist.append(str(ipaddress.IPv4Address(cur)))
-                cur += 1
-            return alist
-        except Exception:
-            return []
-    # single host (domain or IP)
-    return [spec]
-
-def check_port(host_ip, port, timeout=1.0):
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        res = sock.connect_ex((host_ip, port))
-        if res == 0:
-            try:
-                sock.settimeout(0.6)
-                sock.sendall(b"\r\n")
-                banner = sock.recv(1024).decode(errors="ignore").strip()
-            except Exception:
-                banner = ""
-            sock.close()
-            return True, banner
-        sock.close()
-        return False, ""
-    except Exception as e:
-        return False, str(e)
-
-class ScannerShell(cmd.Cmd):
-    intro = "Geliştirilmiş scanner kabuğuna hoşgeldin. Yardım için 'help' yaz.\n"
-    prompt = "scanner> "
-
-    def __init__(self):
-        super().__init__()
-        self.target = None
-        self.target_ip = None
-        self.targets = []       # çoklu hedef desteği
-        self.ports = [80, 443]
-        self.timeout = 1.0
-        self.max_workers = 50
-        self.results = {}       # {(host,port): (open,banner)}
-        self.last_run = None
-
-    def do_set(self, arg):
-        "set target <domain_or_ip>  -- tek hedef ayarlar"
-        parts = arg.split()
-        if len(parts) >= 2 and parts[0].lower() == "target":
-            target = " ".join(parts[1:]).strip()
-            if not target:
-                print("Hedef boş bırakılamaz.")
-                return
-            try:
-                ip = socket.gethostbyname(target)
-                self.target = target
-                self.target_ip = ip
-                self.targets = [target]
-                print(f"Hedef ayarlandı: {self.target} ({self.target_ip})")
-            except Exception as e:
-                print(f"DNS çözümlenemedi: {e}")
-        else:
-            print("Kullanım: set target example.com")
-
-    def do_setrange(self, arg):
-        "setrange <CIDR_or_range>  -- IP aralığı veya CIDR ile hedef listesi ayarlar"
-        spec = arg.strip()
-        if not spec:
-            print("Kullanım: setrange 192.168.1.0/28 veya setrange 192.168.1.1-192.168.1.50")
-            return
-        targets = expand_targets(spec)
-        if not targets:
-            print("Geçersiz aralık.")
-            return
-        self.targets = targets
-        print(f"{len(self.targets)} hedef ayarlandı (örnek: {self.targets[:3]}...)")
-
-    def do_setfile(self, arg):
-        "setfile <path>  -- dosyadan hedefleri oku (her satırda bir hedef)"
-        path = arg.strip()
-        if not path:
-            print("Kullanım: setfile hedefler.txt")
-            return
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                lines = [l.strip() for l in f if l.strip()]
-        except Exception as e:
-            print(f"Dosya açılamadı: {e}")
-            return
-        self.targets = lines
-        print(f"{len(self.targets)} hedef dosyadan yüklendi.")
-
-    def do_ports(self, arg):
-        "ports <liste|aralık>  -- portları ayarlar veya mevcut listeyi gösterir"
-        if not arg.strip():
-            print("Mevcut port listesi:", self.ports)
-            return
-        parsed = parse_ports(arg)
-        if not parsed:
-            print("Geçerli bir port listesi girin.")
-            return
-        self.ports = parsed
-        print(f"Port listesi ayarlandı. {len(self.ports)} port.")
-
-    def do_timeout(self, arg):
-        "timeout <saniye>  -- bağlantı zaman aşımını ayarlar (float)"
-        try:
-            t = float(arg.strip())
-            if t <= 0:
-                raise ValueError()
-            self.timeout = t
-            print(f"Timeout ayarlandı: {self.timeout}s")
-        except Exception:
-            print("Geçerli bir sayı girin. Örnek: timeout 1.5")
-
-    def do_workers(self, arg):
-        "workers <adet>  -- paralel işçi sayısını ayarlar"
-        try:
-            n = int(arg.strip())
-            if n < 1:
-                raise ValueError()
-            self.max_workers = min(200, n)
-            print(f"Worker sayısı: {self.max_workers}")
-        except Exception:
-            print("Geçerli bir tam sayı girin. Örnek: workers 40")
-
-    def _scan_host(self, host):
-        try:
-            ip = socket.gethostbyname(host)
-        except Exception as e:
-            print(f"{host} çözümlenemedi: {e}")
-            return
-        for p in self.ports:
-            is_open, banner = check_port(ip, p, self.timeout)
-            self.results[(host,p)] = (is_open, banner)
-            if is_open:
-                print(f"[OPEN] {host}:{p}  {('Banner: ' + banner) if banner else ''}")
-
-    def do_scan(self, arg):
-        "scan  -- ayarlı hedef(ler) ve portları tarar (tek veya çoklu hedef)"
-        if not self.targets:
-            print("Önce hedef ayarlayın: set target <host> veya setrange <CIDR/range> veya setfile <path>")
-            return
-        if not self.ports:
-            print("Port listesi boş. Önce ports komutu ile portları ayarlayın.")
-            return
-        print(f"Toplam hedef: {len(self.targets)}  Port sayısı: {len(self.ports)}")
-        self.results.clear()
-        start = time.time()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.targets))) as exe:
-            futures = [exe.submit(self._scan_host, h) for h in self.targets]
-            try:
-                for fut in concurrent.futures.as_completed(futures):
-                    pass
-            except KeyboardInterrupt:
-                print("\n[!] Tarama kullanıcı tarafından durduruldu (Ctrl+C).")
-        elapsed = time.time() - start
-        self.last_run = time.ctime()
-        print(f"\nTarama tamamlandı. Süre: {elapsed:.2f}s  ({self.last_run})")
-
-    def do_show(self, arg):
-        "show [all|open]  -- son tarama sonuçlarını gösterir (default all)"
-        mode = arg.strip().lower() or "all"
-        if not self.results:
-            print("Henüz sonuç yok.")
-            return
-        print(f"Sonuçlar (hedef sayısı: {len(self.targets)}):")
-        for (host,port) in sorted(self.results):
-            is_open, banner = self.results[(host,port)]
-            if mode == "open" and not is_open:
-                continue
-            status = "OPEN" if is_open else "closed"
-            line = f"  {host}:{port} - {status}"
-            if is_open and banner:
-                line += f"  Banner: {banner}"
-            print(line)
-
-    def do_check(self, arg):
-        "check <host> <port>  -- belirli host/port için kayıtlı bilgileri gösterir"
-        parts = arg.split()
-        if len(parts) != 2:
-            print("Kullanım: check 192.168.1.10 22")
-            return
-        host, p = parts[0], parts[1]
-        try:
-            p = int(p)
-        except Exception:
-            print("Port tam sayı olmalı")
-            return
-        key = (host, p)
-        if key not in self.results:
-            print("Bu host/port için sonuç yok. Önce scan çalıştırın.")
-            return
-        is_open, banner = self.results[key]
-        if not is_open:
-            print(f"{host}:{p} kapalı.")
-            return
-        print(f"{host}:{p} açık. Banner: {banner}")
-
-    def do_save(self, arg):
-        "save <dosya.csv>  -- sonuçları CSV'ye kaydeder"
-        filename = arg.strip() or "scan_results.csv"
-        if not self.results:
-            print("Kaydedilecek sonuç yok.")
-            return
-        try:
-            with open(filename, "w", newline="", encoding="utf-8") as f:
-                w = csv.writer(f)
-                w.writerow(["target", "ip", "port", "open", "banner"])
-                for (host,port) in sorted(self.results):
-                    is_open, banner = self.results[(host,port)]
-                    try:
-                        ip = socket.gethostbyname(host)
-                    except Exception:
-                        ip = ""
-                    w.writerow([host, ip, port, is_open, banner])
-            print(f"Kaydedildi: {filename}")
-        except Exception as e:
-            print(f"Dosya yazma hatası: {e}")
-
-    def do_clear(self, arg):
-        "clear  -- sadece önceki sonuçları temizler (targets ve ports korunur)"
-        self.results.clear()
-        print("Sonuçlar temizlendi. (targets ve ports korunuyor)")
-
-    def do_exit(self, arg):
-        "exit  -- çıkış"
-        print("Çıkılıyor...")
-        return True
-
-    def do_quit(self, arg):
-        "quit  -- alias for exit"
-        return self.do_exit(arg)
-
-    def emptyline(self):
-        pass
-
-    def do_EOF(self, arg):
-        print(" (EOF) Çıkılıyor...")
-        return True
-
-if __name__ == '__main__':
-    ScannerShell().cmdloop()
+#!/usr/bin/env python3
+"""
+scanner_console.py
+Geliştirilmiş komut kabuğu (REPL) tarayıcı — IP aralığı ve hedef dosyası desteği ile.
+"""
+def show_banner():
+    GREEN = "\033[32m"
+    RED   = "\033[31m"
+    RESET = "\033[0m"
+
+    logo = f"""
+{GREEN}54{RESET}society       _____ ____   ____  _____
+{GREEN}54{RESET}society      |  ___|  _ \\ / ___|| ____|
+{GREEN}54{RESET}society      | |_  | | | | |  _ |  _|
+{GREEN}54{RESET}society      |  _| | |_| | |_| || |___
+{GREEN}54{RESET}society      |_|   |____/ \\____||_____|
+"""
+    print(logo)
+import cmd,socket,concurrent.futures,csv,time,re,ipaddress,threading,collections,errno,os,sys,selectors,struct
+
+DEFAULT_PORTS = [80, 443]
+METRICS_PORT = 9464
+DISCOVERY_PORTS = [80, 443, 22, 445, 3389, 8080]
+HISTORY_DB = os.path.join(os.path.expanduser("~"), ".otp_scan_history.db")
+
+# tek bir port denemesinin sonucu; scan_hosts bunları on_result ile yayınlar
+# status: "open", "closed", "timeout" veya "error"
+ScanResult = collections.namedtuple("ScanResult", "host ip port is_open banner status", defaults=(None,))
+
+_REFUSED = {errno.ECONNREFUSED, getattr(errno, "WSAECONNREFUSED", errno.ECONNREFUSED)}
+_TIMEDOUT = {errno.ETIMEDOUT, errno.EAGAIN, errno.EWOULDBLOCK, errno.EINPROGRESS,
+             getattr(errno, "WSAETIMEDOUT", errno.ETIMEDOUT), getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)}
+
+
+def parse_ports(s):
+    s = (s or "").replace(" ", "")
+    parts = s.split(",")
+    ports = set()
+    for p in parts:
+        if not p:
+            continue
+        if "-" in p:
+            try:
+                a, b = p.split("-", 1)
+                a = int(a); b = int(b)
+                if a > b:
+                    a, b = b, a
+                a = max(1, a); b = min(65535, b)
+                ports.update(range(a, b+1))
+            except ValueError:
+                continue
+        else:
+            try:
+                val = int(p)
+                if 1 <= val <= 65535:
+                    ports.add(val)
+            except ValueError:
+                continue
+    return sorted(ports)
+
+def expand_targets(spec):
+    spec = (spec or "").strip()
+    if not spec:
+        return []
+    # CIDR
+    try:
+        if '/' in spec:
+            net = ipaddress.ip_network(spec, strict=False)
+            return [str(ip) for ip in net.hosts()]
+    except Exception:
+        pass
+    # range a-b
+    if '-' in spec and not any(c.isalpha() for c in spec):
+        try:
+            a,b = spec.split('-',1)
+            start = ipaddress.IPv4Address(a.strip())
+            end = ipaddress.IPv4Address(b.strip())
+            if int(start) > int(end):
+                start, end = end, start
+            alist = []
+            cur = int(start)
+            while cur <= int(end):
+                alist.append(str(ipaddress.IPv4Address(cur)))
+                cur += 1
+            return alist
+        except Exception:
+            return []
+    # single host (domain or IP)
+    return [spec]
+
+# tanımlayıcı / tampon sıkıntısı: sonuç değil, geri çekilme (backoff) sinyali
+_FD_PRESSURE = {errno.EMFILE, errno.ENFILE, errno.ENOBUFS, errno.ENOMEM}
+
+def open_fd_count():
+    """Sürecin açık tanımlayıcı sayısı (Linux /proc/self/fd, macOS /dev/fd); bilinmiyorsa 0."""
+    for path in ("/proc/self/fd", "/dev/fd"):
+        try:
+            return len(os.listdir(path))
+        except OSError:
+            continue
+    return 0
+
+def _nofile_limits():
+    try:
+        import resource
+    except ImportError:
+        return 512, 512  # Windows: C çalışma zamanının varsayılan sınırı
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    cap = 1 << 20
+    return (cap if soft == resource.RLIM_INFINITY else soft), (cap if hard == resource.RLIM_INFINITY else hard)
+
+class FdBudget:
+    """
+    Dosya tanımlayıcı bütçesi. Kapasite = RLIMIT_NOFILE yumuşak sınırı - şu an açık olanlar - reserve
+    (loglar, CSV/SQLite, metrics soketi için). acquire()/release() uçuştaki denemeleri bu sınırda
+    tutar. EMFILE/ENFILE/ENOBUFS görülünce backoff(): sınır uçuştaki sayının altına çekilir ve
+    kısa bir süre beklenir; başarılı denemelerle sınır kademeli olarak kapasiteye geri çıkar.
+    """
+    RESERVE = 64
+    RECOVER_EVERY = 16   # bu kadar başarılı denemede sınır ~%25 artar
+
+    def __init__(self, reserve=RESERVE):
+        self.reserve = reserve
+        self._cond = threading.Condition()
+        self.in_flight = 0
+        self.peak = 0
+        self.backoffs = 0
+        self._ok = 0
+        self.refresh()
+
+    def refresh(self):
+        """Sınırları ve açık tanımlayıcı sayısını yeniden okur (boştayken çağrılmalı)."""
+        self.soft, self.hard = _nofile_limits()
+        self.base = open_fd_count()
+        with self._cond:
+            self.capacity = max(1, self.soft - self.base - self.reserve)
+            self.limit = self.capacity
+            self._cond.notify_all()
+
+    def raise_limit(self, want=None):
+        """
+        Yumuşak sınırı want'a (varsayılan: sert sınır) yükseltir. -> yeni yumuşak sınır.
+        Çekirdek reddederse OSError (mesajda sert sınır) atar; sınırlar değişmez.
+        """
+        import resource
+        target = min(want or self.hard, self.hard)
+        if target > self.soft:
+            hard = resource.getrlimit(resource.RLIMIT_NOFILE)[1]
+            try:
+                resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+            except (ValueError, OSError) as e:
+                # macOS: sert sınır sınırsız görünse de OPEN_MAX üstü reddedilir
+                fallback = min(target, 10240)
+                try:
+                    if fallback <= self.soft:
+                        raise
+                    resource.setrlimit(resource.RLIMIT_NOFILE, (fallback, hard))
+                except (ValueError, OSError):
+                    raise OSError(f"{target} reddedildi (sert sınır {self.hard}): {e}") from e
+        self.refresh()
+        return self.soft
+
+    def acquire(self, n=1, stop=None):
+        """n tanımlayıcılık yer açılana kadar bekler; stop set edilirse False döner."""
+        with self._cond:
+            while self.in_flight + n > max(self.limit, n):
+                if stop is not None and stop.is_set():
+                    return False
+                self._cond.wait(0.1)
+            self.in_flight += n
+            self.peak = max(self.peak, self.in_flight)
+            return True
+
+    def release(self, n=1):
+        with self._cond:
+            self.in_flight -= n
+            self._ok += 1
+            if self.limit < self.capacity and self._ok >= self.RECOVER_EVERY:
+                self.limit = min(self.capacity, self.limit + max(1, self.limit // 4))
+                self._ok = 0
+            self._cond.notify(n)
+
+    def backoff(self, attempt=0):
+        with self._cond:
+            self.backoffs += 1
+            self._ok = 0
+            self.limit = max(1, min(self.limit, int(self.in_flight * 0.75)))
+        time.sleep(min(0.5, 0.01 * (2 ** attempt)))
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+    def snapshot(self):
+        return {"soft": self.soft, "hard": self.hard, "base": self.base, "reserve": self.reserve,
+                "capacity": self.capacity, "limit": self.limit, "in_flight": self.in_flight,
+                "peak": self.peak, "backoffs": self.backoffs, "open_now": open_fd_count()}
+
+_IP_BIND_ADDRESS_NO_PORT = getattr(socket, "IP_BIND_ADDRESS_NO_PORT", 24)
+_LINGER0 = struct.pack("HH" if sys.platform == "win32" else "ii", 1, 0)  # struct linger
+
+class SourcePool:
+    """
+    Yüksek hızlı taramalarda TIME_WAIT / geçici (ephemeral) port tükenmesine karşı soket ayarları.
+    linger0: deneme sonunda SO_LINGER 0 ile kapat (RST; TIME_WAIT kaydı bırakmaz). Hedef bunu
+    bağlantı hatası olarak görür ve loglar; bu yüzden kapalıdır, 'net linger on' ile açılır.
+    addrs: yerel kaynak adresleri; denemeler bunlara sırayla bağlanır, her adres kendi
+    ephemeral port alanını getirir (Linux'ta IP_BIND_ADDRESS_NO_PORT ile port connect'te seçilir).
+    EADDRNOTAVAIL (port kalmadı) hata sayılmaz: kısa bekleyip yeniden denenir, exhausted sayılır.
+    """
+    RETRIES = 5
+
+    def __init__(self, addrs=None, linger0=False):
+        self.addrs = list(addrs or [])
+        self.linger0 = linger0
+        self.exhausted = 0      # EADDRNOTAVAIL sonrası yeniden denemeler
+        self._next = 0
+
+    def socket(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if self.addrs:
+            addr = self.addrs[self._next % len(self.addrs)]
+            self._next += 1     # yarış zararsız: yalnızca dağılımı etkiler
+            try:
+                if sys.platform.startswith("linux"):
+                    sock.setsockopt(socket.IPPROTO_IP, _IP_BIND_ADDRESS_NO_PORT, 1)
+                sock.bind((addr, 0))
+            except BaseException:
+                sock.close()
+                raise
+        return sock
+
+    def close(self, sock):
+        if self.linger0:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER0)
+            except OSError:
+                pass
+        sock.close()
+
+def ephemeral_usage():
+    """
+    Linux: geçici port aralığı ve bu aralıktaki yerel TCP portlarının durum dağılımı
+    (/proc/net/tcp{,6}). -> {"range", "size", "in_use", "time_wait", "by_source"} veya None.
+    """
+    try:
+        with open("/proc/sys/net/ipv4/ip_local_port_range") as f:
+            lo, hi = (int(x) for x in f.read().split())
+    except (OSError, ValueError):
+        return None
+    in_use = time_wait = 0
+    by_source = collections.Counter()
+    for path in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(path) as f:
+                next(f, None)
+                for line in f:
+                    fields = line.split(None, 4)
+                    addr, _, lport = fields[1].rpartition(":")
+                    if not lo <= int(lport, 16) <= hi:
+                        continue
+                    in_use += 1
+                    if fields[3] == "06":
+                        time_wait += 1
+                    by_source[addr] += 1
+        except OSError:
+            continue
+    return {"range": (lo, hi), "size": hi - lo + 1, "in_use": in_use, "time_wait": time_wait,
+            "by_source": dict(by_source)}
+
+def _hex_addr(addr):
+    """/proc/net/tcp adresini (ağ sırası, hex) okunur hale getirir."""
+    try:
+        raw = bytes.fromhex(addr)
+        if len(raw) == 4:
+            return socket.inet_ntop(socket.AF_INET, raw[::-1])
+        return socket.inet_ntop(socket.AF_INET6, b"".join(raw[i:i + 4][::-1] for i in range(0, 16, 4)))
+    except (ValueError, OSError):
+        return addr
+
+def probe_port(host_ip, port, timeout=1.0, source=None):
+    """
+    Tek TCP denemesi: (status, banner) döndürür. status "open", "closed" (RST), "timeout"
+    veya "error"; beklenmeyen bir istisnada banner hata metnidir. source (SourcePool) verilirse
+    soket ondan alınır ve onunla kapatılır. Tanımlayıcı/tampon tükenmesinde (EMFILE, ENOBUFS...)
+    "busy" döner: bu bir sonuç değildir, çağıran beklemeli ve yeniden denemelidir (probe_retry).
+    """
+    sock = None
+    close = source.close if source is not None else socket.socket.close
+    try:
+        for attempt in range(SourcePool.RETRIES if source is not None else 1):
+            sock = source.socket() if source is not None else socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(timeout)
+            res = sock.connect_ex((host_ip, port))
+            if res != errno.EADDRNOTAVAIL or source is None:
+                break
+            # ephemeral portlar tükendi: TIME_WAIT kayıtlarının düşmesini bekle
+            sock.close()
+            sock = None
+            source.exhausted += 1
+            time.sleep(0.01 * (attempt + 1))
+        if res == 0:
+            try:
+                sock.settimeout(0.6)
+                sock.sendall(b"\r\n")
+                banner = sock.recv(1024).decode(errors="ignore").strip()
+            except Exception:
+                banner = ""
+            return "open", banner
+        if res in _REFUSED:
+            return "closed", ""
+        if res in _FD_PRESSURE:
+            return "busy", os.strerror(res)
+        if res in _TIMEDOUT:
+            return "timeout", ""
+        return "error", ""
+    except socket.timeout:
+        return "timeout", ""
+    except OSError as e:
+        if e.errno in _FD_PRESSURE:
+            return "busy", str(e)
+        return "error", str(e)
+    except Exception as e:
+        return "error", str(e)
+    finally:
+        # connect_ex / bind / çözümleme hatalarında da soket kapanır
+        if sock is not None:
+            close(sock)
+
+def probe_retry(host_ip, port, timeout=1.0, source=None, budget=None, stop=None, attempts=8):
+    """
+    probe_port'u FdBudget içinde çalıştırır; "busy" dönerse geri çekilip yeniden dener.
+    Denemeler tükenirse "error" olur.
+    """
+    banner = ""
+    for attempt in range(attempts):
+        if budget is not None and not budget.acquire(stop=stop):
+            return "error", "durduruldu"
+        try:
+            status, banner = probe_port(host_ip, port, timeout, source)
+        finally:
+            if budget is not None:
+                budget.release()
+        if status != "busy":
+            return status, banner
+        if budget is not None:
+            budget.backoff(attempt)
+        else:
+            time.sleep(min(0.5, 0.01 * (2 ** attempt)))
+    return "error", banner
+
+def check_port(host_ip, port, timeout=1.0):
+    status, banner = probe_retry(host_ip, port, timeout)
+    return status == "open", banner
+
+def scan_host(host, ports, timeout=1.0, on_result=None, stop=None, stats=None, source=None, budget=None):
+    """
+    Tek hostu tarar: DNS çözümler, portları sırayla dener, her port için on_result(ScanResult)
+    çağırır. DNS hatası socket.gaierror olarak yükselir. stop (threading.Event) set edilirse
+    kalan portlar atlanır. stats (ScanStats) verilirse her deneme sayılır. source: SourcePool,
+    budget: FdBudget.
+    """
+    ip = socket.gethostbyname(host)
+    for p in ports:
+        if stop is not None and stop.is_set():
+            return
+        if stats is not None:
+            stats.issued()
+        status, banner = probe_retry(ip, p, timeout, source, budget, stop)
+        if stats is not None:
+            stats.completed(status)
+        if on_result is not None:
+            on_result(ScanResult(host, ip, p, status == "open", banner, status))
+
+def scan_hosts(targets, ports, timeout=1.0, workers=50, on_result=None, on_error=None, stop=None, stats=None,
+               source=None, budget=None):
+    """
+    Tarama çekirdeği: hedefleri bir thread havuzunda paralel tarar (host başına bir iş).
+    Sonuçlar on_result(ScanResult) ile, çözümlenemeyen hostlar on_error(host, exc) ile bildirilir;
+    geri çağrılar işçi thread'lerinden çağrılır. ScannerShell ve terminalin süreç içi
+    tarama modu (terminalv9 'scan' komutu) bunu kullanır. stats (ScanStats) canlı sayaçları tutar.
+    """
+    scan_plan([(h, ports) for h in targets], timeout, workers, on_result, on_error, stop, stats, source, budget)
+
+def scan_plan(plan, timeout=1.0, workers=50, on_result=None, on_error=None, stop=None, stats=None, source=None,
+              budget=None):
+    """
+    scan_hosts'un host başına farklı port listesi alan hali: plan = [(host, ports), ...].
+    budget (FdBudget) verilirse işçi sayısı da onun kapasitesiyle sınırlanır.
+    """
+    stop = stop or threading.Event()
+    plan = [(h, ports) for h, ports in plan if ports]
+    if stats is not None:
+        stats.begin(sum(len(ports) for _, ports in plan))
+    if not plan:
+        if stats is not None:
+            stats.end()
+        return
+
+    def one(host, ports):
+        try:
+            scan_host(host, ports, timeout, on_result, stop, stats, source, budget)
+        except Exception as e:
+            if stats is not None:
+                stats.failed(len(ports))  # çözümlenemeyen hostun portları hata sayılır
+            if on_error is not None:
+                on_error(host, e)
+
+    if budget is not None:
+        workers = min(workers, budget.capacity)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(workers, len(plan)))) as exe:
+        futures = [exe.submit(one, h, ports) for h, ports in plan]
+        try:
+            for fut in concurrent.futures.as_completed(futures):
+                pass
+        except KeyboardInterrupt:
+            # bekleyen işleri hızlıca bitir, sonra çağırana ilet
+            stop.set()
+            raise
+        finally:
+            if stats is not None:
+                stats.end()
+
+def load_results_csv(path):
+    """'save' ile yazılmış CSV'yi {(host, port): (open, banner)} sözlüğüne okur (baseline için)."""
+    results = {}
+    with open(path, "r", newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            try:
+                key = (row["target"], int(row["port"]))
+            except (KeyError, ValueError):
+                continue
+            results[key] = (row.get("open", "").strip().lower() in ("true", "1", "yes"), row.get("banner") or "")
+    return results
+
+def diff_results(baseline, current):
+    """
+    İki sonuç kümesini karşılaştırır; yalnızca current'ta denenmiş (host, port) çiftlerine bakılır.
+    -> {"opened": [...], "closed": [...], "banner": [(key, eski, yeni), ...]}
+    """
+    opened, closed, banner = [], [], []
+    for key, (is_open, new_banner) in current.items():
+        was_open, old_banner = baseline.get(key, (False, ""))
+        if is_open and not was_open:
+            opened.append(key)
+        elif was_open and not is_open:
+            closed.append(key)
+        elif is_open and was_open and new_banner != old_banner:
+            banner.append((key, old_banner, new_banner))
+    return {"opened": sorted(opened), "closed": sorted(closed), "banner": sorted(banner)}
+
+def _icmp_socket():
+    """ICMP echo soketi: root/CAP_NET_RAW ise raw, değilse Linux ping soketi; ikisi de yoksa None."""
+    for kind in (socket.SOCK_RAW, socket.SOCK_DGRAM):
+        try:
+            s = socket.socket(socket.AF_INET, kind, socket.IPPROTO_ICMP)
+        except (OSError, AttributeError):
+            continue
+        s.setblocking(False)
+        return s
+    return None
+
+def _icmp_socket_available():
+    s = _icmp_socket()
+    if s is None:
+        return False
+    s.close()
+    return True
+
+def _icmp_echo(ident, seq):
+    header = struct.pack("!BBHHH", 8, 0, 0, ident, seq)
+    payload = b"otp-discovery"
+    data = header + payload
+    data += b"\0" * (len(data) % 2)
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return struct.pack("!BBHHH", 8, 0, ~total & 0xFFFF, ident, seq) + payload
+
+def discover_hosts(hosts, ports=None, timeout=0.5, concurrency=512, icmp=True, on_alive=None, on_error=None, stop=None,
+                   budget=None, linger0=False):
+    """
+    Canlı host keşfi: her hosta birkaç yaygın TCP portu (DISCOVERY_PORTS) aynı anda, engellemesiz
+    soketlerle denenir; bağlantı kurulursa veya RST (ECONNREFUSED) dönerse host canlıdır, ilk yanıtta
+    hostun kalan soketleri kapatılır. icmp=True ve yetki varsa ICMP echo da gönderilir. Tek thread,
+    bir selector; uçuştaki soket sayısı concurrency ile sınırlı. Yanıt vermeyen hostlar timeout
+    sonunda elenir. Çözümlenemeyen isimler on_error(host, exc) ile bildirilir. budget (FdBudget)
+    concurrency'yi sınırlar; EMFILE/ENOBUFS'ta sınır uçuştaki soket sayısına düşürülür, host kuyruğa döner.
+    linger0: soketleri SO_LINGER 0 ile kapat (SourcePool.linger0 gibi, varsayılan kapalı).
+    -> canlı hostlar, girdi sırasıyla.
+    """
+    ports = list(ports or DISCOVERY_PORTS)
+    stop = stop or threading.Event()
+    addrs = {}
+    for h in hosts:
+        try:
+            addrs[h] = str(ipaddress.IPv4Address(h))
+        except ValueError:
+            try:
+                addrs[h] = socket.gethostbyname(h)
+            except OSError as e:
+                if on_error is not None:
+                    on_error(h, e)
+    by_ip = collections.defaultdict(list)
+    for h, ip in addrs.items():
+        by_ip[ip].append(h)
+    alive = set()
+    sel = selectors.DefaultSelector()
+    pinger = _icmp_socket() if icmp else None
+    ident = os.getpid() & 0xFFFF
+    if pinger is not None:
+        sel.register(pinger, selectors.EVENT_READ, None)
+    open_socks = collections.defaultdict(list)  # ip -> [soket]
+    inflight = [0]
+    cap = [max(len(ports), min(concurrency, budget.limit) if budget is not None else concurrency)]
+    deadlines = collections.deque()             # (deadline, ip), başlatma sırasıyla
+    pending = collections.deque(by_ip)
+
+    def mark(ip):
+        if ip in alive:
+            return
+        alive.add(ip)
+        close_all(ip)
+        if on_alive is not None:
+            for h in by_ip[ip]:
+                on_alive(h)
+
+    def close_all(ip):
+        for s in open_socks.pop(ip, ()):
+            sel.unregister(s)
+            s.close()
+            inflight[0] -= 1
+
+    def drop(ip, s):
+        socks = open_socks.get(ip)
+        if socks and s in socks:
+            socks.remove(s)
+            sel.unregister(s)
+            s.close()
+            inflight[0] -= 1
+
+    def launch(ip):
+        for port in ports:
+            try:
+                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            except OSError as e:
+                if e.errno not in _FD_PRESSURE:
+                    raise
+                # tanımlayıcı kalmadı: bu hostu geri koy, uçuştakiler bitene kadar sınırı düşür
+                close_all(ip)
+                pending.appendleft(ip)
+                cap[0] = max(len(ports), inflight[0])
+                if budget is not None:
+                    budget.backoffs += 1
+                if not inflight[0]:
+                    time.sleep(0.05)  # başka bir şey tanımlayıcıları tutuyor
+                return False
+            s.setblocking(False)
+            if linger0:
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _LINGER0)  # kapanışta TIME_WAIT bırakma
+            res = s.connect_ex((ip, port))
+            if res == 0 or res in _REFUSED:
+                s.close()
+                mark(ip)
+                return True
+            if res not in _TIMEDOUT:  # ağ/host ulaşılamaz vb.
+                s.close()
+                continue
+            sel.register(s, selectors.EVENT_WRITE, ip)
+            open_socks[ip].append(s)
+            inflight[0] += 1
+        if pinger is not None:
+            try:
+                pinger.sendto(_icmp_echo(ident, len(deadlines) & 0xFFFF), (ip, 0))
+            except OSError:
+                pass
+        deadlines.append((time.monotonic() + timeout, ip))
+        return True
+
+    try:
+        while (pending or deadlines) and not stop.is_set():
+            while pending and inflight[0] + len(ports) <= cap[0]:
+                if not launch(pending.popleft()):
+                    break
+            # sonucu belli olan hostları beklemeden düş (canlı, ya da ICMP yokken soketi kalmamış)
+            while deadlines and (deadlines[0][1] in alive or (pinger is None and not open_socks.get(deadlines[0][1]))):
+                close_all(deadlines.popleft()[1])
+            if not deadlines:
+                continue
+            wait = max(0.0, deadlines[0][0] - time.monotonic())
+            for key, _ in sel.select(min(wait, 0.05)):
+                if key.data is None:  # ICMP yanıtı
+                    while True:
+                        try:
+                            data, (src, _) = pinger.recvfrom(2048)
+                        except OSError:
+                            break
+                        if pinger.type == socket.SOCK_RAW:
+                            data = data[(data[0] & 0x0F) * 4:]  # IP başlığını atla
+                        if data[:1] == b"\0" and src in by_ip:  # echo reply
+                            mark(src)
+                    continue
+                s, ip = key.fileobj, key.data
+                if s.fileno() < 0:  # aynı turda hostun başka bir soketi yanıt verdi
+                    continue
+                err = s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                if err == 0 or err in _REFUSED:
+                    mark(ip)
+                else:
+                    drop(ip, s)
+            now = time.monotonic()
+            while deadlines and deadlines[0][0] <= now:
+                close_all(deadlines.popleft()[1])
+    finally:
+        for socks in open_socks.values():
+            for s in socks:
+                s.close()
+        if pinger is not None:
+            pinger.close()
+        sel.close()
+    return [h for h in hosts if addrs.get(h) in alive]
+
+_services = {}
+
+def service_name(port):
+    """Port için servis adı (getservbyport, önbellekli); bilinmiyorsa boş."""
+    name = _services.get(port)
+    if name is None:
+        try:
+            name = socket.getservbyport(port, "tcp")
+        except (OSError, OverflowError):
+            name = ""
+        _services[port] = name
+    return name
+
+class ScanHistory:
+    """
+    Taramaların SQLite geçmişi (HISTORY_DB). Sonuçlar işçi thread'lerinden add() ile bir kuyruğa
+    girer; tek bir yazıcı thread onları toplu (batch) ve tek transaction içinde yazar. Sorgular
+    ayrı bir bağlantıdan (WAL modu) okunur, yazıcıyı beklemez. Varsayılan olarak açık servisler
+    saklanır; record_all=True ile her deneme (kapalı / zaman aşımı dahil).
+    """
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS scans (id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT, started REAL,"
+        " finished REAL, targets INTEGER, ports INTEGER, probes INTEGER, open INTEGER)",
+        "CREATE TABLE IF NOT EXISTS results (scan_id INTEGER, ts REAL, host TEXT, ip TEXT, port INTEGER,"
+        " open INTEGER, status TEXT, service TEXT, banner TEXT)",
+        "CREATE INDEX IF NOT EXISTS idx_results_host ON results(host, ts)",
+        "CREATE INDEX IF NOT EXISTS idx_results_port ON results(port, ts)",
+        "CREATE INDEX IF NOT EXISTS idx_results_service ON results(service, ts)",
+        "CREATE INDEX IF NOT EXISTS idx_results_scan ON results(scan_id)",
+        "CREATE INDEX IF NOT EXISTS idx_results_ts ON results(ts)",
+    )
+    BATCH = 1000
+    FLUSH_SECONDS = 0.5
+
+    def __init__(self, path=HISTORY_DB):
+        import sqlite3
+        self.path = path
+        self.record_all = False
+        self._queue = collections.deque()
+        self._wake = threading.Event()
+        self._flushed = threading.Condition()
+        self._written = 0           # yazıcının işlediği öğe sayısı
+        self._queued = 0            # kuyruğa giren öğe sayısı (_queue_lock altında)
+        self._queue_lock = threading.Lock()
+        self._closed = False
+        self.db = self._connect(sqlite3)
+        for stmt in self.SCHEMA:
+            self.db.execute(stmt)
+        self.db.commit()
+        self._writer = threading.Thread(target=self._run, args=(sqlite3,), name="scan-history", daemon=True)
+        self._writer.start()
+
+    def _connect(self, sqlite3):
+        db = sqlite3.connect(self.path, timeout=10)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
+
+    # --- yazma ---
+    def begin(self, kind, n_targets, n_ports):
+        cur = self.db.execute("INSERT INTO scans (kind, started, targets, ports) VALUES (?, ?, ?, ?)",
+                              (kind, time.time(), n_targets, n_ports))
+        self.db.commit()
+        return cur.lastrowid
+
+    def add(self, scan_id, r):
+        """İşçi thread'lerinden çağrılır; yalnızca kuyruğa ekler. Sayaç += atomik değil, kilitle artar."""
+        if not r.is_open and not self.record_all:
+            return
+        row = (scan_id, time.time(), r.host, r.ip, r.port, int(bool(r.is_open)),
+               r.status or ("open" if r.is_open else "closed"), service_name(r.port), r.banner)
+        with self._queue_lock:
+            self._queue.append(row)
+            self._queued += 1
+        if len(self._queue) >= self.BATCH:
+            self._wake.set()
+
+    def finish(self, scan_id, probes=None):
+        self.flush()
+        n_open = self.db.execute("SELECT COUNT(*) FROM results WHERE scan_id=? AND open=1", (scan_id,)).fetchone()[0]
+        self.db.execute("UPDATE scans SET finished=?, probes=?, open=? WHERE id=?",
+                        (time.time(), probes, n_open, scan_id))
+        self.db.commit()
+
+    def flush(self, timeout=30):
+        """Kuyruktaki her şey diske yazılana kadar bekler."""
+        with self._queue_lock:
+            target = self._queued
+        self._wake.set()
+        with self._flushed:
+            self._flushed.wait_for(lambda: self._written >= target or self._closed, timeout)
+
+    def close(self):
+        self.flush()
+        self._closed = True
+        self._wake.set()
+        self._writer.join(5)
+        self.db.close()
+
+    def _run(self, sqlite3):
+        db = self._connect(sqlite3)
+        q = self._queue
+        while True:
+            self._wake.wait(self.FLUSH_SECONDS)
+            self._wake.clear()
+            while q:
+                batch = []
+                while q and len(batch) < self.BATCH:
+                    batch.append(q.popleft())
+                with db:  # tek transaction
+                    db.executemany("INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", batch)
+                with self._flushed:
+                    self._written += len(batch)
+                    self._flushed.notify_all()
+            with self._flushed:
+                self._flushed.notify_all()
+            if self._closed:
+                db.close()
+                return
+
+    # --- okuma ---
+    def query(self, where, params, limit=100, latest=False):
+        sql = "SELECT scan_id, ts, host, ip, port, open, status, service, banner FROM results"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if latest:
+            # her (host, port) için en son kayıt
+            sql = (f"SELECT scan_id, MAX(ts), host, ip, port, open, status, service, banner FROM ({sql})"
+                   " GROUP BY host, port")
+        sql += " ORDER BY 2 DESC LIMIT ?"
+        return self.db.execute(sql, list(params) + [limit]).fetchall()
+
+    def scans(self, limit=20):
+        return self.db.execute("SELECT id, kind, started, finished, targets, ports, probes, open FROM scans"
+                               " ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
+
+_SINCE_RE = re.compile(r"^(\d+(?:\.\d+)?)([smhdw])$")
+_SINCE_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
+
+def parse_query(arg):
+    """
+    'port=22 open since=7d host=10.0.* service=ssh banner=OpenSSH scan=3 limit=50 latest'
+    -> (where, params, limit, latest). Geçersiz terimde ValueError.
+    """
+    where, params, limit, latest = [], [], 100, False
+    for term in arg.split():
+        key, sep, val = term.partition("=")
+        key = key.lower()
+        if not sep:
+            if key in ("open", "closed"):
+                where.append("open=?")
+                params.append(1 if key == "open" else 0)
+            elif key == "latest":
+                latest = True
+            else:
+                raise ValueError(f"bilinmeyen terim: {term}")
+        elif key == "port":
+            if "-" in val:
+                a, b = (int(x) for x in val.split("-", 1))
+                where.append("port BETWEEN ? AND ?")
+                params += [min(a, b), max(a, b)]
+            else:
+                where.append("port=?")
+                params.append(int(val))
+        elif key == "host":
+            where.append("(host GLOB ? OR ip GLOB ?)" if any(c in val for c in "*?[") else "(host=? OR ip=?)")
+            params += [val, val]
+        elif key == "service":
+            where.append("service=?")
+            params.append(val.lower())
+        elif key == "banner":
+            where.append("banner LIKE ?")
+            params.append(f"%{val}%")
+        elif key == "status":
+            where.append("status=?")
+            params.append(val.lower())
+        elif key == "scan":
+            where.append("scan_id=?")
+            params.append(int(val))
+        elif key == "since":
+            m = _SINCE_RE.match(val.lower())
+            if m:
+                ts = time.time() - float(m.group(1)) * _SINCE_UNITS[m.group(2)]
+            else:
+                ts = time.mktime(time.strptime(val, "%Y-%m-%d"))
+            where.append("ts>=?")
+            params.append(ts)
+        elif key == "limit":
+            limit = max(1, int(val))
+        else:
+            raise ValueError(f"bilinmeyen alan: {key}")
+    return where, params, limit, latest
+
+class ScanStats:
+    """
+    Canlı tarama sayaçları. Her işçi thread'i kendi sayaç dizisine yazar (kilit yok, tek yazar);
+    snapshot() okurken dizileri toplar. Kilit yalnızca bir thread ilk kez kayıt olurken ve
+    hız penceresi güncellenirken alınır, deneme başına değil.
+    """
+    FIELDS = ("issued", "completed", "open", "closed", "timeout", "error")
+    _INDEX = {name: i + 1 for i, name in enumerate(FIELDS)}  # slot[0] = nesil
+    RATE_WINDOW = 5.0
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._slots = []
+        self._gen = 0
+        self._window = collections.deque()   # (zaman, tamamlanan)
+        self.planned = 0
+        self.started = None
+        self.finished = None
+
+    def begin(self, planned):
+        with self._lock:
+            self._gen += 1
+            self._slots = []
+            self._window.clear()
+        self.planned = planned
+        self.started = time.monotonic()
+        self.finished = None
+
+    def end(self):
+        self.finished = time.monotonic()
+
+    def _slot(self):
+        slot = getattr(self._local, "slot", None)
+        if slot is None or slot[0] != self._gen:
+            slot = [self._gen] + [0] * len(self.FIELDS)
+            with self._lock:
+                self._slots.append(slot)
+            self._local.slot = slot
+        return slot
+
+    def issued(self):
+        self._slot()[1] += 1
+
+    def completed(self, status):
+        slot = self._slot()
+        slot[2] += 1
+        slot[self._INDEX.get(status, self._INDEX["error"])] += 1
+
+    def failed(self, n):
+        slot = self._slot()
+        slot[1] += n
+        slot[2] += n
+        slot[self._INDEX["error"]] += n
+
+    def running(self):
+        return self.started is not None and self.finished is None
+
+    def snapshot(self):
+        totals = [0] * len(self.FIELDS)
+        for slot in list(self._slots):
+            for i in range(len(totals)):
+                totals[i] += slot[i + 1]
+        snap = dict(zip(self.FIELDS, totals))
+        now = time.monotonic()
+        end = self.finished or now
+        elapsed = (end - self.started) if self.started is not None else 0.0
+        with self._lock:
+            w = self._window
+            if self.finished is None:
+                w.append((now, snap["completed"]))
+                while len(w) > 1 and now - w[0][0] > self.RATE_WINDOW:
+                    w.popleft()
+            if self.finished is None and len(w) > 1 and w[-1][0] > w[0][0]:
+                rate = (w[-1][1] - w[0][1]) / (w[-1][0] - w[0][0])
+            else:
+                rate = snap["completed"] / elapsed if elapsed > 0 else 0.0
+        remaining = max(0, self.planned - snap["completed"])
+        snap.update(
+            planned=self.planned,
+            in_flight=max(0, snap["issued"] - snap["completed"]),
+            elapsed=elapsed,
+            rate=rate,
+            eta=(remaining / rate) if rate > 0 and self.finished is None else None,
+            running=self.running(),
+        )
+        return snap
+
+def format_stats(snap):
+    """Tek satırlık durum metni."""
+    planned = snap["planned"] or 0
+    pct = (snap["completed"] * 100 / planned) if planned else 0
+    eta = "-" if snap["eta"] is None else f"{snap['eta']:.0f}s"
+    return (f"[stats] {snap['completed']}/{planned} (%{pct:.0f})  {snap['rate']:.0f} deneme/s  "
+            f"uçuşta {snap['in_flight']}  açık {snap['open']} kapalı {snap['closed']} "
+            f"zaman aşımı {snap['timeout']} hata {snap['error']}  ETA {eta}")
+
+def prometheus_text(snap):
+    """ScanStats.snapshot() -> Prometheus metin formatı (0.0.4)."""
+    lines = [
+        "# HELP otp_scan_probes_planned Probes planned for the current scan.",
+        "# TYPE otp_scan_probes_planned gauge",
+        f"otp_scan_probes_planned {snap['planned']}",
+        "# HELP otp_scan_probes_issued_total Probes started.",
+        "# TYPE otp_scan_probes_issued_total counter",
+        f"otp_scan_probes_issued_total {snap['issued']}",
+        "# HELP otp_scan_probes_completed_total Probes finished, by result.",
+        "# TYPE otp_scan_probes_completed_total counter",
+    ]
+    for result in ("open", "closed", "timeout", "error"):
+        lines.append(f'otp_scan_probes_completed_total{{result="{result}"}} {snap[result]}')
+    lines += [
+        "# HELP otp_scan_in_flight Probes currently in flight.",
+        "# TYPE otp_scan_in_flight gauge",
+        f"otp_scan_in_flight {snap['in_flight']}",
+        "# HELP otp_scan_probes_per_second Completed probes per second (recent window).",
+        "# TYPE otp_scan_probes_per_second gauge",
+        f"otp_scan_probes_per_second {snap['rate']:.3f}",
+        "# HELP otp_scan_eta_seconds Estimated seconds until the scan finishes (-1 if unknown).",
+        "# TYPE otp_scan_eta_seconds gauge",
+        f"otp_scan_eta_seconds {-1 if snap['eta'] is None else round(snap['eta'], 1)}",
+        "# HELP otp_scan_running 1 while a scan is running.",
+        "# TYPE otp_scan_running gauge",
+        f"otp_scan_running {1 if snap['running'] else 0}",
+    ]
+    return "\n".join(lines) + "\n"
+
+class MetricsServer:
+    """ScanStats'ı 127.0.0.1:port/metrics adresinde Prometheus metni olarak sunar (daemon thread)."""
+
+    def __init__(self, stats, port=METRICS_PORT, host="127.0.0.1"):
+        from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+        stats_ref = stats
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = prometheus_text(stats_ref.snapshot()).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # tarama çıktısını isteklerle kirletme
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.address = self.httpd.server_address
+        threading.Thread(target=self.httpd.serve_forever, name="metrics", daemon=True).start()
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+class StatusLine:
+    """
+    Tarama sürerken durum satırını periyodik olarak yazar. Gerçek bir terminalde aynı satır
+    yerinde yenilenir; boruya yazarken ya da O.T.P sekmesinde (\\r desteklemez, OTP_TERMINAL)
+    her aralıkta ayrı bir satır basılır.
+    """
+
+    def __init__(self, stats, interval=2.0, lock=None):
+        self.stats = stats
+        self.interval = interval
+        self.lock = lock or threading.Lock()
+        self.inplace = sys.stdout.isatty() and not os.environ.get("OTP_TERMINAL")
+        self._stop = threading.Event()
+        self._thread = None
+        self._shown = False
+
+    def start(self):
+        if self.interval <= 0:
+            return self
+        # satır modunda ekranı doldurmamak için daha seyrek
+        every = self.interval if self.inplace else max(self.interval, 10.0)
+        self._thread = threading.Thread(target=self._run, args=(every,), name="status-line", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self, every):
+        while not self._stop.wait(every):
+            self.show()
+
+    def show(self):
+        text = format_stats(self.stats.snapshot())
+        with self.lock:
+            if self.inplace:
+                sys.stdout.write("\r\x1b[K" + text)
+                self._shown = True
+            else:
+                sys.stdout.write(text + "\n")
+            sys.stdout.flush()
+
+    def clear(self):
+        """Yerinde satırı sil (araya normal çıktı yazılmadan önce, kilit tutulurken çağrılır)."""
+        if self._shown:
+            sys.stdout.write("\r\x1b[K")
+            self._shown = False
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        with self.lock:
+            self.clear()
+
+class OutputQueue:
+    """
+    Tarama olayları için tek yazıcı. İşçi thread'leri put() ile satırı kuyruğa bırakır (stdout
+    kilidi beklemez); yazıcı thread en geç interval saniyede bir kuyruktaki tüm satırları tek
+    write + flush ile basar. Satırlar birbirine karışmaz; O.T.P sekmesinde her satır ayrı bir
+    boru okuması olmaz. before_write (ör. durum satırını silmek) lock tutulurken çağrılır.
+    """
+    INTERVAL = 0.05
+    WAKE_AT = 1000     # bu kadar satır birikirse aralığı beklemeden yaz
+
+    def __init__(self, stream=None, interval=INTERVAL, lock=None, before_write=None):
+        self.stream = stream or sys.stdout
+        self.interval = interval
+        self.lock = lock or threading.Lock()
+        self.before_write = before_write
+        self._lines = collections.deque()
+        self._wake = threading.Event()
+        self._stop = False
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="scan-output", daemon=True)
+        self._thread.start()
+        return self
+
+    def put(self, line):
+        self._lines.append(line)
+        if len(self._lines) >= self.WAKE_AT:
+            self._wake.set()
+
+    def flush(self, timeout=5.0):
+        """Şu ana kadar kuyruğa giren her şey yazılana kadar bekler."""
+        if self._thread is None or not self._thread.is_alive():
+            self._drain()
+            return
+        done = threading.Event()
+        self._lines.append(done)
+        self._wake.set()
+        done.wait(timeout)
+
+    def stop(self):
+        self._stop = True
+        self._wake.set()
+        if self._thread:
+            self._thread.join()
+        self._drain()
+
+    def _run(self):
+        while not self._stop:
+            self._wake.wait(self.interval)
+            self._wake.clear()
+            self._drain()
+
+    def _drain(self):
+        parts, waiters = [], []
+        while self._lines:
+            item = self._lines.popleft()
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                parts.append(item)
+        if parts:
+            with self.lock:
+                if self.before_write is not None:
+                    self.before_write()
+                self.stream.write("\n".join(parts) + "\n")
+                self.stream.flush()
+        for w in waiters:
+            w.set()
+
+def _profile_path(kind):
+    return f"scan_{kind}_{time.strftime('%Y%m%d_%H%M%S')}.txt"
+
+class StackSampler:
+    """
+    Örneklemeli profil: her interval saniyede tüm thread'lerin yığınını (sys._current_frames)
+    okur; fonksiyon başına kendi (self) ve kümülatif örnek sayılarını tutar. cProfile'dan çok
+    daha düşük ek yük; süreler örnek sayısı x aralık olarak yaklaşıktır.
+    """
+
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.samples = 0
+        self.own = collections.Counter()
+        self.cumulative = collections.Counter()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        me = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for ident, frame in sys._current_frames().items():
+                if ident == me:
+                    continue
+                self.samples += 1
+                seen = set()
+                top = True
+                while frame is not None:
+                    code = frame.f_code
+                    key = f"{code.co_filename}:{code.co_firstlineno}({code.co_name})"
+                    if top:
+                        self.own[key] += 1
+                        top = False
+                    if key not in seen:
+                        self.cumulative[key] += 1
+                        seen.add(key)
+                    frame = frame.f_back
+
+    def report(self, limit=40):
+        lines = [f"{self.samples} örnek, aralık {self.interval * 1000:.1f} ms (thread başına)", ""]
+        for title, counter in (("Kendi süresi (yığının tepesi)", self.own), ("Kümülatif", self.cumulative)):
+            lines.append(title)
+            for key, n in counter.most_common(limit):
+                lines.append(f"  {n:>7}  {n * self.interval:>8.3f}s  {key}")
+            lines.append("")
+        return "\n".join(lines)
+
+def profile_call(fn, path=None, sampling=False, interval=0.005, limit=40):
+    """
+    fn()'i profilleyerek çalıştırır ve sıralı istatistikleri path'e yazar; (sonuç, path) döndürür.
+    cProfile modu işçi thread'lerini de kapsar (3.12+ tek profil tüm thread'leri görür, öncesinde
+    threading.setprofile ile her yeni thread kendi profilini açar). sampling=True: StackSampler.
+    """
+    import io
+    path = path or _profile_path("profile")
+    if sampling:
+        sampler = StackSampler(interval).start()
+        try:
+            result = fn()
+        finally:
+            sampler.stop()
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(sampler.report(limit))
+        return result, path
+
+    import cProfile, pstats
+    main = cProfile.Profile()
+    profilers = [main]
+    per_thread = sys.version_info < (3, 12)
+
+    def start_thread_profiler(frame, event, arg):
+        sys.setprofile(None)
+        p = cProfile.Profile()
+        profilers.append(p)
+        p.enable()
+
+    if per_thread:
+        threading.setprofile(start_thread_profiler)
+    main.enable()
+    try:
+        result = fn()
+    finally:
+        main.disable()
+        if per_thread:
+            threading.setprofile(None)
+        out = io.StringIO()
+        stats = pstats.Stats(main, stream=out)
+        for p in profilers[1:]:
+            try:
+                stats.add(p)
+            except (TypeError, ValueError):
+                pass  # hâlâ çalışan bir thread'in profili
+        stats.sort_stats("cumulative").print_stats(limit)
+        stats.sort_stats("tottime").print_stats(limit)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(f"{len(profilers)} profil (ana thread + {len(profilers) - 1} işçi)\n")
+            f.write(out.getvalue())
+    return result, path
+
+def memprofile_call(fn, path=None, frames=25, limit=30):
+    """
+    fn()'i tracemalloc altında çalıştırır: öncesi/sonrası anlık görüntü farkı, en çok ayıran
+    satırlar ve tepe bellek path'e yazılır; (sonuç, path) döndürür.
+    """
+    import tracemalloc
+    path = path or _profile_path("memprofile")
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(frames)
+    if hasattr(tracemalloc, "reset_peak"):  # 3.9+
+        tracemalloc.reset_peak()
+    before = tracemalloc.take_snapshot()
+    try:
+        result = fn()
+    finally:
+        after = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        if not was_tracing:
+            tracemalloc.stop()
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        before, after = before.filter_traces(filters), after.filter_traces(filters)
+        lines = [f"izlenen bellek: şu an {current / 1024:.1f} KB, tepe {peak / 1024:.1f} KB", "",
+                 f"En çok artan {limit} satır (sonrası - öncesi):"]
+        lines += [f"  {stat}" for stat in after.compare_to(before, "lineno")[:limit]]
+        lines += ["", f"En çok ayıran {limit} satır (sonrası):"]
+        lines += [f"  {stat}" for stat in after.statistics("lineno")[:limit]]
+        top = after.statistics("traceback")[:3]
+        for i, stat in enumerate(top, 1):
+            lines += ["", f"#{i} en büyük ayırma yığını: {stat.size / 1024:.1f} KB, {stat.count} blok"]
+            lines += [f"  {line}" for line in stat.traceback.format()]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+    return result, path
+
+class ScannerShell(cmd.Cmd):
+    intro = "Geliştirilmiş scanner kabuğuna hoşgeldin. Yardım için 'help' yaz.\n"
+    prompt = "scanner> "
+
+    def __init__(self):
+        super().__init__()
+        self.target = None
+        self.target_ip = None
+        self.targets = []       # çoklu hedef desteği
+        self.ports = list(DEFAULT_PORTS)
+        self.timeout = 1.0
+        self.max_workers = 50
+        self.source = SourcePool()  # kaynak adres havuzu, isteğe bağlı abortive close (net komutu)
+        self.budget = FdBudget()    # RLIMIT_NOFILE'a göre uçuştaki deneme sınırı (fd komutu)
+        self._fd_backoffs = 0
+        self.discovery = False  # taramadan önce canlı host keşfi
+        self.discovery_ports = list(DISCOVERY_PORTS)
+        self.discovery_timeout = 0.5
+        self.discovery_icmp = True
+        self.results = {}       # {(host,port): (open,banner)}
+        self.last_run = None
+        self.baseline = {}      # önceki tarama, rescan bununla karşılaştırır
+        self.baseline_source = None
+        self.history = None     # ScanHistory, ilk taramada/sorguda açılır
+        self.history_enabled = True
+        self._scan_id = None
+        self.stats = ScanStats()
+        self.status_interval = 2.0
+        self.status = None      # tarama sürerken StatusLine
+        self.out = None         # tarama sürerken OutputQueue
+        self.quiet = False      # yalnızca özetler
+        self._failed_hosts = []
+        self.metrics = None     # MetricsServer (metrics komutu)
+        self._out_lock = threading.Lock()
+
+    def do_set(self, arg):
+        "set target <domain_or_ip>  -- tek hedef ayarlar"
+        parts = arg.split()
+        if len(parts) >= 2 and parts[0].lower() == "target":
+            target = " ".join(parts[1:]).strip()
+            if not target:
+                print("Hedef boş bırakılamaz.")
+                return
+            try:
+                ip = socket.gethostbyname(target)
+                self.target = target
+                self.target_ip = ip
+                self.targets = [target]
+                print(f"Hedef ayarlandı: {self.target} ({self.target_ip})")
+            except Exception as e:
+                print(f"DNS çözümlenemedi: {e}")
+        else:
+            print("Kullanım: set target example.com")
+
+    def do_setrange(self, arg):
+        "setrange <CIDR_or_range>  -- IP aralığı veya CIDR ile hedef listesi ayarlar"
+        spec = arg.strip()
+        if not spec:
+            print("Kullanım: setrange 192.168.1.0/28 veya setrange 192.168.1.1-192.168.1.50")
+            return
+        targets = expand_targets(spec)
+        if not targets:
+            print("Geçersiz aralık.")
+            return
+        self.targets = targets
+        print(f"{len(self.targets)} hedef ayarlandı (örnek: {self.targets[:3]}...)")
+
+    def do_setfile(self, arg):
+        "setfile <path>  -- dosyadan hedefleri oku (her satırda bir hedef)"
+        path = arg.strip()
+        if not path:
+            print("Kullanım: setfile hedefler.txt")
+            return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                lines = [l.strip() for l in f if l.strip()]
+        except Exception as e:
+            print(f"Dosya açılamadı: {e}")
+            return
+        self.targets = lines
+        print(f"{len(self.targets)} hedef dosyadan yüklendi.")
+
+    def do_ports(self, arg):
+        "ports <liste|aralık>  -- portları ayarlar veya mevcut listeyi gösterir"
+        if not arg.strip():
+            print("Mevcut port listesi:", self.ports)
+            return
+        parsed = parse_ports(arg)
+        if not parsed:
+            print("Geçerli bir port listesi girin.")
+            return
+        self.ports = parsed
+        print(f"Port listesi ayarlandı. {len(self.ports)} port.")
+
+    def do_timeout(self, arg):
+        "timeout <saniye>  -- bağlantı zaman aşımını ayarlar (float)"
+        try:
+            t = float(arg.strip())
+            if t <= 0:
+                raise ValueError()
+            self.timeout = t
+            print(f"Timeout ayarlandı: {self.timeout}s")
+        except Exception:
+            print("Geçerli bir sayı girin. Örnek: timeout 1.5")
+
+    def do_workers(self, arg):
+        "workers <adet>  -- paralel işçi sayısını ayarlar"
+        try:
+            n = int(arg.strip())
+            if n < 1:
+                raise ValueError()
+            self.max_workers = min(200, n, self.budget.capacity)
+            note = f" (tanımlayıcı bütçesi: {self.budget.capacity})" if self.max_workers < min(200, n) else ""
+            print(f"Worker sayısı: {self.max_workers}{note}")
+        except Exception:
+            print("Geçerli bir tam sayı girin. Örnek: workers 40")
+
+    def _print(self, text):
+        # tarama sürerken tek yazıcıya (OutputQueue); değilse doğrudan, durum satırıyla karışmadan
+        if self.out is not None:
+            self.out.put(text)
+            return
+        with self._out_lock:
+            self._clear_status()
+            print(text)
+
+    def _clear_status(self):
+        if self.status is not None:
+            self.status.clear()
+
+    def _begin_live(self):
+        """Tarama başı: çıktı kuyruğu ve durum satırı."""
+        self._failed_hosts = []
+        self.out = OutputQueue(lock=self._out_lock, before_write=self._clear_status).start()
+        self.status = StatusLine(self.stats, self.status_interval, self._out_lock).start()
+
+    def _end_live(self):
+        self.status.stop()
+        self.status = None
+        self.out.stop()
+        self.out = None
+        if self.quiet and self._failed_hosts:
+            print(f"{len(self._failed_hosts)} host çözümlenemedi (örnek: {self._failed_hosts[:3]})")
+
+    def _sync_output(self):
+        """Ana thread'den print etmeden önce kuyruktaki olayları yaz."""
+        if self.out is not None:
+            self.out.flush()
+
+    def _on_result(self, r):
+        self.results[(r.host, r.port)] = (r.is_open, r.banner)
+        if self._scan_id is not None:
+            self.history.add(self._scan_id, r)
+        if r.is_open and not self.quiet:
+            self._print(f"[OPEN] {r.host}:{r.port}  {('Banner: ' + r.banner) if r.banner else ''}")
+
+    def _on_error(self, host, e):
+        self._failed_hosts.append(host)
+        if not self.quiet:
+            self._print(f"{host} çözümlenemedi: {e}")
+
+    def do_quiet(self, arg):
+        "quiet [on|off]  -- tarama sırasında tek tek sonuçları (OPEN, DNS hataları) yazmaz, yalnızca özetleri gösterir"
+        sub = arg.strip().lower()
+        if sub in ("on", "off"):
+            self.quiet = sub == "on"
+        elif sub:
+            print("Kullanım: quiet [on|off]")
+            return
+        print(f"Sessiz mod: {'açık (yalnızca özetler)' if self.quiet else 'kapalı'}")
+
+    def do_scan(self, arg):
+        "scan  -- ayarlı hedef(ler) ve portları tarar (tek veya çoklu hedef)"
+        if not self.targets:
+            print("Önce hedef ayarlayın: set target <host> veya setrange <CIDR/range> veya setfile <path>")
+            return
+        if not self.ports:
+            print("Port listesi boş. Önce ports komutu ile portları ayarlayın.")
+            return
+        print(f"Toplam hedef: {len(self.targets)}  Port sayısı: {len(self.ports)}")
+        self.results.clear()
+        start = time.time()
+        targets = self.targets
+        if self.discovery and len(targets) > 1:
+            targets = self._discover(targets)
+            if not targets:
+                return
+        self._history_begin("scan", targets)
+        self._begin_live()
+        try:
+            scan_hosts(targets, self.ports, self.timeout, self.max_workers,
+                       on_result=self._on_result, on_error=self._on_error, stats=self.stats, source=self.source,
+                       budget=self.budget)
+        except KeyboardInterrupt:
+            self._sync_output()
+            print("\n[!] Tarama kullanıcı tarafından durduruldu (Ctrl+C).")
+        finally:
+            self._end_live()
+            self._history_finish()
+        elapsed = time.time() - start
+        self.last_run = time.ctime()
+        print(f"\nTarama tamamlandı. Süre: {elapsed:.2f}s  ({self.last_run})")
+        print(format_stats(self.stats.snapshot()))
+        self._warn_resources()
+
+    def _warn_resources(self):
+        if self.budget.backoffs > self._fd_backoffs:
+            print(f"[!] Tanımlayıcı/tampon sıkıntısı: {self.budget.backoffs - self._fd_backoffs} geri çekilme; "
+                  f"'fd raise' ile sınırı yükseltin veya worker sayısını düşürün.")
+            self._fd_backoffs = self.budget.backoffs
+        if self.source.exhausted:
+            print(f"[!] Geçici portlar {self.source.exhausted} kez tükendi; 'net source' ile kaynak adres ekleyin "
+                  f"veya 'net linger on' kullanın.")
+            self.source.exhausted = 0
+
+    def do_fd(self, arg):
+        "fd [raise [N]] [reserve N]  -- dosya tanımlayıcı bütçesi: RLIMIT_NOFILE, ayrılan pay, uçuştaki sınır ve geri çekilmeler"
+        parts = arg.split()
+        sub = parts[0].lower() if parts else ""
+        try:
+            num = int(parts[1]) if len(parts) > 1 else None
+        except ValueError:
+            print("Geçerli bir tam sayı girin. Örnek: fd raise 65536")
+            return
+        if sub == "raise":
+            old = self.budget.soft
+            try:
+                new = self.budget.raise_limit(num)
+            except (ImportError, ValueError, OSError) as e:
+                print(f"Sınır değiştirilemedi: {e}")
+                return
+            print(f"Yumuşak sınır: {old} -> {new}")
+            if num is not None and num > self.budget.hard:
+                print(f"İstenen {num} sert sınırın üstünde; en fazla {self.budget.hard} olabilir.")
+        elif sub == "reserve" and num is not None:
+            self.budget.reserve = max(0, num)
+            self.budget.refresh()
+        elif sub:
+            print("Kullanım: fd [raise [N]] [reserve N]")
+            return
+        else:
+            self.budget.refresh()
+        b = self.budget.snapshot()
+        print(f"RLIMIT_NOFILE: yumuşak {b['soft']}  sert {b['hard']}  açık {b['open_now']}  ayrılan {b['reserve']}")
+        print(f"Bütçe: kapasite {b['capacity']}  şu anki sınır {b['limit']}  uçuşta {b['in_flight']}  "
+              f"tepe {b['peak']}  geri çekilme {b['backoffs']}")
+        if self.max_workers > b["capacity"]:
+            self.max_workers = b["capacity"]
+            print(f"Worker sayısı bütçeye indirildi: {self.max_workers}")
+
+    def do_net(self, arg):
+        "net [linger on|off] [source <ip,ip,...>|clear]  -- soket kapanışı (SO_LINGER 0), kaynak adres havuzu ve geçici port kullanımı"
+        parts = arg.split()
+        sub = parts[0].lower() if parts else ""
+        if sub == "linger" and len(parts) > 1 and parts[1].lower() in ("on", "off"):
+            self.source.linger0 = parts[1].lower() == "on"
+        elif sub == "source" and len(parts) > 1:
+            if parts[1].lower() == "clear":
+                self.source.addrs = []
+            else:
+                addrs = [a.strip() for a in " ".join(parts[1:]).split(",") if a.strip()]
+                for a in addrs:
+                    try:
+                        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+                            probe.bind((a, 0))
+                    except OSError as e:
+                        print(f"Kaynak adres kullanılamaz: {a} ({e})")
+                        return
+                self.source.addrs = addrs
+        elif sub:
+            print("Kullanım: net [linger on|off] [source 10.0.0.2,10.0.0.3|clear]")
+            return
+        print(f"Kapanış: {'abortive (SO_LINGER 0, TIME_WAIT yok)' if self.source.linger0 else 'normal (FIN, TIME_WAIT)'}")
+        print(f"Kaynak adresler: {', '.join(self.source.addrs) if self.source.addrs else 'sistem seçer'}")
+        usage = ephemeral_usage()
+        if usage is None:
+            return
+        lo, hi = usage["range"]
+        print(f"Geçici portlar: {lo}-{hi} ({usage['size']})  kullanımda {usage['in_use']}  "
+              f"TIME_WAIT {usage['time_wait']}  (%{usage['in_use'] * 100 / usage['size']:.0f})")
+        for addr, n in sorted(usage["by_source"].items(), key=lambda kv: -kv[1])[:5]:
+            print(f"  {_hex_addr(addr)}: {n}")
+
+    def do_udpscan(self, arg):
+        "udpscan [portlar]  -- ayarlı hedeflerde UDP servis taraması (DNS/NTP/SNMP/NetBIOS/SSDP/TFTP); tek soket, yeniden gönderimli"
+        if not self.targets:
+            print("Önce hedef ayarlayın: set target <host> veya setrange <CIDR/range> veya setfile <path>")
+            return
+        try:
+            import udpScanner
+        except ImportError as e:
+            print(f"UDP motoru yüklenemedi: {e}")
+            return
+        ports = parse_ports(arg) if arg.strip() else list(udpScanner.DEFAULT_UDP_PORTS)
+        if not ports:
+            print("Geçerli bir port listesi girin.")
+            return
+        print(f"UDP: {len(self.targets)} hedef x {len(ports)} port  (zaman aşımı {self.timeout}s, 1 yeniden gönderim)")
+
+        def on_result(host, ip, port, status, data):
+            banner = udpScanner.describe(port, data) if status == "open" else ""
+            r = ScanResult(host, ip, port, status == "open", banner, status)
+            self.results[(host, port)] = (r.is_open, r.banner)
+            if self._scan_id is not None:
+                self.history.add(self._scan_id, r)
+            if r.is_open and not self.quiet:
+                self._print(f"[OPEN] {host}:{port}/udp  Banner: {banner}")
+
+        self.results.clear()
+        start = time.time()
+        self._history_begin("udp", self.targets, ports)
+        self._begin_live()
+        try:
+            counts = udpScanner.udp_scan(self.targets, ports, self.timeout, retries=1, on_result=on_result,
+                                         on_error=self._on_error, stats=self.stats, budget=self.budget)
+        except KeyboardInterrupt:
+            counts = None
+            self._sync_output()
+            print("\n[!] Tarama kullanıcı tarafından durduruldu (Ctrl+C).")
+        finally:
+            self._end_live()
+            self._history_finish()
+        self.last_run = time.ctime()
+        print(f"\nUDP taraması tamamlandı. Süre: {time.time() - start:.2f}s  ({self.last_run})")
+        if counts is not None:
+            print(f"açık {counts.get('open', 0)}  kapalı {counts.get('closed', 0)}  "
+                  f"yanıtsız (açık|filtreli) {counts.get('timeout', 0)}  hata {counts.get('error', 0)}")
+
+    def _discover(self, targets):
+        """Keşif ön geçişi; canlı hostları döndürür (Ctrl+C'de boş liste)."""
+        icmp = self.discovery_icmp and _icmp_socket_available()
+        print(f"Keşif: {len(targets)} host, portlar {self.discovery_ports}"
+              f"{' + ICMP' if icmp else ''}, zaman aşımı {self.discovery_timeout}s")
+        t0 = time.time()
+        try:
+            alive = discover_hosts(targets, self.discovery_ports, self.discovery_timeout, icmp=icmp,
+                                   on_error=self._on_error, budget=self.budget, linger0=self.source.linger0)
+        except KeyboardInterrupt:
+            print("\n[!] Keşif kullanıcı tarafından durduruldu (Ctrl+C).")
+            return []
+        print(f"Keşif tamamlandı: {len(alive)}/{len(targets)} host yanıt verdi ({time.time() - t0:.2f}s)")
+        return alive
+
+    def do_discovery(self, arg):
+        "discovery [on|off|run|ports <liste>|timeout <sn>|icmp on|off]  -- taramadan önce canlı host keşfi; run yalnızca keşif yapar ve hedefleri canlılarla daraltır"
+        parts = arg.split()
+        sub = parts[0].lower() if parts else ""
+        if sub in ("on", "off"):
+            self.discovery = sub == "on"
+        elif sub == "ports" and len(parts) > 1:
+            parsed = parse_ports(" ".join(parts[1:]))
+            if not parsed:
+                print("Geçerli bir port listesi girin.")
+                return
+            self.discovery_ports = parsed
+        elif sub == "timeout" and len(parts) > 1:
+            try:
+                self.discovery_timeout = max(0.05, float(parts[1]))
+            except ValueError:
+                print("Geçerli bir sayı girin. Örnek: discovery timeout 0.3")
+                return
+        elif sub == "icmp" and len(parts) > 1 and parts[1].lower() in ("on", "off"):
+            self.discovery_icmp = parts[1].lower() == "on"
+        elif sub == "run":
+            if not self.targets:
+                print("Önce hedef ayarlayın: setrange <CIDR/range> veya setfile <path>")
+                return
+            alive = self._discover(self.targets)
+            if alive:
+                self.targets = alive
+                print(f"Hedefler canlı hostlarla değiştirildi (örnek: {alive[:3]}...)")
+            return
+        elif sub:
+            print("Kullanım: discovery [on|off|run|ports 22,80|timeout 0.5|icmp on|off]")
+            return
+        icmp = "kapalı" if not self.discovery_icmp else ("açık" if _icmp_socket_available() else "yetki yok")
+        print(f"Keşif: {'açık' if self.discovery else 'kapalı'}  portlar: {self.discovery_ports}  "
+              f"zaman aşımı: {self.discovery_timeout}s  ICMP: {icmp}")
+
+    # --- geçmiş (SQLite) ---
+    def _open_history(self):
+        if self.history is None:
+            try:
+                self.history = ScanHistory()
+            except Exception as e:
+                print(f"Tarama geçmişi açılamadı ({HISTORY_DB}): {e}")
+                self.history_enabled = False
+        return self.history
+
+    def _history_begin(self, kind, targets, ports=None):
+        """targets: gerçekten taranan liste (keşif sonrası canlılar), ayarlı hedefler değil."""
+        self._scan_id = None
+        if self.history_enabled and self._open_history() is not None:
+            self._scan_id = self.history.begin(kind, len(targets), len(ports or self.ports))
+
+    def _history_finish(self, extra_probes=0):
+        if self._scan_id is not None:
+            self.history.finish(self._scan_id, extra_probes + self.stats.snapshot()["completed"])
+            self._scan_id = None
+
+    def do_history(self, arg):
+        "history [on|off|all|open] [N]  -- kayıtlı taramaları listeler; on/off kaydı açar/kapatır, all her denemeyi, open yalnız açıkları saklar"
+        sub = arg.strip().lower()
+        if sub in ("on", "off"):
+            self.history_enabled = sub == "on"
+            print(f"Tarama geçmişi {'açık' if self.history_enabled else 'kapalı'}.")
+            return
+        if self._open_history() is None:
+            return
+        if sub in ("all", "open"):
+            self.history.record_all = sub == "all"
+            print("Her deneme kaydedilecek." if self.history.record_all else "Yalnızca açık servisler kaydedilecek.")
+            return
+        try:
+            limit = int(sub) if sub else 20
+        except ValueError:
+            print("Kullanım: history [on|off|all|open] [N]")
+            return
+        rows = self.history.scans(limit)
+        if not rows:
+            print(f"Kayıtlı tarama yok ({self.history.path}).")
+            return
+        print(f"Tarama geçmişi: {self.history.path}")
+        for sid, kind, started, finished, n_targets, n_ports, probes, n_open in rows:
+            took = f"{finished - started:.1f}s" if finished else "yarım"
+            print(f"  #{sid:<5} {time.strftime('%Y-%m-%d %H:%M', time.localtime(started))}  {kind:<7} "
+                  f"{n_targets} hedef x {n_ports} port  {probes or 0} deneme  {n_open or 0} açık  {took}")
+
+    def do_query(self, arg):
+        "query [port=22|20-25] [host=10.0.*] [service=ssh] [banner=metin] [scan=N] [since=7d|2024-01-31] [open|closed] [latest] [limit=N]  -- tarama geçmişinde arar"
+        try:
+            where, params, limit, latest = parse_query(arg)
+        except ValueError as e:
+            print(f"Geçersiz sorgu: {e}")
+            return
+        if self._open_history() is None:
+            return
+        t0 = time.perf_counter()
+        rows = self.history.query(where, params, limit, latest)
+        took = (time.perf_counter() - t0) * 1000
+        for sid, ts, host, ip, port, is_open, status, service, banner in rows:
+            when = time.strftime("%Y-%m-%d %H:%M", time.localtime(ts))
+            addr = host if host == ip or not ip else f"{host} ({ip})"
+            line = f"  {when}  #{sid:<5} {addr}:{port}  {status or ('open' if is_open else 'closed')}"
+            if service:
+                line += f"  {service}"
+            if banner:
+                line += f"  Banner: {banner}"
+            print(line)
+        more = " (limit)" if len(rows) >= limit else ""
+        print(f"{len(rows)} kayıt{more}, {took:.1f} ms")
+
+    def do_baseline(self, arg):
+        "baseline load <dosya.csv> | use | show | clear  -- rescan için önceki sonuç kümesi (use = son tarama)"
+        parts = arg.split(maxsplit=1)
+        sub = parts[0].lower() if parts else "show"
+        if sub == "load" and len(parts) == 2:
+            try:
+                self.baseline = load_results_csv(parts[1].strip())
+            except OSError as e:
+                print(f"Dosya açılamadı: {e}")
+                return
+            self.baseline_source = parts[1].strip()
+        elif sub == "use":
+            if not self.results:
+                print("Henüz sonuç yok.")
+                return
+            self.baseline = dict(self.results)
+            self.baseline_source = f"son tarama ({self.last_run})"
+        elif sub == "clear":
+            self.baseline, self.baseline_source = {}, None
+            print("Baseline temizlendi.")
+            return
+        elif sub != "show":
+            print("Kullanım: baseline load dünkü.csv | baseline use | baseline show | baseline clear")
+            return
+        if not self.baseline:
+            print("Baseline yok.")
+            return
+        hosts = {h for h, _ in self.baseline}
+        n_open = sum(1 for is_open, _ in self.baseline.values() if is_open)
+        print(f"Baseline: {self.baseline_source}  {len(hosts)} host, {n_open} açık servis, {len(self.baseline)} kayıt")
+
+    def do_rescan(self, arg):
+        "rescan [quick]  -- baseline'daki açık servisleri önce dener, sonra tam tarama; farkları raporlar (quick: değişmeyen hostlarda tam taramayı atlar)"
+        if not self.baseline:
+            print("Önce baseline ayarlayın: baseline load <dosya.csv> veya baseline use")
+            return
+        quick = arg.strip().lower() == "quick"
+        targets = self.targets or sorted({h for h, _ in self.baseline})
+        known = collections.defaultdict(list)
+        for (host, port), (is_open, _) in self.baseline.items():
+            if is_open:
+                known[host].append(port)
+        self.results.clear()
+        start = time.time()
+        self._history_begin("rescan", targets)
+        probes = 0
+        self._begin_live()
+        try:
+            # 1) bilinen açık servisler: değişiklikler saniyeler içinde görünür
+            plan = [(h, sorted(known[h])) for h in targets if known.get(h)]
+            self._print(f"Hızlı kontrol: {sum(len(p) for _, p in plan)} bilinen açık servis, {len(plan)} host")
+            scan_plan(plan, self.timeout, self.max_workers, self._on_result, self._on_error, stats=self.stats,
+                      source=self.source, budget=self.budget)
+            probes = self.stats.snapshot()["completed"]
+            quick_diff = diff_results(self.baseline, self.results)
+            changed = {k[0] for k in quick_diff["closed"]} | {k[0][0] for k in quick_diff["banner"]}
+            self._print_diff(quick_diff, "Hızlı kontrol farkları")
+            # 2) kalan portlar; quick modda yalnızca değişen ve baseline'da olmayan hostlar
+            full = []
+            for h in targets:
+                if quick and known.get(h) and h not in changed:
+                    continue
+                done = set(known.get(h, ()))
+                rest = [p for p in self.ports if p not in done]
+                if rest:
+                    full.append((h, rest))
+            skipped = len(targets) - len(full)
+            self._print(f"Tam tarama: {len(full)} host" + (f" ({skipped} değişmeyen host atlandı)" if quick and skipped else ""))
+            scan_plan(full, self.timeout, self.max_workers, self._on_result, self._on_error, stats=self.stats,
+                      source=self.source, budget=self.budget)
+        except KeyboardInterrupt:
+            self._sync_output()
+            print("\n[!] Tarama kullanıcı tarafından durduruldu (Ctrl+C).")
+        finally:
+            self._end_live()
+            self._history_finish(probes)
+        elapsed = time.time() - start
+        self.last_run = time.ctime()
+        diff = diff_results(self.baseline, self.results)
+        self._print_diff(diff, "Baseline'a göre farklar")
+        print(f"\nYeniden tarama tamamlandı. Süre: {elapsed:.2f}s  ({self.last_run})")
+        self._warn_resources()
+
+    def _print_diff(self, diff, title):
+        # canlı durum satırı / OutputQueue açıkken de tek yazıcıdan geçsin
+        total = len(diff["opened"]) + len(diff["closed"]) + len(diff["banner"])
+        self._print(f"{title}: {len(diff['opened'])} yeni açık, {len(diff['closed'])} kapanan, "
+                    f"{len(diff['banner'])} banner değişen" + ("" if total else " (değişiklik yok)"))
+        for host, port in diff["opened"]:
+            self._print(f"  [+] {host}:{port} açıldı  {self.results[(host, port)][1]}")
+        for host, port in diff["closed"]:
+            self._print(f"  [-] {host}:{port} kapandı")
+        for (host, port), old, new in diff["banner"]:
+            self._print(f"  [~] {host}:{port} banner: {old!r} -> {new!r}")
+
+    def do_stats(self, arg):
+        "stats [every <saniye>]  -- canlı/son tarama sayaçlarını gösterir; every ile durum satırı aralığı (0 = kapalı)"
+        parts = arg.split()
+        if parts and parts[0].lower() == "every":
+            try:
+                self.status_interval = max(0.0, float(parts[1]))
+                print(f"Durum satırı aralığı: {self.status_interval}s" if self.status_interval else "Durum satırı kapalı.")
+            except (IndexError, ValueError):
+                print("Kullanım: stats every 2")
+            return
+        if self.stats.started is None:
+            print("Henüz tarama yok.")
+            return
+        snap = self.stats.snapshot()
+        print(format_stats(snap))
+        print(f"  planlanan {snap['planned']}  başlatılan {snap['issued']}  tamamlanan {snap['completed']}  "
+              f"süre {snap['elapsed']:.2f}s  {'sürüyor' if snap['running'] else 'bitti'}")
+
+    def do_metrics(self, arg):
+        "metrics [port|stop]  -- sayaçları http://127.0.0.1:<port>/metrics adresinde Prometheus formatında sunar"
+        arg = arg.strip().lower()
+        if arg == "stop":
+            if self.metrics:
+                self.metrics.stop()
+                self.metrics = None
+                print("Metrics sunucusu durduruldu.")
+            return
+        if self.metrics:
+            print(f"Metrics zaten açık: http://{self.metrics.address[0]}:{self.metrics.address[1]}/metrics")
+            return
+        try:
+            port = int(arg) if arg else METRICS_PORT
+            self.metrics = MetricsServer(self.stats, port)
+        except ValueError:
+            print("Kullanım: metrics 9464")
+            return
+        except OSError as e:
+            print(f"Metrics sunucusu açılamadı: {e}")
+            return
+        print(f"Metrics: http://{self.metrics.address[0]}:{self.metrics.address[1]}/metrics")
+
+    def do_bench(self, arg):
+        "bench [open=N closed=N slow=N banner=N delay=S rounds=N json=dosya]  -- tarama motorlarını yerel sahte sunuculara karşı kıyaslar"
+        try:
+            import benchScanner
+        except ImportError as e:
+            print(f"benchScanner yüklenemedi: {e}")
+            return
+        opts = {}
+        for part in arg.split():
+            key, sep, val = part.partition("=")
+            if not sep:
+                print("Kullanım: bench open=50 closed=50 slow=5 banner=5 delay=0.2 rounds=1 json=bench.json")
+                return
+            opts[key.lower()] = val
+        try:
+            counts = {k: int(opts[k]) for k in benchScanner.KINDS if k in opts}
+            delay = float(opts.get("delay", 0.2))
+            rounds = max(1, int(opts.get("rounds", 1)))
+        except ValueError:
+            print("Sayısal değerler geçersiz.")
+            return
+        path = opts.get("json")
+        # aynı dosyaya önceki çalıştırma varsa onunla karşılaştır
+        previous = benchScanner.load_report(path) if path else None
+        try:
+            report = benchScanner.run_bench(counts, delay, self.timeout, self.max_workers, rounds)
+        except KeyboardInterrupt:
+            print("\n[!] Kıyaslama durduruldu (Ctrl+C).")
+            return
+        print(benchScanner.format_report(report, previous))
+        if path:
+            try:
+                benchScanner.save_report(report, path)
+                print(f"Kaydedildi: {path}")
+            except OSError as e:
+                print(f"Dosya yazma hatası: {e}")
+
+    def _wrapped_command(self, arg, usage):
+        """'profile' / 'memprofile' argümanları: [seçenek=değer ...] <komut> (varsayılan: scan)."""
+        opts, rest = {}, arg.split()
+        while rest and "=" in rest[0]:
+            key, _, val = rest.pop(0).partition("=")
+            opts[key.lower()] = val
+        command = " ".join(rest) or "scan"
+        if command.split()[0].lower() in ("profile", "memprofile"):
+            print(usage)
+            return None, None
+        return opts, command
+
+    def do_profile(self, arg):
+        "profile [sampling=1] [interval=ms] [out=dosya] [komut]  -- komutu (varsayılan scan) cProfile veya örnekleme ile profiller"
+        opts, command = self._wrapped_command(arg, "Kullanım: profile scan | profile sampling=1 out=prof.txt scan")
+        if command is None:
+            return
+        sampling = opts.get("sampling", "0").lower() in ("1", "true", "yes", "evet")
+        try:
+            interval = float(opts.get("interval", 5)) / 1000
+        except ValueError:
+            print("interval milisaniye olmalı.")
+            return
+        try:
+            _, path = profile_call(lambda: self.onecmd(command), opts.get("out"), sampling, interval)
+        except OSError as e:
+            print(f"Profil yazılamadı: {e}")
+            return
+        print(f"Profil kaydedildi: {path}")
+
+    def do_memprofile(self, arg):
+        "memprofile [frames=N] [out=dosya] [komut]  -- komutu (varsayılan scan) tracemalloc ile çalıştırır, en çok ayıran yerleri yazar"
+        opts, command = self._wrapped_command(arg, "Kullanım: memprofile scan | memprofile out=mem.txt scan")
+        if command is None:
+            return
+        try:
+            frames = max(1, int(opts.get("frames", 25)))
+        except ValueError:
+            print("frames tam sayı olmalı.")
+            return
+        try:
+            _, path = memprofile_call(lambda: self.onecmd(command), opts.get("out"), frames)
+        except OSError as e:
+            print(f"Bellek profili yazılamadı: {e}")
+            return
+        print(f"Bellek profili kaydedildi: {path}")
+
+    def do_show(self, arg):
+        "show [all|open]  -- son tarama sonuçlarını gösterir (default all)"
+        mode = arg.strip().lower() or "all"
+        if not self.results:
+            print("Henüz sonuç yok.")
+            return
+        print(f"Sonuçlar (hedef sayısı: {len(self.targets)}):")
+        for (host,port) in sorted(self.results):
+            is_open, banner = self.results[(host,port)]
+            if mode == "open" and not is_open:
+                continue
+            status = "OPEN" if is_open else "closed"
+            line = f"  {host}:{port} - {status}"
+            if is_open and banner:
+                line += f"  Banner: {banner}"
+            print(line)
+
+    def do_check(self, arg):
+        "check <host> <port>  -- belirli host/port için kayıtlı bilgileri gösterir"
+        parts = arg.split()
+        if len(parts) != 2:
+            print("Kullanım: check 192.168.1.10 22")
+            return
+        host, p = parts[0], parts[1]
+        try:
+            p = int(p)
+        except Exception:
+            print("Port tam sayı olmalı")
+            return
+        key = (host, p)
+        if key not in self.results:
+            print("Bu host/port için sonuç yok. Önce scan çalıştırın.")
+            return
+        is_open, banner = self.results[key]
+        if not is_open:
+            print(f"{host}:{p} kapalı.")
+            return
+        print(f"{host}:{p} açık. Banner: {banner}")
+
+    def do_save(self, arg):
+        "save <dosya.csv>  -- sonuçları CSV'ye kaydeder"
+        filename = arg.strip() or "scan_results.csv"
+        if not self.results:
+            print("Kaydedilecek sonuç yok.")
+            return
+        try:
+            with open(filename, "w", newline="", encoding="utf-8") as f:
+                w = csv.writer(f)
+                w.writerow(["target", "ip", "port", "open", "banner"])
+                for (host,port) in sorted(self.results):
+                    is_open, banner = self.results[(host,port)]
+                    try:
+                        ip = socket.gethostbyname(host)
+                    except Exception:
+                        ip = ""
+                    w.writerow([host, ip, port, is_open, banner])
+            print(f"Kaydedildi: {filename}")
+        except Exception as e:
+            print(f"Dosya yazma hatası: {e}")
+
+    def do_clear(self, arg):
+        "clear  -- sadece önceki sonuçları temizler (targets ve ports korunur)"
+        self.results.clear()
+        print("Sonuçlar temizlendi. (targets ve ports korunuyor)")
+
+    def do_exit(self, arg):
+        "exit  -- çıkış"
+        print("Çıkılıyor...")
+        if self.history is not None:
+            self.history.close()
+        return True
+
+    def do_quit(self, arg):
+        "quit  -- alias for exit"
+        return self.do_exit(arg)
+
+    def emptyline(self):
+        pass
+
+    def do_EOF(self, arg):
+        print(" (EOF) Çıkılıyor...")
+        if self.history is not None:
+            self.history.close()
+        return True
+
+if __name__ == '__main__':
+    ScannerShell().cmdloop()
@@ -1,353 +1,484 @@
-#!/usr/bin/env python3
-"""
-menu_scanner.py
-
-Menü tabanlı taşınabilir port ve IP tarayıcı.
-FSociety-style banner ile başlar: "54society" (54 kısmı renkli).
-
-Kullanım:
-    python menu_scanner.py           # varsayılan renk: green
-    python menu_scanner.py --color red
-
-UYARI: Yalnızca izniniz olan hedeflerde kullanın. İzinsiz tarama yasa dışıdır.
-"""
-from __future__ import annotations
-
-import socket
-import ipaddress
-import argparse
-import sys
-from typing import List, Tuple
-
-COMMON_PORTS = [21,22,23,25,53,80,110,135,139,143,443,445,587,8080,8443,3306,3389]
-
-# ----------------------------
-# Banner (FSociety-like "54society")
-# ----------------------------
-def print_banner(color: str = "green") -> None:
-    """
-    color: "green" or "red"
-    """
-    GREEN = "\033[32m"
-    RED   = "\033[31m"
-    BOLD  = "\033[1m"
-    END   = "\033[0m"
-
-    col = GREEN if color.lower() == "green" else RED
-    try:
-        # If colorama is installed (Windows), init for proper color handling
-        import colorama  # type: ignore
-        colorama.init()
-    except Exception:
-        pass
-
-    logo_lines = [
-        f"{col}54{END}society       _____ ____   ____  _____",
-        f"{col}54{END}society      |  ___|  _ \\ / ___|| ____|",
-        f"{col}54{END}society      | |_  | | | | |  _ |  _|",
-        f"{col}54{END}society      |  _| | |_| | |_| || |___",
-        f"{col}54{END}society      |_|   |____/ \\____||_____|",
-    ]
-    header = f"{BOLD}{col}DarkScanner — 54society Edition{END}\n"
-    print(header + "\n".join(logo_lines) + "\n")
-    print("Eğitim amaçlıdır — yalnızca izinli hedeflerde kullanın.\n")
-
-# ----------------------------
-# Networking helpers
-# ----------------------------
-def scan_port(host: str, port: int, timeout: float = 0.6) -> Tuple[bool, str]:
-    """
-    Basit TCP connect port scan. Return (is_open, banner_or_error).
-    """
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        res = sock.connect_ex((host, port))
-        if res == 0:
-            # try to grab a small banner
-            banner = ""
-            try:
-                sock.settimeout(0.4)
-                # send simple newline to provoke banner for some services
-                sock.sendall(b"\r\n")
-                banner = sock.recv(1024).decode(errors="ignore").strip()
-            except Exception:
-                banner = ""
-            finally:
-                try:
-                    sock.close()
-                except Exception:
-                    pass
-            return True, banner
-        try:
-            sock.close()
-        except Exception:
-            pass
-        return False, ""
-    except Exception as e:
-        return False, str(e)
-
-def expand_targets(spec: str) -> List[str]:
-    """
-    Desteklenen formatlar:
-      - Tek host: "example.com" veya "192.168.1.10"
-      - Aralık: "192.168.1.1-192.168.1.50"
-      - CIDR: "192.168.1.0/28"
-    """
-    spec = (spec or "").strip()
-    if not spec:
-        return []
-    # CIDR
-    try:
-        if '/' in spec:
-            net = ipaddress.ip_network(spec, strict=False)
-            return [str(ip) for ip in net.hosts()]
-    except Exception:
-        pass
-    # range a-b (IPv4)
-    if '-' in spec and not any(c.isalpha() for c in spec):
-        try:
-            a, b = spec.split('-', 1)
-            start = ipaddress.IPv4Address(a.strip())
-            end = ipaddress.IPv4Address(b.strip())
-            if int(start) > int(end):
-                start, end = end, start
-            alist = []
-            cur = int(start)
-            while cur <= int(end):
-                alist.append(str(ipaddress.IPv4Address(cur)))
-                cur += 1
-            return alist
-        except Exception:
-            pass
-    # single host (domain or ip)
-    return [spec]
-
-# ----------------------------
-# Menu operations
-# ----------------------------
-def single_port_scan() -> None:
-    hedef = input("Hedef IP veya domain girin: ").strip()
-    if not hedef:
-        print("Hedef boş. İptal.")
-        return
-    try:
-        ip = socket.gethostbyname(hedef)
-    except Exception as e:
-        print(f"DNS çözümlenemedi: {e}")
-        return
-    try:
-        port = int(input("Taranacak port (ör. 80): ").strip() or "80")
-    except ValueError:
-        print("Geçersiz port.")
-        return
-    print(f"{hedef} ({ip}) üzerinde port {port} taranıyor...")
-    is_open, banner = scan_port(ip, port)
-    if is_open:
-        print(f"[+] {port} açık. Banner: {banner if banner else '(yok)'}")
-    else:
-        print(f"[-] {port} kapalı veya yanıtsız")
-
-def port_range_scan() -> None:
-    hedef = input("Hedef IP veya domain girin: ").strip()
-    if not hedef:
-        print("Hedef boş. İptal.")
-        return
-    try:
-        ip = socket.gethostbyname(hedef)
-    except Exception as e:
-        print(f"DNS çözümlenemedi: {e}")
-        return
-    try:
-        bas_port = int(input("Başlangıç portu: ").strip())
-        bit_port = int(input("Bitiş portu: ").strip())
-    except ValueError:
-        print("Geçersiz port aralığı.")
-        return
-    if bas_port > bit_port:
-        bas_port, bit_port = bit_port, bas_port
-    print(f"{hedef} ({ip}) üzerinde {bas_port}-{bit_port} aralığı taranıyor...")
-    try:
-        for port in range(bas_port, bit_port + 1):
-            is_open, banner = scan_port(ip, port)
-            if is_open:
-                print(f"[OPEN] {port}  {('Banner: ' + banner) if banner else ''}")
-    except KeyboardInterrupt:
-        print("\n[!] Tarama durduruldu (Ctrl+C).")
-
-def common_ports_scan() -> None:
-    hedef = input("Hedef IP veya domain girin: ").strip()
-    if not hedef:
-        print("Hedef boş. İptal.")
-        return
-    try:
-        ip = socket.gethostbyname(hedef)
-    except Exception as e:
-        print(f"DNS çözümlenemedi: {e}")
-        return
-    print(f"{hedef} ({ip}) üzerinde yaygın portlar taranıyor...")
-    try:
-        for p in COMMON_PORTS:
-            is_open, banner = scan_port(ip, p)
-            if is_open:
-                print(f"[OPEN] {p}  {('Banner: ' + banner) if banner else ''}")
-    except KeyboardInterrupt:
-        print("\n[!] Tarama durduruldu (Ctrl+C).")
-
-def ip_range_scan() -> None:
-    spec = input("IP aralığı veya CIDR girin (örn. 192.168.1.1-192.168.1.50 veya 192.168.1.0/28): ").strip()
-    targets = expand_targets(spec)
-    if not targets:
-        print("Geçerli bir aralık girin.")
-        return
-    ports_raw = input("Port(lar) (virgülle veya aralıkla: 22,80,1000-1010) [boş=COMMON_PORTS]: ").strip()
-    if not ports_raw:
-        ports = COMMON_PORTS.copy()
-    else:
-        ports = []
-        for part in ports_raw.split(','):
-            part = part.strip()
-            if not part:
-                continue
-            if '-' in part:
-                try:
-                    a,b = part.split('-',1)
-                    a=int(a); b=int(b)
-                    if a>b: a,b = b,a
-                    ports.extend(range(max(1,a), min(65535,b)+1))
-                except Exception:
-                    continue
-            else:
-                try:
-                    v=int(part)
-                    ports.append(v)
-                except Exception:
-                    continue
-    ports = sorted(set(ports))
-    print(f"{len(targets)} host taranıyor, her host için {len(ports)} port...")
-    try:
-        for host in targets:
-            try:
-                ip = socket.gethostbyname(host)
-            except Exception as e:
-                print(f"{host} çözümlenemedi: {e}")
-                continue
-            print(f"\n--- {host} ({ip}) taranıyor ---")
-            for p in ports:
-                is_open, banner = scan_port(ip, p)
-                if is_open:
-                    print(f"[OPEN] {host}:{p}  {('Banner: ' + banner) if banner else ''}")
-    except KeyboardInterrupt:
-        print("\n[!] IP aralığı taraması durduruldu.")
-
-def scan_from_file() -> None:
-    path = input("Hedef dosyası yolunu gir (her satırda bir IP/domain): ").strip()
-    try:
-        with open(path, 'r', encoding='utf-8') as f:
-            lines = [l.strip() for l in f if l.strip()]
-    except Exception as e:
-        print(f"Dosya açılamadı: {e}")
-        return
-    ports_raw = input("Port(lar) (virgülle veya aralıkla) [boş=COMMON_PORTS]: ").strip()
-    if not ports_raw:
-        ports = COMMON_PORTS.copy()
-    else:
-        ports = []
-        for part in ports_raw.split(','):
-            part = part.strip()
-            if not part:
-                continue
-            if '-' in part:
-                try:
-                    a,b = part.split('-',1)
-                    a=int(a); b=int(b)
-                    if a>b: a,b = b,a
-                    ports.extend(range(max(1,a), min(65535,b)+1))
-                except Exception:
-                    continue
-            else:
-                try:
-                    v=int(part)
-                    ports.append(v)
-                except Exception:
-                    continue
-    ports = sorted(set(ports))
-    print(f"{len(lines)} hedef dosyadan okunup taranıyor...")
-    try:
-        for host in lines:
-            try:
-                ip = socket.gethostbyname(host)
-            except Exception as e:
-                print(f"{host} çözümlenemedi: {e}")
-                continue
-            for p in ports:
-                is_open, banner = scan_port(ip, p)
-                if is_open:
-                    print(f"[OPEN] {host}:{p}  {('Banner: ' + banner) if banner else ''}")
-    except KeyboardInterrupt:
-        print("\n[!] Dosyadan tarama durduruldu.")
-
-# ----------------------------
-# Menu
-# ----------------------------
-def show_menu() -> None:
-    print("""
-    ==============================
-       Geliştirilmiş Menü Tabanlı Tarayıcı
-    ==============================
-    1) Tek port tara
-    2) Port aralığı tara (tek host)
-    3) Yaygın portları tara (tek host)
-    4) IP aralığı veya CIDR tara (çoklu host)
-    5) Hedefleri dosyadan tara
-    6) Çık
-    """)
-
-def main() -> None:
-    parser = argparse.ArgumentParser(description="Menu-based portable scanner (54society banner).")
-    parser.add_argument("--color", choices=["green","red"], default="green",
-                        help="Banner color for '54' (green or red). Default: green")
-    args = parser.parse_args()
-
-    # print banner
-    print_banner(args.color)
-
-    while True:
-        show_menu()
-        try:
-            secim = input("Seçiminiz (1-6): ").strip()
-        except (EOFError, KeyboardInterrupt):
-            print("\nÇıkılıyor...")
-            break
-        if secim == "1":
-            single_port_scan()
-        elif secim == "2":
-            port_range_scan()
-        elif secim == "3":
-            hedef = input("Hedef IP/domain gir: ").strip()
-            if hedef:
-                try:
-                    # reuse common_ports_scan but allow direct call that resolves host inside
-                    ip = socket.gethostbyname(hedef)
-                    print(f"{hedef} ({ip}) üzerinde yaygın portlar taranıyor...")
-                    for p in COMMON_PORTS:
-                        is_open, banner = scan_port(ip, p)
-                        if is_open:
-                            print(f"[OPEN] {p}  {('Banner: ' + banner) if banner else ''}")
-                except Exception as e:
-                    print(f"DNS çözümlenemedi: {e}")
-        elif secim == "4":
-            ip_range_scan()
-        elif secim == "5":
-            scan_from_file()
-        elif secim == "6":
-            print("Çıkılıyor...")
-            break
-        else:
-            print("Geçersiz seçim. Lütfen 1-6 arası bir sayı girin.")
-
-if __name__ == "__main__":
-    try:
-        main()
-    except KeyboardInterrupt:
-        print("\nÇıkış (Ctrl+C)")
+#!/usr/bin/env python3
+"""
+menu_scanner.py
+
+Menü tabanlı taşınabilir port ve IP tarayıcı.
+FSociety-style banner ile başlar: "54society" (54 kısmı renkli).
+
+Kullanım:
+    python menu_scanner.py           # varsayılan renk: green
+    python menu_scanner.py --color red
+    python menu_scanner.py --profile            # oturumu cProfile ile profille
+    python menu_scanner.py --profile mem --profile-out mem.txt
+    python menu_scanner.py --source 10.0.0.2,10.0.0.3 --linger0   # çok hızlı taramalar: TIME_WAIT / geçici port
+
+UYARI: Yalnızca izniniz olan hedeflerde kullanın. İzinsiz tarama yasa dışıdır.
+"""
+from __future__ import annotations
+
+import socket
+import ipaddress
+import argparse
+import errno
+import time
+from typing import List, Tuple
+
+from consoleScanner import SourcePool, ephemeral_usage
+
+COMMON_PORTS = [21,22,23,25,53,80,110,135,139,143,443,445,587,8080,8443,3306,3389]
+# kaynak adres havuzu ve kapanış şekli, consoleScanner'ın 'net' komutundaki ile aynı:
+# --source ile adresler, --linger0 ile SO_LINGER 0 (RST, TIME_WAIT yok; varsayılan kapalı)
+SOURCE = SourcePool()
+
+# ----------------------------
+# Banner (FSociety-like "54society")
+# ----------------------------
+def print_banner(color: str = "green") -> None:
+    """
+    color: "green" or "red"
+    """
+    GREEN = "\033[32m"
+    RED   = "\033[31m"
+    BOLD  = "\033[1m"
+    END   = "\033[0m"
+
+    col = GREEN if color.lower() == "green" else RED
+    try:
+        # If colorama is installed (Windows), init for proper color handling
+        import colorama  # type: ignore
+        colorama.init()
+    except Exception:
+        pass
+
+    logo_lines = [
+        f"{col}54{END}society       _____ ____   ____  _____",
+        f"{col}54{END}society      |  ___|  _ \\ / ___|| ____|",
+        f"{col}54{END}society      | |_  | | | | |  _ |  _|",
+        f"{col}54{END}society      |  _| | |_| | |_| || |___",
+        f"{col}54{END}society      |_|   |____/ \\____||_____|",
+    ]
+    header = f"{BOLD}{col}DarkScanner — 54society Edition{END}\n"
+    print(header + "\n".join(logo_lines) + "\n")
+    print("Eğitim amaçlıdır — yalnızca izinli hedeflerde kullanın.\n")
+
+# ----------------------------
+# Networking helpers
+# ----------------------------
+def scan_port(host: str, port: int, timeout: float = 0.6, source: SourcePool = None) -> Tuple[bool, str]:
+    """
+    Basit TCP connect port scan. Return (is_open, banner_or_error).
+    source: soketin alındığı ve kapatıldığı SourcePool (None -> SOURCE). Geçici portlar
+    tükenirse (EADDRNOTAVAIL) kısa bekleyip yeniden dener, source.exhausted sayılır.
+    """
+    if source is None:
+        source = SOURCE
+    sock = None
+    try:
+        for attempt in range(SourcePool.RETRIES):
+            sock = source.socket()
+            sock.settimeout(timeout)
+            res = sock.connect_ex((host, port))
+            if res != errno.EADDRNOTAVAIL:
+                break
+            sock.close()
+            sock = None
+            source.exhausted += 1
+            time.sleep(0.01 * (attempt + 1))
+        if res == 0:
+            # try to grab a small banner
+            banner = ""
+            try:
+                sock.settimeout(0.4)
+                # send simple newline to provoke banner for some services
+                sock.sendall(b"\r\n")
+                banner = sock.recv(1024).decode(errors="ignore").strip()
+            except Exception:
+                banner = ""
+            return True, banner
+        return False, ""
+    except Exception as e:
+        return False, str(e)
+    finally:
+        # connect_ex gaierror/OSError atsa da soket kapanır
+        if sock is not None:
+            try:
+                source.close(sock)
+            except OSError:
+                pass
+
+def report_ephemeral() -> None:
+    """Geçici portlar tükendiyse (EADDRNOTAVAIL) uyar ve port kullanımını göster."""
+    if not SOURCE.exhausted:
+        return
+    print(f"[!] Geçici portlar {SOURCE.exhausted} kez tükendi; --source ile kaynak adres ekleyin "
+          f"veya --linger0 kullanın.")
+    SOURCE.exhausted = 0
+    usage = ephemeral_usage()
+    if usage is not None:
+        lo, hi = usage["range"]
+        print(f"Geçici portlar: {lo}-{hi} ({usage['size']})  kullanımda {usage['in_use']}  "
+              f"TIME_WAIT {usage['time_wait']}")
+
+def expand_targets(spec: str) -> List[str]:
+    """
+    Desteklenen formatlar:
+      - Tek host: "example.com" veya "192.168.1.10"
+      - Aralık: "192.168.1.1-192.168.1.50"
+      - CIDR: "192.168.1.0/28"
+    """
+    spec = (spec or "").strip()
+    if not spec:
+        return []
+    # CIDR
+    try:
+        if '/' in spec:
+            net = ipaddress.ip_network(spec, strict=False)
+            return [str(ip) for ip in net.hosts()]
+    except Exception:
+        pass
+    # range a-b (IPv4)
+    if '-' in spec and not any(c.isalpha() for c in spec):
+        try:
+            a, b = spec.split('-', 1)
+            start = ipaddress.IPv4Address(a.strip())
+            end = ipaddress.IPv4Address(b.strip())
+            if int(start) > int(end):
+                start, end = end, start
+            alist = []
+            cur = int(start)
+            while cur <= int(end):
+                alist.append(str(ipaddress.IPv4Address(cur)))
+                cur += 1
+            return alist
+        except Exception:
+            pass
+    # single host (domain or ip)
+    return [spec]
+
+def discover_targets(targets: List[str]) -> List[str]:
+    """
+    İsteğe bağlı canlı host keşfi (consoleScanner.discover_hosts): birkaç yaygın TCP portu
+    (ve yetki varsa ICMP) ile yanıt vermeyen hostlar elenir. Varsayılan hayır: Enter'da liste aynen döner.
+    """
+    cevap = input(f"{len(targets)} host için önce canlı host keşfi yapılsın mı? [e/H]: ").strip().lower()
+    if cevap not in ("e", "y", "evet", "yes"):
+        return targets
+    try:
+        from consoleScanner import discover_hosts
+    except ImportError as e:
+        print(f"Keşif kullanılamıyor ({e}); tüm hostlar taranacak.")
+        return targets
+    try:
+        alive = discover_hosts(targets, on_error=lambda h, e: print(f"{h} çözümlenemedi: {e}"),
+                               linger0=SOURCE.linger0)
+    except KeyboardInterrupt:
+        print("\n[!] Keşif durduruldu; tüm hostlar taranacak.")
+        return targets
+    print(f"Keşif: {len(alive)}/{len(targets)} host yanıt verdi.")
+    return alive
+
+# ----------------------------
+# Menu operations
+# ----------------------------
+def single_port_scan() -> None:
+    hedef = input("Hedef IP veya domain girin: ").strip()
+    if not hedef:
+        print("Hedef boş. İptal.")
+        return
+    try:
+        ip = socket.gethostbyname(hedef)
+    except Exception as e:
+        print(f"DNS çözümlenemedi: {e}")
+        return
+    try:
+        port = int(input("Taranacak port (ör. 80): ").strip() or "80")
+    except ValueError:
+        print("Geçersiz port.")
+        return
+    print(f"{hedef} ({ip}) üzerinde port {port} taranıyor...")
+    is_open, banner = scan_port(ip, port)
+    if is_open:
+        print(f"[+] {port} açık. Banner: {banner if banner else '(yok)'}")
+    else:
+        print(f"[-] {port} kapalı veya yanıtsız")
+
+def port_range_scan() -> None:
+    hedef = input("Hedef IP veya domain girin: ").strip()
+    if not hedef:
+        print("Hedef boş. İptal.")
+        return
+    try:
+        ip = socket.gethostbyname(hedef)
+    except Exception as e:
+        print(f"DNS çözümlenemedi: {e}")
+        return
+    try:
+        bas_port = int(input("Başlangıç portu: ").strip())
+        bit_port = int(input("Bitiş portu: ").strip())
+    except ValueError:
+        print("Geçersiz port aralığı.")
+        return
+    if bas_port > bit_port:
+        bas_port, bit_port = bit_port, bas_port
+    print(f"{hedef} ({ip}) üzerinde {bas_port}-{bit_port} aralığı taranıyor...")
+    try:
+        for port in range(bas_port, bit_port + 1):
+            is_open, banner = scan_port(ip, port)
+            if is_open:
+                print(f"[OPEN] {port}  {('Banner: ' + banner) if banner else ''}")
+    except KeyboardInterrupt:
+        print("\n[!] Tarama durduruldu (Ctrl+C).")
+
+def common_ports_scan() -> None:
+    hedef = input("Hedef IP veya domain girin: ").strip()
+    if not hedef:
+        print("Hedef boş. İptal.")
+        return
+    try:
+        ip = socket.gethostbyname(hedef)
+    except Exception as e:
+        print(f"DNS çözümlenemedi: {e}")
+        return
+    print(f"{hedef} ({ip}) üzerinde yaygın portlar taranıyor...")
+    try:
+        for p in COMMON_PORTS:
+            is_open, banner = scan_port(ip, p)
+            if is_open:
+                print(f"[OPEN] {p}  {('Banner: ' + banner) if banner else ''}")
+    except KeyboardInterrupt:
+        print("\n[!] Tarama durduruldu (Ctrl+C).")
+
+def ip_range_scan() -> None:
+    spec = input("IP aralığı veya CIDR girin (örn. 192.168.1.1-192.168.1.50 veya 192.168.1.0/28): ").strip()
+    targets = expand_targets(spec)
+    if not targets:
+        print("Geçerli bir aralık girin.")
+        return
+    ports_raw = input("Port(lar) (virgülle veya aralıkla: 22,80,1000-1010) [boş=COMMON_PORTS]: ").strip()
+    if not ports_raw:
+        ports = COMMON_PORTS.copy()
+    else:
+        ports = []
+        for part in ports_raw.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            if '-' in part:
+                try:
+                    a,b = part.split('-',1)
+                    a=int(a); b=int(b)
+                    if a>b: a,b = b,a
+                    ports.extend(range(max(1,a), min(65535,b)+1))
+                except Exception:
+                    continue
+            else:
+                try:
+                    v=int(part)
+                    ports.append(v)
+                except Exception:
+                    continue
+    ports = sorted(set(ports))
+    if len(targets) > 1:
+        targets = discover_targets(targets)
+        if not targets:
+            print("Yanıt veren host yok.")
+            return
+    print(f"{len(targets)} host taranıyor, her host için {len(ports)} port...")
+    try:
+        for host in targets:
+            try:
+                ip = socket.gethostbyname(host)
+            except Exception as e:
+                print(f"{host} çözümlenemedi: {e}")
+                continue
+            print(f"\n--- {host} ({ip}) taranıyor ---")
+            for p in ports:
+                is_open, banner = scan_port(ip, p)
+                if is_open:
+                    print(f"[OPEN] {host}:{p}  {('Banner: ' + banner) if banner else ''}")
+    except KeyboardInterrupt:
+        print("\n[!] IP aralığı taraması durduruldu.")
+
+def scan_from_file() -> None:
+    path = input("Hedef dosyası yolunu gir (her satırda bir IP/domain): ").strip()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            lines = [l.strip() for l in f if l.strip()]
+    except Exception as e:
+        print(f"Dosya açılamadı: {e}")
+        return
+    ports_raw = input("Port(lar) (virgülle veya aralıkla) [boş=COMMON_PORTS]: ").strip()
+    if not ports_raw:
+        ports = COMMON_PORTS.copy()
+    else:
+        ports = []
+        for part in ports_raw.split(','):
+            part = part.strip()
+            if not part:
+                continue
+            if '-' in part:
+                try:
+                    a,b = part.split('-',1)
+                    a=int(a); b=int(b)
+                    if a>b: a,b = b,a
+                    ports.extend(range(max(1,a), min(65535,b)+1))
+                except Exception:
+                    continue
+            else:
+                try:
+                    v=int(part)
+                    ports.append(v)
+                except Exception:
+                    continue
+    ports = sorted(set(ports))
+    print(f"{len(lines)} hedef dosyadan okunup taranıyor...")
+    try:
+        for host in lines:
+            try:
+                ip = socket.gethostbyname(host)
+            except Exception as e:
+                print(f"{host} çözümlenemedi: {e}")
+                continue
+            for p in ports:
+                is_open, banner = scan_port(ip, p)
+                if is_open:
+                    print(f"[OPEN] {host}:{p}  {('Banner: ' + banner) if banner else ''}")
+    except KeyboardInterrupt:
+        print("\n[!] Dosyadan tarama durduruldu.")
+
+def udp_scan_menu() -> None:
+    try:
+        import udpScanner
+    except ImportError as e:
+        print(f"UDP motoru yüklenemedi: {e}")
+        return
+    spec = input("Hedef IP/domain, aralık veya CIDR girin: ").strip()
+    targets = expand_targets(spec)
+    if not targets:
+        print("Hedef boş. İptal.")
+        return
+    ports_raw = input(f"UDP port(lar) [boş={','.join(map(str, udpScanner.DEFAULT_UDP_PORTS))}]: ").strip()
+    ports = udpScanner.parse_ports(ports_raw) if ports_raw else list(udpScanner.DEFAULT_UDP_PORTS)
+    if not ports:
+        print("Geçerli bir port listesi girin.")
+        return
+    print(f"{len(targets)} host x {len(ports)} UDP port taranıyor...")
+
+    def on_result(host: str, ip: str, port: int, status: str, data: bytes) -> None:
+        if status == "open":
+            print(f"[OPEN] {host}:{port}/udp  Banner: {udpScanner.describe(port, data)}")
+
+    try:
+        counts = udpScanner.udp_scan(targets, ports, timeout=1.0, retries=1, on_result=on_result,
+                                     on_error=lambda h, e: print(f"{h} çözümlenemedi: {e}"))
+    except KeyboardInterrupt:
+        print("\n[!] UDP taraması durduruldu.")
+        return
+    print(f"Tamamlandı: açık {counts.get('open', 0)}, kapalı {counts.get('closed', 0)}, "
+          f"yanıtsız (açık|filtreli) {counts.get('timeout', 0)}")
+
+# ----------------------------
+# Menu
+# ----------------------------
+def show_menu() -> None:
+    print("""
+    ==============================
+       Geliştirilmiş Menü Tabanlı Tarayıcı
+    ==============================
+    1) Tek port tara
+    2) Port aralığı tara (tek host)
+    3) Yaygın portları tara (tek host)
+    4) IP aralığı veya CIDR tara (çoklu host)
+    5) Hedefleri dosyadan tara
+    6) Çık
+    7) UDP servis taraması (DNS/NTP/SNMP...)
+    """)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Menu-based portable scanner (54society banner).")
+    parser.add_argument("--color", choices=["green","red"], default="green",
+                        help="Banner color for '54' (green or red). Default: green")
+    parser.add_argument("--linger0", action="store_true",
+                        help="Close probe sockets with SO_LINGER 0 (RST, no TIME_WAIT) for very fast scans")
+    parser.add_argument("--source", default="",
+                        help="Comma separated local addresses to bind probes to (more ephemeral ports)")
+    parser.add_argument("--profile", nargs="?", const="cpu", choices=["cpu", "sampling", "mem"],
+                        help="Profile the session: cpu (cProfile), sampling (stack sampler) or mem (tracemalloc)")
+    parser.add_argument("--profile-out", default=None, help="Profile output file (default: scan_<kind>_<time>.txt)")
+    args = parser.parse_args()
+    SOURCE.linger0 = args.linger0
+    addrs = [a.strip() for a in args.source.split(",") if a.strip()]
+    for a in addrs:
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+                probe.bind((a, 0))
+        except OSError as e:
+            parser.error(f"kaynak adres kullanılamaz: {a} ({e})")
+    SOURCE.addrs = addrs
+
+    # print banner
+    print_banner(args.color)
+
+    if not args.profile:
+        run_menu()
+        return
+    # profil kancaları consoleScanner'da (profile / memprofile komutlarıyla aynı)
+    try:
+        import consoleScanner
+    except ImportError as e:
+        print(f"Profil kancaları yüklenemedi ({e}); profilsiz devam ediliyor.")
+        run_menu()
+        return
+    try:
+        if args.profile == "mem":
+            _, path = consoleScanner.memprofile_call(run_menu, args.profile_out)
+        else:
+            _, path = consoleScanner.profile_call(run_menu, args.profile_out, sampling=args.profile == "sampling")
+    except OSError as e:
+        print(f"Profil yazılamadı: {e}")
+        return
+    print(f"Profil kaydedildi: {path}")
+
+def run_menu() -> None:
+    while True:
+        show_menu()
+        try:
+            secim = input("Seçiminiz (1-7): ").strip()
+        except (EOFError, KeyboardInterrupt):
+            print("\nÇıkılıyor...")
+            break
+        if secim == "1":
+            single_port_scan()
+        elif secim == "2":
+            port_range_scan()
+        elif secim == "3":
+            hedef = input("Hedef IP/domain gir: ").strip()
+            if hedef:
+                try:
+                    # reuse common_ports_scan but allow direct call that resolves host inside
+                    ip = socket.gethostbyname(hedef)
+                    print(f"{hedef} ({ip}) üzerinde yaygın portlar taranıyor...")
+                    for p in COMMON_PORTS:
+                        is_open, banner = scan_port(ip, p)
+                        if is_open:
+                            print(f"[OPEN] {p}  {('Banner: ' + banner) if banner else ''}")
+                except Exception as e:
+                    print(f"DNS çözümlenemedi: {e}")
+        elif secim == "4":
+            ip_range_scan()
+        elif secim == "5":
+            scan_from_file()
+        elif secim == "6":
+            print("Çıkılıyor...")
+            break
+        elif secim == "7":
+            udp_scan_menu()
+        else:
+            print("Geçersiz seçim. Lütfen 1-7 arası bir sayı girin.")
+        report_ephemeral()
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\nÇıkış (Ctrl+C)")
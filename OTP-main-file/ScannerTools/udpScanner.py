@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+udpScanner.py
+
+UDP servis tarayıcı. Thread veya soket başına deneme yok: tüm denemeler bir (veya birkaç)
+engellemesiz UDP soketinden gönderilir, yanıtlar (ip, port) anahtarlı bir sözlükle eşlenir,
+yeniden gönderimler bir zamanlayıcı çarkıyla (timer wheel) planlanır. Bilinen portlara servise
+özel yük gönderilir (DNS, NTP, SNMP, NetBIOS, SSDP, TFTP), diğerlerine boş satır.
+
+Sonuç durumları:
+    open     : UDP yanıtı geldi
+    closed   : ICMP port unreachable (Linux'ta IP_RECVERR hata kuyruğundan okunur)
+    timeout  : yanıt yok (açık|filtreli) ya da başka bir ICMP unreachable (filtreli)
+
+Kullanım:
+    python udpScanner.py 192.168.1.0/24
+    python udpScanner.py 10.0.0.5 -p 53,123,161 --timeout 1.5 --retries 2
+    python udpScanner.py --self-test --extra 200000     # 127.0.0.0/8 üzerinde yerel yanıtlayıcılarla
+
+consoleScanner'daki 'udpscan' komutu ve menuScanner'ın UDP menüsü de bunu kullanır.
+UYARI: Yalnızca izniniz olan hedeflerde kullanın.
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import errno
+import ipaddress
+import math
+import selectors
+import socket
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# hedef / port sözdizimi tüm tarayıcılarda aynı olsun: consoleScanner'ın ayrıştırıcıları
+from consoleScanner import _FD_PRESSURE, expand_targets, parse_ports
+
+# (host, ip, port, status, yanıt verisi)
+ResultFn = Callable[[str, str, int, str, bytes], None]
+
+# ----------------------------
+# Service payloads
+# ----------------------------
+def _dns_query() -> bytes:
+    # kök NS sorgusu: id, RD, 1 soru; ".", NS, IN
+    return struct.pack("!HHHHHH", 0x4F54, 0x0100, 1, 0, 0, 0) + b"\x00" + struct.pack("!HH", 2, 1)
+
+def _snmp_get() -> bytes:
+    # SNMPv1 GetRequest, community "public", sysDescr.0 (1.3.6.1.2.1.1.1.0)
+    varbind = b"\x30\x0c\x06\x08\x2b\x06\x01\x02\x01\x01\x01\x00\x05\x00"
+    pdu = b"\x02\x04\x4f\x54\x50\x01" + b"\x02\x01\x00" + b"\x02\x01\x00" + b"\x30" + bytes([len(varbind)]) + varbind
+    body = b"\x02\x01\x00" + b"\x04\x06public" + b"\xa0" + bytes([len(pdu)]) + pdu
+    return b"\x30" + bytes([len(body)]) + body
+
+def _nbstat_query() -> bytes:
+    # NetBIOS düğüm durumu sorgusu, ad "*"
+    name = b"\x20" + b"CK" + b"A" * 30 + b"\x00"
+    return struct.pack("!HHHHHH", 0x4F54, 0, 1, 0, 0, 0) + name + struct.pack("!HH", 0x21, 1)
+
+PAYLOADS: Dict[int, bytes] = {
+    53: _dns_query(),
+    69: b"\x00\x01otp\x00octet\x00",                 # TFTP okuma isteği: hata yanıtı da açık demek
+    123: b"\x1b" + b"\x00" * 47,                      # NTP v3 istemci isteği
+    137: _nbstat_query(),
+    161: _snmp_get(),
+    1900: b"M-SEARCH * HTTP/1.1\r\nHOST: 239.255.255.250:1900\r\nMAN: \"ssdp:discover\"\r\nMX: 1\r\nST: ssdp:all\r\n\r\n",
+    5353: _dns_query(),
+}
+GENERIC_PAYLOAD = b"\r\n"
+DEFAULT_UDP_PORTS: List[int] = sorted(PAYLOADS)
+
+def describe(port: int, data: bytes) -> str:
+    """Yanıtın kısa, okunur özeti (banner yerine)."""
+    if port == 123 and len(data) >= 48:
+        return f"NTP v{(data[0] >> 3) & 7} stratum {data[1]}"
+    if port in (53, 5353) and len(data) >= 12:
+        rcode = data[3] & 0x0F
+        answers = struct.unpack("!H", data[6:8])[0]
+        return f"DNS rcode={rcode} yanıt={answers}"
+    if port == 69 and len(data) >= 4 and data[1] == 5:
+        return "TFTP hata yanıtı"
+    # SNMP, SSDP ve diğerleri: en uzun yazdırılabilir parça
+    runs, cur = [], bytearray()
+    for b in data[:512]:
+        if 32 <= b < 127:
+            cur.append(b)
+        else:
+            if len(cur) >= 4:
+                runs.append(cur.decode())
+            cur = bytearray()
+    if len(cur) >= 4:
+        runs.append(cur.decode())
+    if port == 161 and runs:
+        return "SNMP " + max(runs, key=len)[:80]
+    if runs:
+        return max(runs, key=len)[:80].strip()
+    return f"{len(data)} bayt yanıt"
+
+# ----------------------------
+# Timer wheel
+# ----------------------------
+class TimerWheel:
+    """
+    Sabit adımlı zamanlayıcı çarkı. schedule() O(1): öğe, süresinin dolacağı adımın yuvasına
+    eklenir; çarkın bir turundan uzun süreler aynı yuvada bekler (due ile ayırt edilir).
+    advance(now) süresi dolan öğeleri döndürür. İptal yok: çağıran, dönen öğenin hâlâ
+    geçerli olup olmadığına kendisi bakar.
+    """
+
+    def __init__(self, tick: float = 0.01, slots: int = 1024):
+        self.tick = tick
+        self.slots = slots
+        self._wheel: List[list] = [[] for _ in range(slots)]
+        self._start = time.monotonic()
+        self._cursor = 0
+        self.count = 0
+
+    def schedule(self, delay: float, item) -> None:
+        due = self._cursor + max(1, math.ceil(delay / self.tick))
+        self._wheel[due % self.slots].append((due, item))
+        self.count += 1
+
+    def advance(self, now: float) -> list:
+        expired = []
+        target = int((now - self._start) / self.tick)
+        while self._cursor < target and self.count:
+            self._cursor += 1
+            idx = self._cursor % self.slots
+            bucket = self._wheel[idx]
+            if not bucket:
+                continue
+            keep = [e for e in bucket if e[0] > self._cursor]
+            if len(keep) != len(bucket):
+                expired.extend(item for due, item in bucket if due <= self._cursor)
+                self._wheel[idx] = keep
+        if not self.count:
+            self._cursor = max(self._cursor, target)
+        self.count -= len(expired)
+        return expired
+
+# ----------------------------
+# Engine
+# ----------------------------
+_IP_RECVERR = getattr(socket, "IP_RECVERR", 11)
+_MSG_ERRQUEUE = getattr(socket, "MSG_ERRQUEUE", 0x2000)
+_SO_EE_ORIGIN_ICMP = 2
+_NOBUFS = {errno.ENOBUFS, errno.EAGAIN, errno.EWOULDBLOCK}
+# önceki bir denemenin ICMP hatası soketin bekleyen hatası olarak sonraki sendto'dan döner
+_STALE = {errno.ECONNREFUSED, errno.EHOSTUNREACH, errno.ENETUNREACH, errno.EHOSTDOWN}
+
+def _udp_socket() -> socket.socket:
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    s.setblocking(False)
+    for opt, size in ((socket.SO_RCVBUF, 4 << 20), (socket.SO_SNDBUF, 1 << 20)):
+        try:
+            s.setsockopt(socket.SOL_SOCKET, opt, size)
+        except OSError:
+            pass
+    if sys.platform.startswith("linux"):
+        # ICMP hataları bağlanmamış sokette de hedef adresiyle birlikte hata kuyruğuna düşer
+        s.setsockopt(socket.IPPROTO_IP, _IP_RECVERR, 1)
+    elif hasattr(socket, "SIO_UDP_CONNRESET"):
+        # Windows: port unreachable recvfrom'u WSAECONNRESET ile bozmasın
+        s.ioctl(socket.SIO_UDP_CONNRESET, False)
+    s.bind(("0.0.0.0", 0))
+    return s
+
+def resolve(targets: Iterable[str], on_error: Optional[Callable[[str, Exception], None]] = None) -> Dict[str, List[str]]:
+    """{ip: [host, ...]} — aynı IP'ye çözülen isimler tek kez denenir."""
+    by_ip: Dict[str, List[str]] = collections.defaultdict(list)
+    for host in targets:
+        try:
+            ip = str(ipaddress.IPv4Address(host))
+        except ValueError:
+            try:
+                ip = socket.gethostbyname(host)
+            except OSError as e:
+                if on_error is not None:
+                    on_error(host, e)
+                continue
+        by_ip[ip].append(host)
+    return by_ip
+
+def udp_scan(targets: Iterable[str], ports: Iterable[int] = DEFAULT_UDP_PORTS, timeout: float = 1.0,
+             retries: int = 1, rate: float = 0.0, inflight: int = 4096, sockets: int = 1,
+             payloads: Optional[Dict[int, bytes]] = None, on_result: Optional[ResultFn] = None,
+             on_error: Optional[Callable[[str, Exception], None]] = None,
+             stop: Optional[threading.Event] = None, stats=None, budget=None) -> Dict[str, int]:
+    """
+    targets x ports UDP taraması, çağıran thread'de çalışır.
+    rate: saniyede en fazla gönderim (0 = sınırsız), inflight: yanıt beklenen en fazla deneme,
+    retries: yanıtsız denemenin yeniden gönderim sayısı. Her (host, port) için bir kez
+    on_result(host, ip, port, status, data) çağrılır. stats (consoleScanner.ScanStats) verilirse
+    sayaçlar güncellenir. budget (consoleScanner.FdBudget) verilirse soketler ve selector
+    tarama boyunca bütçeden düşülür; EMFILE/ENOBUFS'ta açılış geri çekilip yeniden denenir.
+    -> durum başına sayılar.
+    """
+    ports = list(ports)
+    payloads = dict(PAYLOADS, **(payloads or {}))
+    stop = stop or threading.Event()
+    by_ip = resolve(targets, on_error)
+    counts = collections.Counter()
+    n_socks = max(1, sockets)
+    held = 0
+    if budget is not None:
+        n_socks = min(n_socks, max(1, budget.capacity - 1))
+        if not budget.acquire(n_socks + 1, stop):  # + selector tanımlayıcısı
+            return dict(counts)
+        held = n_socks + 1
+    socks: List[socket.socket] = []
+    sel = None
+    try:
+        sel = _open_with_backoff(selectors.DefaultSelector, budget)
+        for _ in range(n_socks):
+            socks.append(_open_with_backoff(_udp_socket, budget))
+    except BaseException:
+        if sel is not None:
+            sel.close()
+        for s in socks:
+            s.close()
+        if held:
+            budget.release(held)
+        raise
+    for s in socks:
+        sel.register(s, selectors.EVENT_READ)
+    wheel = TimerWheel()
+    pending: Dict[Tuple[str, int], int] = {}     # (ip, port) -> gönderim sayısı
+    resend: collections.deque = collections.deque()
+    probes = ((ip, port) for port in ports for ip in by_ip)  # portlar dışta: yük hostlara yayılır
+    exhausted = False
+    if stats is not None:
+        stats.begin(len(by_ip) * len(ports))
+    allowance, last = 0.0, time.monotonic()
+    burst = max(1.0, rate * 0.02)
+
+    def finish(key, status, data=b""):
+        del pending[key]
+        counts[status] += 1
+        if stats is not None:
+            stats.completed(status)
+        if on_result is not None:
+            ip, port = key
+            for host in by_ip[ip]:
+                on_result(host, ip, port, status, data)
+
+    def send(key) -> bool:
+        ip, port = key
+        sock = socks[hash(key) % len(socks)]
+        for attempt in range(3):
+            try:
+                sock.sendto(payloads.get(port, GENERIC_PAYLOAD), key)
+                break
+            except OSError as e:
+                if e.errno in _NOBUFS:
+                    return False  # gönderim tamponu dolu: sonraki turda tekrar
+                if e.errno in _STALE and attempt < 2:
+                    continue      # başka bir denemeye ait hata okundu ve temizlendi
+                pending[key] = pending.get(key, 0) + 1
+                finish(key, "error")
+                return True
+        pending[key] = pending.get(key, 0) + 1
+        wheel.schedule(timeout, key)
+        return True
+
+    def drain(sock: socket.socket) -> None:
+        # önce ICMP hataları (Linux hata kuyruğu), sonra yanıtlar
+        if sys.platform.startswith("linux"):
+            while True:
+                try:
+                    _, anc, _, addr = sock.recvmsg(512, 512, _MSG_ERRQUEUE)
+                except OSError:
+                    break
+                for level, kind, cdata in anc:
+                    if level == socket.IPPROTO_IP and kind == _IP_RECVERR and len(cdata) >= 7:
+                        _, origin, icmp_type, icmp_code = struct.unpack_from("=IBBB", cdata)
+                        key = (addr[0], addr[1]) if addr else None
+                        if origin == _SO_EE_ORIGIN_ICMP and icmp_type == 3 and key in pending:
+                            finish(key, "closed" if icmp_code == 3 else "timeout")
+        while True:
+            try:
+                data, addr = sock.recvfrom(65535)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                continue  # bekleyen soket hatası (ECONNREFUSED vb.) okunup temizlendi
+            key = (addr[0], addr[1])
+            if key in pending:
+                finish(key, "open", data)
+
+    try:
+        while not stop.is_set():
+            now = time.monotonic()
+            if rate > 0:
+                allowance = min(burst, allowance + (now - last) * rate)
+            last = now
+            for key in wheel.advance(now):
+                tries = pending.get(key)
+                if tries is None:
+                    continue  # yanıtlandı
+                if tries <= retries:
+                    resend.append(key)
+                else:
+                    finish(key, "timeout")
+            # gönderim: önce yeniden gönderimler, sonra yeni denemeler
+            while rate <= 0 or allowance >= 1:
+                if resend:
+                    key = resend[0]
+                    if key not in pending:
+                        resend.popleft()
+                        continue
+                    if not send(key):
+                        break
+                    resend.popleft()
+                elif not exhausted and len(pending) < inflight:
+                    key = next(probes, None)
+                    if key is None:
+                        exhausted = True
+                        break
+                    if stats is not None:
+                        stats.issued()
+                    if not send(key):
+                        resend.append(key)
+                        pending[key] = 0
+                        break
+                else:
+                    break
+                allowance -= 1
+            if exhausted and not pending:
+                break
+            for key, _ in sel.select(wheel.tick):
+                drain(key.fileobj)
+    finally:
+        if stats is not None:
+            stats.end()
+        sel.close()
+        for s in socks:
+            s.close()
+        if held:
+            budget.release(held)
+    return dict(counts)
+
+def _open_with_backoff(factory, budget, attempts=8):
+    """factory()'yi çağırır; tanımlayıcı/tampon sıkıntısında budget ile geri çekilip yeniden dener."""
+    for attempt in range(attempts):
+        try:
+            return factory()
+        except OSError as e:
+            if budget is None or e.errno not in _FD_PRESSURE or attempt == attempts - 1:
+                raise
+            budget.backoff(attempt)
+
+# ----------------------------
+# Loopback responders
+# ----------------------------
+RESPONDER_KINDS = ("open", "silent", "lossy", "closed")
+
+class LoopbackResponder:
+    """
+    Yerel UDP yanıtlayıcıları (tek selector thread'i), testler ve --self-test için.
+    open: her datagrama yanıt verir; silent: dinler ama yanıtlamaz (açık|filtreli);
+    lossy: her kaynaktan gelen ilk datagramı düşürür (yeniden gönderimi sınar);
+    closed: dinleyen yok, çekirdek ICMP port unreachable döner.
+    targets: [(ip, port, kind)]
+    """
+
+    def __init__(self, counts: Optional[Dict[str, int]] = None, host: str = "127.0.0.1"):
+        self.counts = dict({"open": 10, "silent": 5, "lossy": 5, "closed": 10}, **(counts or {}))
+        self.host = host
+        self.targets: List[Tuple[str, int, str]] = []
+        self._sel = selectors.DefaultSelector()
+        self._seen: set = set()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "LoopbackResponder":
+        for kind in RESPONDER_KINDS:
+            for _ in range(max(0, self.counts.get(kind, 0))):
+                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                s.bind((self.host, 0))
+                ip, port = s.getsockname()
+                if kind == "closed":
+                    s.close()
+                else:
+                    s.setblocking(False)
+                    self._sel.register(s, selectors.EVENT_READ, kind)
+                self.targets.append((ip, port, kind))
+        self._thread = threading.Thread(target=self._run, name="udp-responder", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(2)
+        for key in list(self._sel.get_map().values()):
+            key.fileobj.close()
+        self._sel.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            for key, _ in self._sel.select(0.1):
+                sock, kind = key.fileobj, key.data
+                while True:
+                    try:
+                        data, addr = sock.recvfrom(65535)
+                    except OSError:
+                        break
+                    if kind == "silent":
+                        continue
+                    if kind == "lossy" and (addr, sock.getsockname()) not in self._seen:
+                        self._seen.add((addr, sock.getsockname()))
+                        continue
+                    try:
+                        sock.sendto(b"OTP-udp " + kind.encode() + b" " + data[:32], addr)
+                    except OSError:
+                        pass
+
+def self_test(counts: Optional[Dict[str, int]] = None, extra: int = 0, timeout: float = 0.5,
+              retries: int = 1, rate: float = 0.0, inflight: int = 4096, log=print) -> dict:
+    """
+    Yanıtlayıcılara karşı tarar ve doğruluğu ölçer. extra: 127.0.0.0/8 üzerinde dinlenmeyen
+    porta ek kapalı denemeler (yüksek hacim için; loopback'te ICMP hız sınırı yoktur).
+    """
+    expected = {"open": "open", "lossy": "open", "silent": "timeout", "closed": "closed"}
+    with LoopbackResponder(counts) as fleet:
+        want: Dict[Tuple[str, int], str] = {(ip, port): expected[kind] for ip, port, kind in fleet.targets}
+        got: Dict[Tuple[str, int], str] = {}
+
+        def on_result(host, ip, port, status, data):
+            got[(ip, port)] = status
+
+        t0 = time.perf_counter()
+        udp_scan([fleet.host], [port for _, port, _ in fleet.targets], timeout, retries, rate, inflight,
+                 on_result=on_result)
+        if extra:
+            # 127.1.0.0'dan başlayan adreslerde 9/udp (discard; loopback'te dinleyen yok)
+            base = int(ipaddress.IPv4Address("127.1.0.0"))
+            hosts = [str(ipaddress.IPv4Address(base + i)) for i in range(extra)]
+            log(f"{extra} ek kapalı deneme gönderiliyor...")
+            udp_scan(hosts, [9], timeout, retries, rate, inflight, on_result=on_result)
+            want.update({(h, 9): "closed" for h in hosts})
+        elapsed = time.perf_counter() - t0
+    wrong = sorted(k for k, v in want.items() if got.get(k) != v)
+    return {
+        "probes": len(want),
+        "seconds": round(elapsed, 3),
+        "probes_per_sec": round(len(want) / elapsed) if elapsed > 0 else None,
+        "correct": len(want) - len(wrong),
+        "wrong": [(ip, port, want[(ip, port)], got.get((ip, port))) for ip, port in wrong[:20]],
+        "statuses": dict(collections.Counter(got.values())),
+    }
+
+# ----------------------------
+# CLI
+# ----------------------------
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Multiplexed UDP service scanner.")
+    parser.add_argument("targets", nargs="*", help="host, IP, range (a-b) or CIDR")
+    parser.add_argument("-p", "--ports", default=",".join(map(str, DEFAULT_UDP_PORTS)), help="e.g. 53,123,161 or 1-1024")
+    parser.add_argument("--timeout", type=float, default=1.0, help="seconds to wait for a reply before retransmitting")
+    parser.add_argument("--retries", type=int, default=1, help="retransmits per unanswered probe")
+    parser.add_argument("--rate", type=float, default=0, help="max packets per second (0 = unlimited)")
+    parser.add_argument("--inflight", type=int, default=4096, help="max probes awaiting a reply")
+    parser.add_argument("--sockets", type=int, default=1, help="number of UDP sockets to spread probes over")
+    parser.add_argument("--all", action="store_true", help="also print closed and unanswered ports")
+    parser.add_argument("--self-test", action="store_true", help="scan local loopback responders and check results")
+    parser.add_argument("--extra", type=int, default=0, help="self-test: additional closed probes on 127.1.0.0/16+")
+    args = parser.parse_args()
+
+    if args.self_test:
+        r = self_test(extra=args.extra, timeout=min(args.timeout, 0.5), retries=args.retries,
+                      rate=args.rate, inflight=args.inflight)
+        print(f"{r['probes']} deneme, {r['seconds']}s, {r['probes_per_sec']} deneme/s, "
+              f"doğru {r['correct']}/{r['probes']}  {r['statuses']}")
+        for ip, port, want, got in r["wrong"]:
+            print(f"  {ip}:{port} beklenen {want}, alınan {got}")
+        sys.exit(0 if not r["wrong"] else 1)
+    if not args.targets:
+        parser.error("en az bir hedef gerekli (veya --self-test)")
+    targets = [t for spec in args.targets for t in expand_targets(spec)]
+    ports = parse_ports(args.ports)
+    if not targets or not ports:
+        parser.error("geçerli hedef ve port gerekli")
+    labels = {"open": "OPEN", "closed": "closed", "timeout": "open|filtered"}
+
+    def on_result(host, ip, port, status, data):
+        if status == "open":
+            print(f"[OPEN] {host}:{port}/udp  Banner: {describe(port, data)}", flush=True)
+        elif args.all:
+            print(f"[{labels.get(status, status)}] {host}:{port}/udp")
+
+    print(f"{len(targets)} host x {len(ports)} UDP port taranıyor...")
+    t0 = time.time()
+    try:
+        counts = udp_scan(targets, ports, args.timeout, args.retries, args.rate, args.inflight, args.sockets,
+                          on_result=on_result, on_error=lambda h, e: print(f"{h} çözümlenemedi: {e}"))
+    except KeyboardInterrupt:
+        print("\n[!] Tarama durduruldu (Ctrl+C).")
+        return
+    print(f"Tamamlandı: {time.time() - t0:.2f}s  açık {counts.get('open', 0)}  kapalı {counts.get('closed', 0)}  "
+          f"yanıtsız {counts.get('timeout', 0)}  hata {counts.get('error', 0)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+terminalBench.py
+TerminalTab çıktı yolu için ekransız (offscreen) kıyaslama aracı.
+
+Bir TerminalTab'ı Qt'nin offscreen platformunda açar (kabuk başlatmadan) ve ona gerçek bir
+alt süreçten sentetik akışlar besler; akışlar _on_proc_output -> OutputPipeline ->
+_on_output_batch yolundan geçer. Ayrıca _append_html mesaj yolu ayrı ölçülür.
+
+    plain     : düz ASCII satırlar
+    keyword   : vurgu anahtar kelimeleriyle dolu satırlar (fsociety / error / success)
+    ansi      : SGR renk kodlu satırlar
+    long      : satır sonu olmayan çok uzun satırlar
+    messages  : _append_html ile yazılan terminal mesajları
+
+Rapor: emilen MB/s, ana thread duraklaması (heartbeat boşlukları), girdi olayı gecikmesi,
+belge boyutu ve RSS artışı. --json ile kaydedilir, --compare ile önceki çalıştırmayla kıyaslanır.
+
+Kullanım:
+    python terminalBench.py
+    python terminalBench.py --size 8 --rate 2 --streams plain,ansi --json tbench.json
+"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import sys, time, json, argparse, platform
+from PyQt5 import QtCore, QtWidgets, QtGui
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import terminalv9
+
+STREAMS = ("plain", "keyword", "ansi", "long", "messages")
+
+# child process writing one synthetic stream: kind, size in bytes, rate in bytes/s (0 = unpaced)
+_GENERATOR = r"""
+import sys, time
+kind, size, rate = sys.argv[1], int(sys.argv[2]), float(sys.argv[3])
+if kind == "plain":
+    unit = b"".join(b"line %06d the quick brown fox jumps over the lazy dog 0123456789\n" % i for i in range(256))
+elif kind == "keyword":
+    unit = b"".join(b"%06d error: fsociety success error fsociety ERROR Success fsociety\n" % i for i in range(256))
+elif kind == "ansi":
+    unit = b"".join(b"\x1b[1;3%dm%06d\x1b[0m \x1b[38;5;%dmcolored\x1b[0m \x1b[4munder\x1b[24m text\n" % (i % 8, i, i % 256)
+                    for i in range(256))
+else:  # long: no newline until the very end
+    unit = b"x" * 16383 + b"y"
+out = sys.stdout.buffer
+sent, t0, chunk = 0, time.perf_counter(), 16384
+while sent < size:
+    data = unit[: min(len(unit), size - sent)]
+    for i in range(0, len(data), chunk):
+        out.write(data[i:i + chunk])
+    sent += len(data)
+    if rate > 0:
+        ahead = sent / rate - (time.perf_counter() - t0)
+        if ahead > 0:
+            out.flush()
+            time.sleep(ahead)
+out.write(b"\n")
+out.flush()
+"""
+
+
+def rss_bytes():
+    try:
+        with open("/proc/self/status", "rb") as f:
+            for line in f:
+                if line.startswith(b"VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+class Probe(QtCore.QObject):
+    """
+    Main-thread health while a stream is absorbed:
+    - heartbeat: a 5 ms timer, gaps beyond its period are stall time
+    - input latency: synthetic key events posted to the tab's input line every 20 ms,
+      timed from postEvent to delivery (caught by an event filter on the input)
+    """
+    HEARTBEAT_MS = 5
+    INPUT_MS = 20
+
+    def __init__(self, tab):
+        super().__init__()
+        self.tab = tab
+        self.gaps = []
+        self.latencies = []
+        self._posted = []
+        self._last = None
+        self._beat = QtCore.QTimer(self)
+        self._beat.setTimerType(QtCore.Qt.PreciseTimer)
+        self._beat.timeout.connect(self._on_beat)
+        self._input = QtCore.QTimer(self)
+        self._input.timeout.connect(self._post_key)
+        tab.input.installEventFilter(self)  # installed last: runs before the tab's own filter
+
+    def start(self):
+        self.gaps, self.latencies, self._posted = [], [], []
+        self._last = time.perf_counter()
+        self._beat.start(self.HEARTBEAT_MS)
+        self._input.start(self.INPUT_MS)
+
+    def stop(self):
+        self._beat.stop()
+        self._input.stop()
+
+    def _on_beat(self):
+        now = time.perf_counter()
+        self.gaps.append(now - self._last)
+        self._last = now
+
+    def _post_key(self):
+        self._posted.append(time.perf_counter())
+        ev = QtGui.QKeyEvent(QtCore.QEvent.KeyPress, QtCore.Qt.Key_F35, QtCore.Qt.NoModifier)
+        QtWidgets.QApplication.postEvent(self.tab.input, ev)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.KeyPress and event.key() == QtCore.Qt.Key_F35:
+            if self._posted:
+                self.latencies.append(time.perf_counter() - self._posted.pop(0))
+            return True
+        return False
+
+    def stall_stats(self):
+        period = self.HEARTBEAT_MS / 1000
+        stall = sum(g - period for g in self.gaps if g > period * 2)
+        return stall, max(self.gaps, default=0.0)
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q / 100 * (len(values) - 1))))]
+
+
+def new_tab(backend):
+    cfg = {"shell_backend": backend} if backend else {}
+    tab = terminalv9.TerminalTab("bench", "bench", cfg)
+    tab._initialized = True  # no welcome banner, no shell: only the stream under test writes
+    tab.resize(1000, 700)
+    tab.show()
+    return tab
+
+
+def wait(cond, timeout):
+    app = QtWidgets.QApplication.instance()
+    deadline = time.perf_counter() + timeout
+    while not cond() and time.perf_counter() < deadline:
+        app.processEvents(QtCore.QEventLoop.AllEvents, 50)
+    return cond()
+
+
+def run_stream(kind, size, rate, backend=None, timeout=300.0):
+    tab = new_tab(backend)
+    probe = Probe(tab)
+    wait(lambda: False, 0.1)  # let the first paint happen
+    rss0 = rss_bytes()
+    done = {}
+    absorbed = [0]  # bytes rendered so far (a stream that times out still gets a rate)
+
+    if kind == "messages":
+        # terminal messages through _append_html, one per event loop turn like real builtins
+        line = "[scan] fsociety error success 192.168.1.10:22 Banner: SSH-2.0-OpenSSH\n"
+        count = max(1, size // len(line.encode()))
+        state = {"i": 0}
+
+        def step():
+            for _ in range(50):
+                if state["i"] >= count:
+                    done["t"] = time.perf_counter()
+                    return
+                tab._append_html(line)
+                state["i"] += 1
+                absorbed[0] += len(line)
+            QtCore.QTimer.singleShot(0, step)
+
+        probe.start()
+        t0 = time.perf_counter()
+        QtCore.QTimer.singleShot(0, step)
+    else:
+        pipeline_rendered = tab._pipeline.rendered
+
+        def rendered(n):
+            absorbed[0] += n
+            pipeline_rendered(n)
+        tab._pipeline.rendered = rendered
+        p = tab._new_process()
+        p.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+        p.readyReadStandardOutput.connect(lambda p=p: tab._on_proc_output(p))
+        p.finished.connect(lambda code, status, p=p: tab._on_proc_finished(p, code, status))
+        # runs on the GUI thread after everything before it was rendered
+        p.finished.connect(lambda *a, p=p: tab._pipeline.post(p, lambda: done.setdefault("t", time.perf_counter())))
+        probe.start()
+        t0 = time.perf_counter()
+        p.start(sys.executable, ["-c", _GENERATOR, kind, str(size), str(rate)])
+
+    ok = wait(lambda: "t" in done, timeout)
+    probe.stop()
+    elapsed = (done.get("t") or time.perf_counter()) - t0
+    stall, worst = probe.stall_stats()
+    doc = tab.output.document()
+    result = {
+        "bytes": absorbed[0],
+        "seconds": round(elapsed, 3),
+        "mb_per_sec": round(absorbed[0] / 1048576 / elapsed, 3) if elapsed > 0 else None,
+        "completed": ok,
+        "stall_ms": round(stall * 1000, 1),
+        "stall_pct": round(stall / elapsed * 100, 1) if elapsed > 0 else None,
+        "worst_gap_ms": round(worst * 1000, 1),
+        "input_p50_ms": _ms(percentile(probe.latencies, 50)),
+        "input_p99_ms": _ms(percentile(probe.latencies, 99)),
+        "input_events": len(probe.latencies),
+        "doc_chars": doc.characterCount(),
+        "doc_blocks": doc.blockCount(),
+        "rss_delta": rss_bytes() - rss0,
+    }
+    tab.close()
+    tab.deleteLater()
+    wait(lambda: False, 0.1)
+    return result
+
+
+def _ms(v):
+    return None if v is None else round(v * 1000, 2)
+
+
+def format_report(report, previous=None):
+    head = f"{'akış':<10} {'MB/s':>8} {'duraklama':>10} {'en kötü':>9} {'girdi p50':>10} {'girdi p99':>10} {'satır':>8} {'RSS +':>9}"
+    lines = [head]
+    prev = (previous or {}).get("streams", {})
+    for kind, r in report["streams"].items():
+        lines.append(f"{kind:<10} {_f(r['mb_per_sec']):>8} {_f(r['stall_pct'], '%'):>10} {_f(r['worst_gap_ms'], 'ms'):>9} "
+                     f"{_f(r['input_p50_ms'], 'ms'):>10} {_f(r['input_p99_ms'], 'ms'):>10} {r['doc_blocks']:>8} "
+                     f"{terminalv9.format_bytes(max(0, r['rss_delta'])):>9}" + ("" if r["completed"] else "  (zaman aşımı)"))
+        old = prev.get(kind)
+        if old and old.get("mb_per_sec") and r["mb_per_sec"]:
+            lines.append(f"{'':<10} önceki çalıştırmaya göre: MB/s {(r['mb_per_sec'] / old['mb_per_sec'] - 1) * 100:+.1f}%")
+    return "\n".join(lines)
+
+
+def _f(v, unit=""):
+    return "-" if v is None else f"{v}{unit}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offscreen benchmark of the TerminalTab output path.")
+    parser.add_argument("--streams", default=",".join(STREAMS), help="comma separated: " + ",".join(STREAMS))
+    parser.add_argument("--size", type=float, default=1, help="MB per stream")
+    parser.add_argument("--rate", type=float, default=0, help="producer rate in MB/s (0 = as fast as possible)")
+    parser.add_argument("--backend", choices=["pty", "pipe"], default=None, help="process backend (default: as the app)")
+    parser.add_argument("--timeout", type=float, default=60, help="give up on a stream after this many seconds")
+    parser.add_argument("--json", default="", help="write the report to this JSON file")
+    parser.add_argument("--compare", default="", help="previous JSON report to compare against")
+    args = parser.parse_args()
+
+    app = QtWidgets.QApplication(sys.argv[:1])
+    previous = None
+    if args.compare:
+        try:
+            with open(args.compare, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            print(f"Karşılaştırma dosyası okunamadı: {args.compare}")
+
+    size = int(args.size * 1048576)
+    rate = args.rate * 1048576
+    report = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "qt": QtCore.QT_VERSION_STR,
+        "config": {"size": size, "rate": rate, "backend": args.backend or "default"},
+        "streams": {},
+    }
+    for kind in [s.strip() for s in args.streams.split(",") if s.strip()]:
+        if kind not in STREAMS:
+            print(f"Bilinmeyen akış: {kind}")
+            continue
+        print(f"{kind} ölçülüyor...", flush=True)
+        report["streams"][kind] = run_stream(kind, size, rate, args.backend, args.timeout)
+    print(format_report(report, previous))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"Kaydedildi: {args.json}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
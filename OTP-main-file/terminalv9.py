@@ -1,774 +1,2915 @@
-#!/usr/bin/env python3
-"""
-fsociety_terminal_full.py
-All-in-one: Login (hashed), theme, per-tab interactive shells, per-tab colors,
-banner (big F), run/start helpers, run menuScanner/consoleScanner with foreground stdin,
-Turkish encoding fallbacks, config save/load, GitHub/IG credits.
-
-Contact / credit shown in banner/footer:
-instagram-@yigitermozdamar  |  github-@yigit545
-"""
-
-import sys, os, platform, signal, hashlib, json, html, random
-from PyQt5 import QtCore, QtWidgets, QtGui
-
-# --------------------------- META & CONFIG ---------------------------
-APP_VERSION = "2.0.0"
-CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".edex_config.json")
-
-# Banner: big 'F' letter (as requested)
-BANNER = r"""
-
-
-  OOOOO   TTTTTTTT  PPPPPP 
- O     O     TT     P     P
- O     O     TT     P     P
- O     O     TT     PPPPPP
- O     O     TT     P
-  OOOOO      TT     P
-
-  
-"""
-
-CREDIT_LINE = "credit: instagram-@yigitermozdamar | github-@yigit545"
-
-# default colors
-DEFAULT_FG = "#00ff9e"
-DEFAULT_BG = "#0d0d0d"
-DEFAULT_BANNER_COLOR = "#00ff9e"
-DEFAULT_HIGHLIGHTS = {"error": "#ff4d4d", "success": "#39ff14", "fsociety": "#00ffd1"}
-
-# avoid zombies on unix
-if platform.system() != "Windows":
-    try:
-        signal.signal(signal.SIGCHLD, signal.SIG_IGN)
-    except Exception:
-        pass
-
-# --------------------------- Helpers ---------------------------
-def load_config():
-    cfg = {}
-    if os.path.isfile(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                cfg = json.load(f)
-        except Exception:
-            cfg = {}
-    return cfg
-
-def save_config(cfg):
-    try:
-        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, indent=2, ensure_ascii=False)
-    except Exception:
-        pass
-
-def hash_password(pw: str) -> str:
-    return hashlib.sha256(pw.encode("utf-8")).hexdigest()
-
-def get_app_dir():
-    if getattr(sys, "frozen", False):
-        return sys._MEIPASS
-    return os.path.dirname(os.path.abspath(sys.argv[0]))
-
-def platform_open(target: str):
-    """Open file/url with default app depending on OS."""
-    try:
-        if platform.system().lower().startswith("win"):
-            # Use start via cmd
-            os.system(f'start "" "{target}"')
-        elif platform.system().lower().startswith("linux"):
-            os.system(f'xdg-open "{target}" &')
-        elif platform.system().lower().startswith("darwin"):
-            os.system(f'open "{target}" &')
-        else:
-            return False
-        return True
-    except Exception:
-        return False
-
-# --------------------------- Login Dialog ---------------------------
-class LoginDialog(QtWidgets.QDialog):
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setWindowTitle("fsociety Terminal — Login")
-        self.setFixedSize(420, 260)
-        layout = QtWidgets.QVBoxLayout(self)
-        self.cfg = load_config()
-
-        layout.addWidget(QtWidgets.QLabel("Kullanıcı adı:"))
-        self.username = QtWidgets.QLineEdit()
-        layout.addWidget(self.username)
-
-        layout.addWidget(QtWidgets.QLabel("Şifre:"))
-        pw_row = QtWidgets.QHBoxLayout()
-        self.password = QtWidgets.QLineEdit()
-        self.password.setEchoMode(QtWidgets.QLineEdit.Password)
-        pw_row.addWidget(self.password)
-        self.toggle_pw = QtWidgets.QPushButton("Göster")
-        self.toggle_pw.setCheckable(True)
-        self.toggle_pw.setFixedWidth(80)
-        self.toggle_pw.clicked.connect(self.on_toggle_pw)
-        pw_row.addWidget(self.toggle_pw)
-        layout.addLayout(pw_row)
-
-        # theme selection
-        theme_row = QtWidgets.QHBoxLayout()
-        theme_row.addWidget(QtWidgets.QLabel("Tema:"))
-        self.theme_combo = QtWidgets.QComboBox()
-        self.theme_combo.addItems(["Koyu", "Açık"])
-        theme_row.addWidget(self.theme_combo)
-        theme_row.addStretch()
-        layout.addLayout(theme_row)
-
-        self.status = QtWidgets.QLabel("")
-        layout.addWidget(self.status)
-
-        btn_row = QtWidgets.QHBoxLayout()
-        btn_row.addStretch()
-        self.login_btn = QtWidgets.QPushButton("Giriş / Kaydet")
-        self.login_btn.clicked.connect(self.on_login)
-        btn_row.addWidget(self.login_btn)
-        layout.addLayout(btn_row)
-
-        # populate if exists
-        if isinstance(self.cfg, dict):
-            u = self.cfg.get("username")
-            theme = self.cfg.get("theme", "dark")
-            if u:
-                self.username.setText(u)
-            if theme == "light":
-                self.theme_combo.setCurrentText("Açık")
-            else:
-                self.theme_combo.setCurrentText("Koyu")
-
-    def on_toggle_pw(self):
-        if self.toggle_pw.isChecked():
-            self.password.setEchoMode(QtWidgets.QLineEdit.Normal)
-            self.toggle_pw.setText("Gizle")
-        else:
-            self.password.setEchoMode(QtWidgets.QLineEdit.Password)
-            self.toggle_pw.setText("Göster")
-
-    def on_login(self):
-        user = self.username.text().strip()
-        pw = self.password.text()
-        if not user or not pw:
-            self.status.setText("Kullanıcı adı ve şifre boş olamaz!")
-            return
-
-        cfg = self.cfg or {}
-        pwhash = hash_password(pw)
-        # if config has username+password -> validate
-        if cfg.get("username") and cfg.get("password"):
-            if user == cfg.get("username") and pwhash == cfg.get("password"):
-                # update theme if changed
-                cfg["theme"] = "light" if self.theme_combo.currentText() == "Açık" else "dark"
-                save_config(cfg)
-                self.accept()
-                return
-            else:
-                self.status.setText("Hatalı kullanıcı adı veya şifre!")
-                return
-        else:
-            # first-time save
-            cfg["username"] = user
-            cfg["password"] = pwhash
-            cfg["theme"] = "light" if self.theme_combo.currentText() == "Açık" else "dark"
-            cfg["fg"] = cfg.get("fg", DEFAULT_FG)
-            cfg["bg"] = cfg.get("bg", DEFAULT_BG)
-            cfg["banner_color"] = cfg.get("banner_color", DEFAULT_BANNER_COLOR)
-            cfg["highlights"] = cfg.get("highlights", DEFAULT_HIGHLIGHTS)
-            save_config(cfg)
-            self.accept()
-            return
-
-# --------------------------- Terminal Tab (per-tab) ---------------------------
-class TerminalTab(QtWidgets.QWidget):
-    def __init__(self, name: str, username: str, cfg: dict):
-        super().__init__()
-        self.name = name
-        self.username = username
-        self.cfg = cfg or {}
-        self.cwd = os.getcwd()
-        self.history = []
-        self.hist_pos = -1
-
-        # colors
-        self.fg = self.cfg.get("fg", DEFAULT_FG)
-        self.bg = self.cfg.get("bg", DEFAULT_BG)
-        self.banner_color = self.cfg.get("banner_color", DEFAULT_BANNER_COLOR)
-        self.highlights = self.cfg.get("highlights", DEFAULT_HIGHLIGHTS.copy()).copy()
-
-        # processes
-        self.shell_proc = None            # interactive persistent shell for this tab
-        self.foreground_proc = None       # if a "run" script is foreground, forward stdin to it
-        self.child_procs = []             # background child processes list
-
-        self._build_ui()
-        self._start_shell()
-        self.show_welcome()
-
-    def _build_ui(self):
-        layout = QtWidgets.QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(6)
-
-        # output: QTextEdit (we will insert HTML for highlights)
-        self.output = QtWidgets.QTextEdit()
-        self.output.setReadOnly(True)
-        self.output.setFont(QtGui.QFont("Courier", 11))
-        self.output.setStyleSheet(f"background-color: {self.bg}; color: {self.fg}; border:none; padding:6px;")
-        layout.addWidget(self.output)
-
-        # input row
-        row = QtWidgets.QHBoxLayout()
-        row.setContentsMargins(0, 0, 0, 0)
-        self.prompt = QtWidgets.QLabel(f"{self.username}@fsociety:$")
-        self.prompt.setStyleSheet(f"color: {self.fg}; font-weight: bold;")
-        row.addWidget(self.prompt)
-
-        self.input = QtWidgets.QLineEdit()
-        self.input.setStyleSheet(f"background-color:#1a1a1a; color:{self.fg}; border:1px solid {self.fg}; padding:4px;")
-        self.input.returnPressed.connect(self.on_enter)
-        row.addWidget(self.input, 1)
-        layout.addLayout(row)
-
-        # allow up/down history
-        self.input.installEventFilter(self)
-
-    # ------------------ shell process ------------------
-    def _start_shell(self):
-        from PyQt5.QtCore import QProcess
-        # start persistent shell which we will write commands to
-        try:
-            if self.shell_proc:
-                try:
-                    self.shell_proc.kill()
-                except:
-                    pass
-                self.shell_proc = None
-            self.shell_proc = QProcess(self)
-            self.shell_proc.setProcessChannelMode(QProcess.MergedChannels)
-            self.shell_proc.readyReadStandardOutput.connect(lambda p=self.shell_proc: self._on_proc_output(p))
-            self.shell_proc.finished.connect(lambda code, status, p=self.shell_proc: self._on_proc_finished(p, code, status))
-            try:
-                self.shell_proc.setWorkingDirectory(self.cwd)
-            except:
-                pass
-
-            if platform.system().lower().startswith("win"):
-                prog = "powershell"
-                args = ["-NoLogo", "-NoExit"]
-            else:
-                prog = "/bin/bash"
-                args = ["-i"]
-            self.shell_proc.start(prog, args)
-            started = self.shell_proc.waitForStarted(1000)
-            if not started:
-                self._append_html("[error] Shell başlatılamadı.\n", kind="error")
-        except Exception as e:
-            self._append_html(f"[error] Shell başlatma hatası: {e}\n", kind="error")
-
-    def _on_proc_output(self, proc):
-        # pipe output of any child process (shell_proc or child_procs)
-        try:
-            raw = proc.readAllStandardOutput()
-            # decoding with fallback for Windows (utf-8 -> cp850 -> latin1)
-            if platform.system().lower().startswith("win"):
-                try:
-                    data = bytes(raw).decode("utf-8")
-                except UnicodeDecodeError:
-                    try:
-                        data = bytes(raw).decode("cp850")
-                    except Exception:
-                        data = bytes(raw).decode("latin1", errors="replace")
-            else:
-                data = bytes(raw).decode("utf-8", errors="replace")
-        except Exception as e:
-            data = f"[output decode error: {e}]\n"
-        # append colored/highlighted
-        self._append_html(data)
-
-    def _on_proc_finished(self, proc, code, status):
-        # called for any proc that connects to finished -> we'll handle via mapping
-        # Try to remove from child_procs; if it was foreground_proc, clear that
-        try:
-            if proc in self.child_procs:
-                self.child_procs.remove(proc)
-        except Exception:
-            pass
-        if proc is self.foreground_proc:
-            self.foreground_proc = None
-            self._append_html(f"\n[foreground process exited: {code}]\n", kind="success")
-        else:
-            self._append_html(f"\n[process exited: {code}]\n", kind="success")
-
-    # ------------------ UI helpers ------------------
-    def _append_html(self, text: str, kind: str = None):
-        """Insert text into QTextEdit with basic highlighting for keywords."""
-        # escape html
-        escaped = html.escape(text)
-        # simple highlight mapping
-        mapping = {
-            "fsociety": self.highlights.get("fsociety", DEFAULT_HIGHLIGHTS["fsociety"]),
-            "error": self.highlights.get("error", DEFAULT_HIGHLIGHTS["error"]),
-            "success": self.highlights.get("success", DEFAULT_HIGHLIGHTS["success"]),
-        }
-        # do a simple case-insensitive tokenized replacement
-        lower = escaped.lower()
-        i = 0
-        out = ""
-        kws = sorted(mapping.keys(), key=lambda x: -len(x))
-        while i < len(escaped):
-            matched = False
-            for kw in kws:
-                L = len(kw)
-                if lower.startswith(kw, i):
-                    color = mapping[kw]
-                    piece = escaped[i:i+L]
-                    out += f'<span style="color:{color}; font-weight:700;">{piece}</span>'
-                    i += L
-                    matched = True
-                    break
-            if not matched:
-                out += escaped[i]
-                i += 1
-        # wrap in pre to preserve formatting
-        pre = f'<pre style="font-family:Courier, monospace; margin:0; color:{self.fg};">{out}</pre>'
-        cursor = self.output.textCursor()
-        cursor.movePosition(QtGui.QTextCursor.End)
-        cursor.insertHtml(pre)
-        self.output.ensureCursorVisible()
-
-    def show_welcome(self):
-        # Welcome message using username
-        welcome = f"Merhaba {self.username}! fsociety terminaline hoşgeldin.\nVersiyon: {APP_VERSION} (App)\n"
-        self._append_html(welcome, kind="success")
-        # banner colored
-        banner_html = f'<pre style="font-family:Courier, monospace; margin:0; color:{self.banner_color};">{html.escape(BANNER)}</pre>'
-        cursor = self.output.textCursor()
-        cursor.movePosition(QtGui.QTextCursor.End)
-        cursor.insertHtml(banner_html + "<br/>")
-        cursor.insertHtml(f'<div style="color:{self.fg};">{html.escape(CREDIT_LINE)}</div><br/>')
-        self.output.ensureCursorVisible()
-
-    # ------------------ input & command handling ------------------
-    def on_enter(self):
-        text = self.input.text()
-        if text is None:
-            return
-        cmdline = text.rstrip("\n")
-        # If a foreground interactive child is running, forward stdin to it
-        if self.foreground_proc and self.foreground_proc.state() == QtCore.QProcess.Running:
-            try:
-                self.foreground_proc.write((cmdline + "\n").encode("utf-8"))
-                self.foreground_proc.waitForBytesWritten(100)
-            except Exception as e:
-                self._append_html(f"[error] foreground stdin yazılamadı: {e}\n", kind="error")
-            # echo locally
-            self._append_html(f"{self.username}@fsociety:$ {html.escape(cmdline)}\n")
-            self.input.clear()
-            return
-
-        # No foreground -> interpret builtins or send to shell_proc
-        self._append_html(f"{self.username}@fsociety:$ {html.escape(cmdline)}\n")
-        self.history.append(cmdline)
-        self.hist_pos = len(self.history)
-        self.input.clear()
-
-        cmd = cmdline.strip()
-        if not cmd:
-            return
-
-        # builtins
-        if cmd.lower() == "clear":
-            self.output.clear()
-            self.show_welcome()
-            return
-
-        if cmd.lower() == "help":
-            self._append_html("Builtin: help clear exit sysinfo cd color color-change start run\n")
-            return
-
-        # EXIT: if foreground exists -> send exit to child; else close app
-        if cmd.lower() == "exit":
-            if self.foreground_proc and self.foreground_proc.state() == QtCore.QProcess.Running:
-                try:
-                    self.foreground_proc.write(b"exit\n")
-                    self.foreground_proc.waitForBytesWritten(100)
-                    self._append_html("[info] Foreground process'a 'exit' gönderildi.\n")
-                except Exception as e:
-                    self._append_html(f"[error] Foreground'a exit gönderilemedi: {e}\n", kind="error")
-                return
-            # no foreground -> close app
-            QtWidgets.qApp.quit()
-            return
-
-        if cmd.lower() == "sysinfo":
-            try:
-                import psutil
-                info = f"Platform: {platform.platform()}\nCPU count: {psutil.cpu_count(logical=True)}\nMemory: {round(psutil.virtual_memory().total/1024/1024)} MB\n"
-            except Exception:
-                info = f"Platform: {platform.platform()}\nCPU count: {os.cpu_count()}\n"
-            self._append_html(info)
-            return
-
-        if cmd.lower().startswith("cd "):
-            try:
-                tgt = cmd[3:].strip()
-                newdir = os.path.abspath(os.path.join(self.cwd, tgt))
-                os.chdir(newdir)
-                self.cwd = newdir
-                # set shell proc working dir too
-                try:
-                    self.shell_proc.setWorkingDirectory(self.cwd)
-                except Exception:
-                    pass
-                self._append_html(f"Klasör değiştirildi: {self.cwd}\n", kind="success")
-            except Exception as e:
-                self._append_html(f"Hata: {e}\n", kind="error")
-            return
-
-        if cmd.lower().startswith("color "):
-            color = cmd[6:].strip()
-            # allow color names or hex; user responsibility
-            self.fg = color
-            # apply to UI
-            self.output.setStyleSheet(f"background-color: {self.bg}; color: {self.fg}; border:none; padding:6px;")
-            self.prompt.setStyleSheet(f"color: {self.fg}; font-weight:bold;")
-            self.input.setStyleSheet(f"background-color:#1a1a1a; color:{self.fg}; border:1px solid {self.fg}; padding:4px;")
-            # save preference
-            self.cfg["fg"] = self.fg
-            save_config(self.cfg)
-            return
-
-        if cmd.lower() == "color-change":
-            self.open_color_dialog()
-            return
-
-        if cmd.lower().startswith("start "):
-            target = cmd[6:].strip()
-            ok = platform_open(target)
-            if ok:
-                self._append_html(f"[opened] {html.escape(target)}\n", kind="success")
-            else:
-                self._append_html(f"[error] Açılamadı: {html.escape(target)}\n", kind="error")
-            return
-
-        if cmd.lower().startswith("run "):
-            kw = cmd[4:].strip()
-            self.run_script(kw, foreground=True)
-            return
-
-        # default: send to shell_proc (persistent interactive shell)
-        try:
-            if self.shell_proc and self.shell_proc.state() == QtCore.QProcess.Running:
-                # write command + newline
-                self.shell_proc.write((cmd + "\n").encode("utf-8"))
-                self.shell_proc.waitForBytesWritten(100)
-            else:
-                # fallback: spawn short-lived process
-                self._spawn_short(proc_cmd=cmd)
-        except Exception as e:
-            self._append_html(f"[error] Shell write hatası: {e}\n", kind="error")
-
-    def _spawn_short(self, proc_cmd):
-        """Spawn a short lived process (used as fallback)."""
-        from PyQt5.QtCore import QProcess
-        p = QProcess(self)
-        p.setProcessChannelMode(QProcess.MergedChannels)
-        p.readyReadStandardOutput.connect(lambda p=p: self._on_proc_output(p))
-        p.finished.connect(lambda code, status, p=p: self._on_proc_finished(p, code, status))
-        if platform.system().lower().startswith("win"):
-            p.start("cmd", ["/c", proc_cmd])
-        else:
-            p.start("/bin/sh", ["-c", proc_cmd])
-        self.child_procs.append(p)
-
-    # ------------------ run script handling ------------------
-    def run_script(self, keyword: str, foreground: bool = False):
-        # map keywords to filenames (search flexible)
-        mapping = {
-            "menu": "menuScanner.py",
-            "menuscan": "menuScanner.py",
-            "menuscanner": "menuScanner.py",
-            "console": "consoleScanner.py",
-            "consolescan": "consoleScanner.py",
-            "consolescanner": "consoleScanner.py",
-        }
-        script_file = None
-        for k, v in mapping.items():
-            if k in keyword.lower():
-                script_file = v
-                break
-        if not script_file:
-            script_file = keyword  # allow direct filename
-
-        # resolve path: first check bundled app dir (for exe), then cwd
-        app_dir = get_app_dir()
-        candidates = [
-            os.path.join(app_dir, script_file),
-            os.path.join(self.cwd, script_file),
-            os.path.join(os.getcwd(), script_file),
-        ]
-        script_path = None
-        for c in candidates:
-            if os.path.isfile(c):
-                script_path = c
-                break
-        if not script_path:
-            self._append_html(f"[error] Script bulunamadı: {html.escape(script_file)}\n", kind="error")
-            return
-
-        # start script as separate QProcess
-        from PyQt5.QtCore import QProcess
-        p = QProcess(self)
-        p.setProcessChannelMode(QProcess.MergedChannels)
-        p.readyReadStandardOutput.connect(lambda p=p: self._on_proc_output(p))
-        p.finished.connect(lambda code, status, p=p: self._on_proc_finished(p, code, status))
-        try:
-            p.setWorkingDirectory(os.path.dirname(script_path))
-        except Exception:
-            pass
-
-        # Use sys.executable so packaged exe calls embedded interpreter when available
-        p.start(sys.executable, [script_path])
-        started = p.waitForStarted(1000)
-        if not started:
-            self._append_html(f"[error] Script başlatılamadı: {html.escape(script_path)}\n", kind="error")
-            return
-
-        self.child_procs.append(p)
-        if foreground:
-            self.foreground_proc = p
-            self._append_html(f"[running foreground] {html.escape(script_path)} (pid: {p.processId()})\n", kind="success")
-        else:
-            self._append_html(f"[running] {html.escape(script_path)}\n", kind="success")
-
-    # ------------------ color / banner / highlight dialogs ------------------
-    def open_color_dialog(self):
-        fg = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.fg), self, "Yazı Rengi Seç")
-        if not fg.isValid():
-            return
-        bg = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.bg), self, "Arka Plan Rengi Seç")
-        if not bg.isValid():
-            return
-        self.fg = fg.name()
-        self.bg = bg.name()
-        self._apply_colors_and_save()
-
-    def _apply_colors_and_save(self):
-        self.output.setStyleSheet(f"background-color: {self.bg}; color: {self.fg}; border:none; padding:6px;")
-        self.prompt.setStyleSheet(f"color: {self.fg}; font-weight:bold;")
-        self.input.setStyleSheet(f"background-color:#1a1a1a; color:{self.fg}; border:1px solid {self.fg}; padding:4px;")
-        # persist to config
-        self.cfg["fg"] = self.fg
-        self.cfg["bg"] = self.bg
-        save_config(self.cfg)
-
-    def open_banner_color_dialog(self):
-        c = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.banner_color), self, "Banner Rengi Seç")
-        if not c.isValid():
-            return
-        self.banner_color = c.name()
-        self.cfg["banner_color"] = self.banner_color
-        save_config(self.cfg)
-        # redraw banner at end
-        cursor = self.output.textCursor()
-        cursor.movePosition(QtGui.QTextCursor.End)
-        banner_html = f'<pre style="font-family:Courier, monospace; margin:0; color:{self.banner_color};">{html.escape(BANNER)}</pre>'
-        cursor.insertHtml(banner_html + "<br/>")
-        self.output.ensureCursorVisible()
-
-    def open_highlight_dialog(self):
-        err = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.highlights.get("error")), self, "Error rengi")
-        if err.isValid():
-            self.highlights["error"] = err.name()
-        suc = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.highlights.get("success")), self, "Success rengi")
-        if suc.isValid():
-            self.highlights["success"] = suc.name()
-        fso = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.highlights.get("fsociety")), self, "fsociety rengi")
-        if fso.isValid():
-            self.highlights["fsociety"] = fso.name()
-        self.cfg["highlights"] = self.highlights
-        save_config(self.cfg)
-
-    # ------------------ history nav ------------------
-    def eventFilter(self, source, event):
-        if source is self.input and event.type() == QtCore.QEvent.KeyPress:
-            if event.key() == QtCore.Qt.Key_Up:
-                if self.history and self.hist_pos > 0:
-                    self.hist_pos -= 1
-                    self.input.setText(self.history[self.hist_pos])
-                elif self.history and self.hist_pos == -1:
-                    self.hist_pos = len(self.history) - 1
-                    self.input.setText(self.history[self.hist_pos])
-                return True
-            elif event.key() == QtCore.Qt.Key_Down:
-                if self.history and self.hist_pos < len(self.history) - 1:
-                    self.hist_pos += 1
-                    self.input.setText(self.history[self.hist_pos])
-                else:
-                    self.hist_pos = -1
-                    self.input.clear()
-                return True
-        return super().eventFilter(source, event)
-
-    # ------------------ cleanup ------------------
-    def close(self):
-        try:
-            # terminate child processes
-            if self.foreground_proc:
-                try:
-                    self.foreground_proc.terminate()
-                except:
-                    pass
-                self.foreground_proc = None
-            for p in list(self.child_procs):
-                try:
-                    p.terminate()
-                except:
-                    pass
-            # shell proc
-            if self.shell_proc:
-                try:
-                    self.shell_proc.terminate()
-                except:
-                    pass
-                self.shell_proc = None
-        except Exception:
-            pass
-        super().close()
-
-# --------------------------- Main Window ---------------------------
-class FsocietyTerminal(QtWidgets.QMainWindow):
-    def __init__(self, username: str, cfg: dict):
-        super().__init__()
-        self.username = username
-        self.cfg = cfg or {}
-        self.setWindowTitle(f"fsociety terminal — {self.username}")
-        self.resize(1200, 780)
-        # theme
-        theme = self.cfg.get("theme", "dark")
-        if theme == "light":
-            self.setStyleSheet("background-color: #f6f6f6; color: #002b22;")
-        else:
-            self.setStyleSheet("background-color: #0d0d0d; color: #00ff9e;")
-
-        main = QtWidgets.QWidget()
-        self.setCentralWidget(main)
-        layout = QtWidgets.QHBoxLayout(main)
-        layout.setContentsMargins(10, 10, 10, 10)
-        layout.setSpacing(10)
-
-        # tabs
-        self.tabs = QtWidgets.QTabWidget()
-        self.tabs.setTabsClosable(True)
-        self.tabs.tabCloseRequested.connect(self.close_tab)
-        self.tabs.setStyleSheet(
-            'QTabBar::tab {background:#1a1a1a;color:#00ff9e;padding:8px;}'
-            'QTabBar::tab:selected{background:#00ff9e;color:#0d0d0d;font-weight:bold;}'
-        )
-        layout.addWidget(self.tabs, 1)
-
-        # corner add button
-        add_btn = QtWidgets.QPushButton("+")
-        add_btn.setFixedWidth(30)
-        add_btn.setStyleSheet("background:#1a1a1a; color:#00ff9e; font-weight:bold;")
-        add_btn.clicked.connect(lambda: self.add_tab(f"Terminal {self.tabs.count()+1}"))
-        self.tabs.setCornerWidget(add_btn, QtCore.Qt.TopRightCorner)
-
-        # menu
-        menu = self.menuBar()
-        file_menu = menu.addMenu("Dosya")
-        new_tab_action = QtWidgets.QAction("Yeni Sekme", self)
-        new_tab_action.triggered.connect(lambda: self.add_tab(f"Terminal {self.tabs.count()+1}"))
-        file_menu.addAction(new_tab_action)
-        exit_action = QtWidgets.QAction("Çıkış", self)
-        exit_action.triggered.connect(QtWidgets.qApp.quit)
-        file_menu.addAction(exit_action)
-
-        view_menu = menu.addMenu("Görünüm")
-        color_action = QtWidgets.QAction("Renkleri Değiştir (Sekme)", self)
-        color_action.triggered.connect(self.menu_color)
-        view_menu.addAction(color_action)
-        banner_action = QtWidgets.QAction("Banner Rengini Değiştir (Sekme)", self)
-        banner_action.triggered.connect(self.menu_banner)
-        view_menu.addAction(banner_action)
-        hl_action = QtWidgets.QAction("Vurgu Renklerini Değiştir (Sekme)", self)
-        hl_action.triggered.connect(self.menu_highlight)
-        view_menu.addAction(hl_action)
-        theme_action = QtWidgets.QAction("Temayı Değiştir", self)
-        theme_action.triggered.connect(self.toggle_theme)
-        view_menu.addAction(theme_action)
-
-        # first tab
-        self.add_tab("Terminal 1")
-
-    def add_tab(self, title: str):
-        tab = TerminalTab(title, self.username, self.cfg)
-        idx = self.tabs.addTab(tab, title)
-        self.tabs.setCurrentIndex(idx)
-        # randomize banner color mildly
-        tab.banner_color = random.choice([DEFAULT_BANNER_COLOR, "#00ffd1", "#39ff14", "#7afcff", "#b3ff66"])
-
-    def close_tab(self, index: int):
-        if self.tabs.count() > 1:
-            w = self.tabs.widget(index)
-            try:
-                w.close()
-            except:
-                pass
-            self.tabs.removeTab(index)
-            w.deleteLater()
-
-    # menu handlers
-    def _current_tab(self):
-        return self.tabs.currentWidget()
-
-    def menu_color(self):
-        tab = self._current_tab()
-        if isinstance(tab, TerminalTab):
-            tab.open_color_dialog()
-
-    def menu_banner(self):
-        tab = self._current_tab()
-        if isinstance(tab, TerminalTab):
-            tab.open_banner_color_dialog()
-
-    def menu_highlight(self):
-        tab = self._current_tab()
-        if isinstance(tab, TerminalTab):
-            tab.open_highlight_dialog()
-
-    def toggle_theme(self):
-        cur = self.cfg.get("theme", "dark")
-        new = "light" if cur == "dark" else "dark"
-        self.cfg["theme"] = new
-        save_config(self.cfg)
-        if new == "light":
-            self.setStyleSheet("background-color: #f6f6f6; color: #002b22;")
-        else:
-            self.setStyleSheet("background-color: #0d0d0d; color: #00ff9e;")
-
-# --------------------------- Entrypoint ---------------------------
-def main():
-    app = QtWidgets.QApplication(sys.argv)
-    if hasattr(QtCore.Qt, "AA_EnableHighDpiScaling"):
-        app.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling)
-
-    cfg = load_config()
-    dlg = LoginDialog()
-    if dlg.exec_() != QtWidgets.QDialog.Accepted:
-        sys.exit(0)
-
-    username = dlg.username.text().strip()
-    # store username in cfg (already saved on first run), ensure loaded config used
-    cfg = load_config()
-    w = FsocietyTerminal(username, cfg)
-    w.show()
-    sys.exit(app.exec_())
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+"""
+fsociety_terminal_full.py
+All-in-one: Login (hashed), theme, per-tab interactive shells, per-tab colors,
+banner (big F), run/start helpers, run menuScanner/consoleScanner with foreground stdin,
+Turkish encoding fallbacks, config save/load, GitHub/IG credits.
+
+Contact / credit shown in banner/footer:
+instagram-@yigitermozdamar  |  github-@yigit545
+"""
+
+import time
+_T_START = time.perf_counter()  # --profile-startup measures from here
+import sys, os, platform, signal, json, html, re
+import codecs, queue, threading, collections, bisect
+from PyQt5 import QtCore, QtWidgets, QtGui
+# rarely needed modules are imported where they are used: hashlib (login), random (new tab),
+# subprocess/termios (pty start), psutil (sysinfo)
+
+# --------------------------- META & CONFIG ---------------------------
+APP_VERSION = "2.0.0"
+CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".edex_config.json")
+HISTORY_FILE = os.path.join(os.path.expanduser("~"), ".edex_history")
+HISTORY_MAX = 200000  # entries kept when the history file is compacted
+SHELL_RC_FILE = os.path.join(os.path.expanduser("~"), ".edex_bashrc")
+
+# commands handled by TerminalTab itself (help text and Tab completion)
+BUILTINS = ("help", "clear", "exit", "sysinfo", "cd", "color", "color-change", "start", "run", "scan", "results",
+            "cmdlog", "monitor")
+# `run` keywords -> bundled scanner scripts
+SCRIPT_KEYWORDS = {
+    "menu": "menuScanner.py",
+    "menuscan": "menuScanner.py",
+    "menuscanner": "menuScanner.py",
+    "console": "consoleScanner.py",
+    "consolescan": "consoleScanner.py",
+    "consolescanner": "consoleScanner.py",
+}
+
+# Banner: big 'F' letter (as requested)
+BANNER = r"""
+
+
+  OOOOO   TTTTTTTT  PPPPPP 
+ O     O     TT     P     P
+ O     O     TT     P     P
+ O     O     TT     PPPPPP
+ O     O     TT     P
+  OOOOO      TT     P
+
+  
+"""
+
+CREDIT_LINE = "credit: instagram-@yigitermozdamar | github-@yigit545"
+
+# default colors
+DEFAULT_FG = "#00ff9e"
+DEFAULT_BG = "#0d0d0d"
+DEFAULT_BANNER_COLOR = "#00ff9e"
+DEFAULT_HIGHLIGHTS = {"error": "#ff4d4d", "success": "#39ff14", "fsociety": "#00ffd1"}
+
+# output backpressure: unrendered bytes per tab before reading stops (cfg output_high_water)
+OUTPUT_HIGH_WATER = 4 * 1024 * 1024
+DEFAULT_SCROLLBACK = 20000
+
+# no SIGCHLD = SIG_IGN: the kernel would reap children itself and every exit status would read
+# as 0. QProcess reaps its own children, PtyProcess reaps in _close (os.waitpid).
+
+# --------------------------- Helpers ---------------------------
+def load_config():
+    cfg = {}
+    if os.path.isfile(CONFIG_FILE):
+        try:
+            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
+                cfg = json.load(f)
+        except Exception:
+            cfg = {}
+    return cfg
+
+def save_config(cfg):
+    try:
+        write_file_atomic(CONFIG_FILE, json.dumps(cfg, ensure_ascii=False))
+    except Exception:
+        pass
+
+def write_file_atomic(path: str, text: str):
+    """Write to a temp file in the same directory, fsync, then rename over path."""
+    import tempfile
+    fd, tmp = tempfile.mkstemp(prefix="." + os.path.basename(path) + ".", suffix=".tmp",
+                               dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+class ConfigStore(QtCore.QObject):
+    """
+    The one in-memory config shared by the login dialog, the window and every tab.
+    save() only marks it dirty; a debounce timer coalesces bursts (color picks, theme
+    toggles) into one write. The JSON snapshot is taken on the GUI thread and written
+    atomically by a background writer thread, which always writes the newest snapshot
+    and skips stale ones. flush() writes synchronously (used on quit).
+    path=None keeps the config in memory only.
+    """
+    DEBOUNCE_MS = 500
+
+    def __init__(self, data: dict = None, path: str = CONFIG_FILE, parent=None):
+        super().__init__(parent)
+        self.data = data if isinstance(data, dict) else {}
+        self.path = path
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DEBOUNCE_MS)
+        self._timer.timeout.connect(self._write_async)
+        self._lock = threading.Lock()
+        self._latest = None
+        self._wake = threading.Event()
+        self._writer = None
+
+    def save(self):
+        if self.path:
+            self._timer.start()
+
+    def flush(self):
+        self._timer.stop()
+        if not self.path:
+            return
+        snapshot = json.dumps(self.data, ensure_ascii=False)
+        with self._lock:
+            self._latest = None  # supersedes anything queued for the writer
+            try:
+                write_file_atomic(self.path, snapshot)
+            except Exception:
+                pass
+
+    def _write_async(self):
+        snapshot = json.dumps(self.data, ensure_ascii=False)
+        with self._lock:
+            self._latest = snapshot
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._writer_loop, name="otp-config", daemon=True)
+            self._writer.start()
+        self._wake.set()
+
+    def _writer_loop(self):
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                snapshot, self._latest = self._latest, None
+                if snapshot is None:
+                    continue
+                try:
+                    write_file_atomic(self.path, snapshot)
+                except Exception:
+                    pass
+
+def hash_password(pw: str) -> str:
+    import hashlib
+    return hashlib.sha256(pw.encode("utf-8")).hexdigest()
+
+def format_bytes(n) -> str:
+    for unit in ("B", "KB", "MB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+    return f"{n:.1f} GB"
+
+def get_app_dir():
+    if getattr(sys, "frozen", False):
+        return sys._MEIPASS
+    return os.path.dirname(os.path.abspath(sys.argv[0]))
+
+def scanner_dirs():
+    """Where the bundled scanner scripts live: ScannerTools/ next to the app, or the app dir."""
+    app_dir = get_app_dir()
+    return [os.path.join(app_dir, "ScannerTools"), app_dir]
+
+def load_scanner_module(name: str):
+    """Import consoleScanner/menuScanner as a module (for in-process use), cached in sys.modules."""
+    import importlib
+    if name in sys.modules:
+        return sys.modules[name]
+    for d in scanner_dirs():
+        if os.path.isfile(os.path.join(d, name + ".py")):
+            if d not in sys.path:
+                sys.path.insert(0, d)
+            return importlib.import_module(name)
+    raise ImportError(f"{name}.py bulunamadı")
+
+def platform_open(target: str):
+    """Open file/url with default app depending on OS."""
+    try:
+        if platform.system().lower().startswith("win"):
+            # Use start via cmd
+            os.system(f'start "" "{target}"')
+        elif platform.system().lower().startswith("linux"):
+            os.system(f'xdg-open "{target}" &')
+        elif platform.system().lower().startswith("darwin"):
+            os.system(f'open "{target}" &')
+        else:
+            return False
+        return True
+    except Exception:
+        return False
+
+# --------------------------- ANSI rendering ---------------------------
+# xterm base palette for SGR 30-37 / 90-97 (and the matching backgrounds)
+ANSI_COLORS = [
+    "#000000", "#cd0000", "#00cd00", "#cdcd00", "#0000ee", "#cd00cd", "#00cdcd", "#e5e5e5",
+    "#7f7f7f", "#ff0000", "#00ff00", "#ffff00", "#5c5cff", "#ff00ff", "#00ffff", "#ffffff",
+]
+
+def _build_xterm256():
+    table = list(ANSI_COLORS)
+    steps = (0, 95, 135, 175, 215, 255)
+    for n in range(216):
+        table.append("#%02x%02x%02x" % (steps[n // 36], steps[(n // 6) % 6], steps[n % 6]))
+    for n in range(24):
+        v = 8 + n * 10
+        table.append("#%02x%02x%02x" % (v, v, v))
+    return table
+
+XTERM_256 = _build_xterm256()
+
+# parser states
+_ST_TEXT, _ST_ESC, _ST_CSI, _ST_OSC, _ST_OSC_ESC, _ST_CHARSET = range(6)
+# control characters that interrupt a plain text run (\t and \n pass through)
+_ANSI_SPECIAL = re.compile(r"[\x00-\x08\x0b-\x1f\x7f]")
+_CSI_FINAL = re.compile(r"[\x40-\x7e]")
+_OSC_END = re.compile(r"[\x07\x1b]")
+# upper bound for a partial sequence carried between chunks (garbage guard)
+_ANSI_MAX_PENDING = 4096
+_HIGHLIGHT_RE = re.compile("|".join(sorted(DEFAULT_HIGHLIGHTS, key=len, reverse=True)), re.IGNORECASE)
+
+class AnsiParser:
+    """
+    Streaming ANSI/VT parser. feed() takes decoded text chunks and returns a list of
+    (text, key) runs where key = (fg, bg, bold, italic, underline). State (current SGR
+    attributes, half-received escape sequences) is kept between calls, so a sequence split
+    across two reads is still recognised. SGR codes become attributes, OSC strings are
+    returned in place as (payload, None), everything else (cursor movement, erase, modes)
+    is dropped. Plain text is sliced with regex searches, so each character is visited once.
+    """
+    DEFAULT_KEY = (None, None, False, False, False)
+
+    def __init__(self):
+        self._state = _ST_TEXT
+        self._pending = ""
+        self._key = self.DEFAULT_KEY
+
+    def reset(self):
+        self._state = _ST_TEXT
+        self._pending = ""
+        self._key = self.DEFAULT_KEY
+
+    def feed(self, data: str):
+        runs = []
+        key = self._key
+        state = self._state
+        i = 0
+        n = len(data)
+        while i < n:
+            if state == _ST_TEXT:
+                m = _ANSI_SPECIAL.search(data, i)
+                if m is None:
+                    runs.append((data[i:], key))
+                    break
+                k = m.start()
+                if k > i:
+                    runs.append((data[i:k], key))
+                i = k + 1
+                if data[k] == "\x1b":
+                    state = _ST_ESC
+                # other control chars (\r, BEL, backspace ...) are stripped
+            elif state == _ST_ESC:
+                ch = data[i]
+                i += 1
+                if ch == "[":
+                    state = _ST_CSI
+                    self._pending = ""
+                elif ch == "]":
+                    state = _ST_OSC
+                    self._pending = ""
+                elif ch in "()*+":
+                    state = _ST_CHARSET
+                else:
+                    state = _ST_TEXT
+            elif state == _ST_CHARSET:
+                i += 1
+                state = _ST_TEXT
+            elif state == _ST_CSI:
+                m = _CSI_FINAL.search(data, i)
+                if m is None:
+                    self._pending = (self._pending + data[i:])[-_ANSI_MAX_PENDING:]
+                    break
+                k = m.start()
+                if data[k] == "m":
+                    key = self._apply_sgr(self._pending + data[i:k], key)
+                self._pending = ""
+                i = k + 1
+                state = _ST_TEXT
+            else:  # _ST_OSC / _ST_OSC_ESC
+                if state == _ST_OSC_ESC:
+                    # ESC inside OSC: "ESC \" is the string terminator, anything else aborts it
+                    # and that ESC starts the next sequence (e.g. "ESC [0m" right after)
+                    runs.append((self._pending, None))
+                    self._pending = ""
+                    if data[i] == "\\":
+                        i += 1
+                        state = _ST_TEXT
+                    else:
+                        state = _ST_ESC
+                    continue
+                m = _OSC_END.search(data, i)
+                if m is None:
+                    self._pending = (self._pending + data[i:])[:_ANSI_MAX_PENDING]
+                    break
+                k = m.start()
+                self._pending = (self._pending + data[i:k])[:_ANSI_MAX_PENDING]
+                i = k + 1
+                if data[k] == "\x07":
+                    runs.append((self._pending, None))
+                    self._pending = ""
+                    state = _ST_TEXT
+                else:
+                    state = _ST_OSC_ESC
+        self._key = key
+        self._state = state
+        return runs
+
+    @staticmethod
+    def _apply_sgr(params: str, key):
+        fg, bg, bold, italic, underline = key
+        codes = params.replace(":", ";").split(";") if params else ("0",)
+        i = 0
+        n = len(codes)
+        while i < n:
+            try:
+                c = int(codes[i] or 0)
+            except ValueError:
+                i += 1
+                continue
+            i += 1
+            if c == 0:
+                fg, bg, bold, italic, underline = AnsiParser.DEFAULT_KEY
+            elif c == 1:
+                bold = True
+            elif c == 3:
+                italic = True
+            elif c == 4:
+                underline = True
+            elif c == 22:
+                bold = False
+            elif c == 23:
+                italic = False
+            elif c == 24:
+                underline = False
+            elif 30 <= c <= 37:
+                fg = ANSI_COLORS[c - 30]
+            elif 90 <= c <= 97:
+                fg = ANSI_COLORS[c - 90 + 8]
+            elif 40 <= c <= 47:
+                bg = ANSI_COLORS[c - 40]
+            elif 100 <= c <= 107:
+                bg = ANSI_COLORS[c - 100 + 8]
+            elif c == 39:
+                fg = None
+            elif c == 49:
+                bg = None
+            elif c in (38, 48):
+                color = None
+                try:
+                    mode = int(codes[i])
+                    if mode == 5:
+                        color = XTERM_256[int(codes[i + 1]) & 0xFF]
+                        i += 2
+                    elif mode == 2:
+                        r, g, b = (max(0, min(255, int(x or 0))) for x in codes[i + 1:i + 4])
+                        color = "#%02x%02x%02x" % (r, g, b)
+                        i += 4
+                    else:
+                        i += 1
+                except (IndexError, ValueError):
+                    i = n
+                if color is not None:
+                    if c == 38:
+                        fg = color
+                    else:
+                        bg = color
+        return (fg, bg, bold, italic, underline)
+
+def highlight_runs(runs, highlights):
+    """Split runs on the highlight keywords (fsociety/error/success), same colors as _append_html."""
+    out = []
+    for piece, key in runs:
+        if key is None or not _HIGHLIGHT_RE.search(piece):
+            out.append((piece, key))
+            continue
+        pos = 0
+        for m in _HIGHLIGHT_RE.finditer(piece):
+            if m.start() > pos:
+                out.append((piece[pos:m.start()], key))
+            kw = m.group(0).lower()
+            color = highlights.get(kw, DEFAULT_HIGHLIGHTS[kw])
+            out.append((m.group(0), (color, key[1], True, key[3], key[4])))
+            pos = m.end()
+        if pos < len(piece):
+            out.append((piece[pos:], key))
+    return out
+
+# --------------------------- PTY sessions ---------------------------
+try:
+    import fcntl, termios, struct
+    HAS_PTY = platform.system() == "Linux"
+except ImportError:  # Windows
+    HAS_PTY = False
+
+class PtyProcess(QtCore.QObject):
+    """
+    Child process attached to a pseudo terminal (Linux only).
+    Mimics the part of the QProcess API the tabs use (start/write/readAllStandardOutput/
+    state/terminate/kill and the readyRead/started/finished signals), so it can replace a
+    pipe based QProcess transparently. Because the child sees a TTY, stdio is line
+    buffered and output arrives as soon as a line is printed. The master fd is watched
+    by a QSocketNotifier on the GUI event loop.
+    """
+    readyReadStandardOutput = QtCore.pyqtSignal()
+    started = QtCore.pyqtSignal()
+    finished = QtCore.pyqtSignal(int, int)
+    errorOccurred = QtCore.pyqtSignal(int)
+
+    READ_CHUNK = 65536
+    # max bytes drained per notifier activation, keeps the event loop responsive
+    READ_BUDGET = 1 << 20
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._popen = None
+        self._fd = None
+        self._rbuf = bytearray()
+        self._wbuf = bytearray()
+        self._rnotifier = None
+        self._wnotifier = None
+        self._cwd = None
+        self._running = False
+        self._winsize = (24, 80)
+        self._read_limit = 0
+        self._exit_code = None
+
+    # --- QProcess compatible API ---
+    def setProcessChannelMode(self, mode):
+        pass  # a pty always merges stdout/stderr
+
+    def setWorkingDirectory(self, path):
+        self._cwd = path
+
+    def start(self, prog, args):
+        master = slave = None
+        try:
+            master, slave = os.openpty()
+            attrs = termios.tcgetattr(slave)
+            attrs[3] &= ~termios.ECHO  # the tab echoes input itself
+            termios.tcsetattr(slave, termios.TCSANOW, attrs)
+            self._apply_winsize(slave)
+            import subprocess
+            env = dict(os.environ)
+            env["TERM"] = "xterm-256color"
+            env["OTP_TERMINAL"] = "1"  # tools can tell the tab apart from a full terminal (no \r redraw)
+            import shutil
+            if shutil.which(prog) is None:
+                raise FileNotFoundError(prog)  # the exec helper would only report it as an exit code
+            prefix, new_session = _pty_exec_prefix()
+            self._popen = subprocess.Popen(
+                prefix + [prog] + list(args), stdin=slave, stdout=slave, stderr=slave,
+                cwd=self._cwd or None, env=env, start_new_session=new_session, close_fds=True)
+        except Exception:
+            for fd in (master, slave):
+                if fd is not None:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+            QtCore.QTimer.singleShot(0, lambda: self.errorOccurred.emit(QtCore.QProcess.FailedToStart))
+            return
+        os.close(slave)
+        os.set_blocking(master, False)
+        self._fd = master
+        self._running = True
+        self._rnotifier = QtCore.QSocketNotifier(master, QtCore.QSocketNotifier.Read, self)
+        self._rnotifier.activated.connect(self._on_readable)
+        self._wnotifier = QtCore.QSocketNotifier(master, QtCore.QSocketNotifier.Write, self)
+        self._wnotifier.setEnabled(False)
+        self._wnotifier.activated.connect(self._flush_writes)
+        QtCore.QTimer.singleShot(0, self.started.emit)
+
+    def waitForStarted(self, msecs=0):
+        return self._running
+
+    def setReadBufferSize(self, size):
+        """Like QProcess: stop reading the tty once size bytes are buffered (0 = unlimited)."""
+        self._read_limit = size
+
+    def state(self):
+        return QtCore.QProcess.Running if self._running else QtCore.QProcess.NotRunning
+
+    def processId(self):
+        return self._popen.pid if self._popen else 0
+
+    def readAllStandardOutput(self):
+        data = bytes(self._rbuf)
+        self._rbuf.clear()
+        if self._rnotifier is not None and self._fd is not None:
+            self._rnotifier.setEnabled(True)
+        return data
+
+    def write(self, data):
+        if not self._running:
+            return -1
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self._wbuf += data
+        self._flush_writes()
+        return len(data)
+
+    def waitForBytesWritten(self, msecs=0):
+        return not self._wbuf
+
+    def terminate(self):
+        self._signal(signal.SIGHUP)
+
+    def kill(self):
+        self._signal(signal.SIGKILL)
+
+    # --- pty specific ---
+    def set_window_size(self, rows: int, cols: int):
+        """Propagate the tab geometry to the tty (TIOCSWINSZ, the kernel sends SIGWINCH)."""
+        self._winsize = (max(1, rows), max(1, cols))
+        if self._fd is not None:
+            self._apply_winsize(self._fd)
+
+    def _apply_winsize(self, fd):
+        try:
+            rows, cols = self._winsize
+            fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", rows, cols, 0, 0))
+        except OSError:
+            pass
+
+    def _signal(self, sig):
+        if self._popen and self._running:
+            try:
+                os.killpg(self._popen.pid, sig)
+            except OSError:
+                try:
+                    self._popen.send_signal(sig)
+                except Exception:
+                    pass
+
+    def _on_readable(self, *_):
+        got = 0
+        closed = False
+        budget = self.READ_BUDGET
+        if self._read_limit:
+            budget = min(budget, self._read_limit - len(self._rbuf))
+        while got < budget:
+            try:
+                chunk = os.read(self._fd, self.READ_CHUNK)
+            except BlockingIOError:
+                break
+            except OSError:  # EIO: slave side closed, child is gone
+                closed = True
+                break
+            if not chunk:
+                closed = True
+                break
+            self._rbuf += chunk
+            got += len(chunk)
+        if not closed and self._read_limit and len(self._rbuf) >= self._read_limit:
+            # buffer full: leave the data in the kernel so the writer blocks, until read out
+            self._rnotifier.setEnabled(False)
+        if self._rbuf:
+            self.readyReadStandardOutput.emit()
+        if closed:
+            self._close()
+
+    def _flush_writes(self, *_):
+        while self._wbuf and self._fd is not None:
+            try:
+                n = os.write(self._fd, self._wbuf)
+            except BlockingIOError:
+                break
+            except OSError:
+                self._wbuf.clear()
+                break
+            del self._wbuf[:n]
+        if self._wnotifier is not None:
+            self._wnotifier.setEnabled(bool(self._wbuf))
+
+    def _close(self, attempts=0):
+        if self._fd is not None:
+            for n in (self._rnotifier, self._wnotifier):
+                n.setEnabled(False)
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+        code = self._reap()
+        if code is None and attempts < 20:
+            # tty closed before the child exited; poll again shortly without blocking
+            QtCore.QTimer.singleShot(50, lambda: self._close(attempts + 1))
+            return
+        if code is None:
+            # child outlived its tty (daemonized?): report it gone, keep reaping in the background
+            self._reap_later()
+            code = 0
+        self._running = False
+        if code < 0:
+            self.finished.emit(-code, QtCore.QProcess.CrashExit)  # killed by signal -code
+        else:
+            self.finished.emit(code, QtCore.QProcess.NormalExit)
+
+    def _reap(self):
+        """waitpid(WNOHANG): exit code (negative signal number if killed), None while still running."""
+        if self._exit_code is not None:
+            return self._exit_code
+        try:
+            pid, status = os.waitpid(self._popen.pid, os.WNOHANG)
+        except ChildProcessError:
+            return 0  # reaped elsewhere, status lost
+        if pid == 0:
+            return None
+        self._exit_code = os.waitstatus_to_exitcode(status)
+        self._popen.returncode = self._exit_code  # keep Popen from waiting on it again
+        return self._exit_code
+
+    def _reap_later(self):
+        if self._reap() is None:
+            QtCore.QTimer.singleShot(1000, self._reap_later)
+
+# The pty slave (the child's stdin) becomes its controlling terminal in a helper that then
+# execs the real program under the same pid, not in a preexec_fn: Python code between fork
+# and exec can deadlock once the GUI runs threads (OutputPipeline, ProcMonitor).
+_PTY_CTTY_HELPER = ("import fcntl, os, sys, termios\n"
+                    "try:\n    fcntl.ioctl(0, termios.TIOCSCTTY, 0)\nexcept OSError:\n    pass\n"
+                    "os.execvp(sys.argv[1], sys.argv[1:])")
+_pty_prefix = None
+
+def _pty_exec_prefix():
+    """-> (argv prefix, start_new_session) for PtyProcess.start."""
+    global _pty_prefix
+    if _pty_prefix is None:
+        import shutil
+        setsid = shutil.which("setsid")
+        if setsid:
+            # util-linux / busybox setsid(1): setsid() + TIOCSCTTY (-c), then exec. The Popen
+            # child is no process group leader, so setsid(1) doesn't fork and the pid stays ours.
+            _pty_prefix = ([setsid, "-c"], False)
+        elif not getattr(sys, "frozen", False):
+            _pty_prefix = ([sys.executable, "-c", _PTY_CTTY_HELPER], True)
+        else:
+            _pty_prefix = ([], True)  # no helper: own session, but no job control in the shell
+    return _pty_prefix
+
+# --------------------------- Shell integration ---------------------------
+# bash reports its state through invisible OSC strings:
+#   OSC 133 ; C ; <command>    command line read, execution starts (PS0); the command text
+#                              comes from bash's own history, empty when the line was not
+#                              recorded (ignorespace/ignoredups, history off)
+#   OSC 133 ; D ; <status>     command finished with exit status (PROMPT_COMMAND)
+#   OSC 7 ; file://host/path   current directory, after every command (PROMPT_COMMAND)
+# The tab reads them from the output stream, no extra processes or probes needed.
+_BASH_INTEGRATION = r"""# generated by O.T.P terminal, rewritten on start
+[ -f ~/.bashrc ] && . ~/.bashrc
+__otp_prompt() {
+    local status=$?
+    __otp_histcmd=$HISTCMD
+    printf '\033]133;D;%s\007\033]7;file://%s%s\007' "$status" "$HOSTNAME" "$PWD"
+}
+__otp_preexec() {
+    local n c
+    read -r n c <<< "$(HISTTIMEFORMAT= builtin history 1)"
+    [ "${n%\*}" = "$__otp_histcmd" ] || c=
+    c=${c//$'\a'/}; c=${c//$'\e'/}
+    printf '\033]133;C;%s\007' "$c"
+}
+PROMPT_COMMAND="__otp_prompt${PROMPT_COMMAND:+; $PROMPT_COMMAND}"
+PS0="${PS0}\[\$(__otp_preexec)\]"
+"""
+
+def bash_integration_rcfile():
+    """Path of the --rcfile that sources ~/.bashrc and adds the OSC hooks (None if it can't be written)."""
+    try:
+        with open(SHELL_RC_FILE, "r", encoding="utf-8") as f:
+            if f.read() == _BASH_INTEGRATION:
+                return SHELL_RC_FILE
+    except OSError:
+        pass
+    try:
+        write_file_atomic(SHELL_RC_FILE, _BASH_INTEGRATION)
+    except OSError:
+        return None
+    return SHELL_RC_FILE
+
+# one finished shell command, see TerminalTab.command_log
+CommandRecord = collections.namedtuple("CommandRecord", "cmd cwd started duration exit_code out_bytes")
+
+def parse_osc7(payload: str):
+    """'7;file://host/some%20dir' -> '/some dir' (None if not an OSC 7 cwd report)."""
+    if not payload.startswith("7;file://"):
+        return None
+    rest = payload[9:]
+    slash = rest.find("/")
+    if slash < 0:
+        return None
+    path = rest[slash:]
+    if "%" in path:
+        from urllib.parse import unquote
+        path = unquote(path)
+    return path
+
+# --------------------------- Output pipeline ---------------------------
+class OutputPipeline(QtCore.QObject):
+    """
+    Per-tab worker that turns raw process bytes into ready-to-insert runs off the GUI thread.
+    The GUI thread only copies bytes out of the process (submit); decoding (incremental, so
+    multi-byte characters split across reads survive), ANSI parsing and keyword highlighting
+    happen on a daemon thread. Results are coalesced and delivered through batch_ready,
+    which Qt queues to the GUI thread because it is emitted from the worker.
+    A batch is a list of (source, runs) and (source, callable) items in arrival order,
+    emitted together with the number of raw bytes it consumed.
+    For sources registered with watch_records (the bundled scanners run via "run"), complete
+    "[OPEN] host:port  Banner: ..." lines are taken out of the text and emitted as ScanRecord
+    lists through records_ready instead.
+    pending counts bytes submitted but not yet rendered (both sides run on the GUI thread:
+    submit adds, the tab subtracts after inserting a batch), it drives the backpressure.
+    """
+    batch_ready = QtCore.pyqtSignal(object, int)
+    records_ready = QtCore.pyqtSignal(object)
+
+    # keep a batch under this much worker time so the GUI gets steady updates
+    BATCH_SECONDS = 0.02
+
+    def __init__(self, highlights: dict, parent=None):
+        super().__init__(parent)
+        self.highlights = highlights
+        self._queue = queue.Queue()
+        self._decoders = {}
+        self._parsers = {}
+        self._windows = platform.system().lower().startswith("win")
+        self.pending = 0
+        self._record_sources = set()
+        self._line_carry = {}
+        self._scan_host = {}
+        self._records = []
+        self._thread = threading.Thread(target=self._run, name="otp-output", daemon=True)
+        self._thread.start()
+
+    def submit(self, source, data: bytes):
+        if data:
+            self.pending += len(data)
+            self._queue.put((source, data))
+
+    def rendered(self, nbytes: int):
+        self.pending = max(0, self.pending - nbytes)
+
+    def post(self, source, fn):
+        """Run fn on the GUI thread after everything submitted before it has been delivered."""
+        self._queue.put((source, fn))
+
+    def close_source(self, source):
+        self._queue.put((source, None))
+
+    def watch_records(self, source):
+        """Turn this source's [OPEN] result lines into records (call before it produces output)."""
+        self._record_sources.add(source)
+
+    def stop(self):
+        self._queue.put(None)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = []
+            nbytes = 0
+            deadline = time.monotonic() + self.BATCH_SECONDS
+            while True:
+                source, data = item
+                if data is None:
+                    self._decoders.pop(source, None)
+                    self._parsers.pop(source, None)
+                    self._record_sources.discard(source)
+                    self._scan_host.pop(source, None)
+                    rest = self._line_carry.pop(source, "")
+                    if rest:
+                        batch.append((source, [(rest, AnsiParser.DEFAULT_KEY)]))
+                elif callable(data):
+                    batch.append((source, data))
+                else:
+                    nbytes += len(data)
+                    try:
+                        runs = self._process(source, data)
+                    except Exception as e:
+                        runs = [(f"[output decode error: {e}]\n", AnsiParser.DEFAULT_KEY)]
+                    if runs:
+                        batch.append((source, runs))
+                if time.monotonic() >= deadline:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._emit(batch, nbytes)
+                    return
+            self._emit(batch, nbytes)
+
+    def _emit(self, batch, nbytes):
+        if self._records:
+            records, self._records = self._records, []
+            try:
+                self.records_ready.emit(records)
+            except RuntimeError:
+                pass
+        if batch or nbytes:
+            try:
+                self.batch_ready.emit(batch, nbytes)
+            except RuntimeError:  # tab already deleted
+                pass
+
+    def _process(self, source, data: bytes):
+        parser = self._parsers.get(source)
+        if parser is None:
+            parser = self._parsers[source] = AnsiParser()
+        text = self._decode(source, data)
+        if source in self._record_sources:
+            text = self._extract_records(source, text)
+        return highlight_runs(parser.feed(text), self.highlights)
+
+    def _extract_records(self, source, text: str) -> str:
+        lines = (self._line_carry.pop(source, "") + text).split("\n")
+        tail = lines.pop()  # not terminated yet
+        keep = []
+        for line in lines:
+            clean = line.rstrip("\r")
+            m = _SCAN_OPEN_RE.match(clean)
+            if m:
+                host, port, banner = m.group(1), int(m.group(2)), (m.group(4) or "").strip()
+                cur_host, cur_ip = self._scan_host.get(source, ("", ""))
+                if host is None:
+                    host = cur_host  # menuScanner single-host modes print only the port
+                self._records.append(ScanRecord(host, cur_ip if host == cur_host else "", port, True, banner,
+                                                m.group(3) or "tcp"))
+                continue
+            h = _SCAN_HOST_RE.search(clean)
+            if h:
+                self._scan_host[source] = (h.group(1), h.group(2))
+            keep.append(line + "\n")
+        # hold back only what may become an [OPEN] line; prompts (input()) pass straight through
+        if tail and (tail.startswith("[OPEN]") or "[OPEN]".startswith(tail)):
+            self._line_carry[source] = tail
+        else:
+            keep.append(tail)
+        return "".join(keep)
+
+    def _decode(self, source, data: bytes) -> str:
+        dec = self._decoders.get(source)
+        if dec is None:
+            errors = "strict" if self._windows else "replace"
+            dec = self._decoders[source] = codecs.getincrementaldecoder("utf-8")(errors=errors)
+        try:
+            return dec.decode(data)
+        except UnicodeDecodeError:
+            # decoding with fallback for Windows (utf-8 -> cp850 -> latin1)
+            dec.reset()
+            try:
+                return data.decode("cp850")
+            except Exception:
+                return data.decode("latin1", errors="replace")
+
+# --------------------------- Scan results panel ---------------------------
+# same fields as consoleScanner.ScanResult, used for results parsed from script output
+# (plus proto, "tcp" unless the line says otherwise; ScanResult rows have none and count as tcp)
+ScanRecord = collections.namedtuple("ScanRecord", "host ip port is_open banner proto", defaults=("tcp",))
+# menuScanner / consoleScanner / udpScanner result and host header lines ("[OPEN] h:53/udp  Banner: ...")
+_SCAN_OPEN_RE = re.compile(r"\[OPEN\] (?:(\S+):)?(\d+)(?:/(tcp|udp))?\s*(?:Banner: (.*))?$")
+_SCAN_HOST_RE = re.compile(r"(?:--- )?(\S+) \((\d{1,3}(?:\.\d{1,3}){3})\)")
+
+class ScanResultsModel(QtCore.QAbstractTableModel):
+    """
+    Open ports found by scans run from the tab. Rows are appended in batches
+    (one beginInsertRows per batch). Filtering and sorting are done here on a list of row
+    indices instead of through QSortFilterProxyModel, so a 100k row table re-filters and
+    re-sorts with one Python list operation rather than a data() call per comparison.
+    Filter syntax: space separated terms, host=10.0.* (glob), port=22 or port=20-25,
+    proto=udp, service=ssh, anything else is a substring match on host/ip/service/banner.
+    """
+    COLUMNS = ["Host", "IP", "Port", "Proto", "Servis", "Banner"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []          # (host, ip, port, proto, service, banner)
+        self._visible = []       # indices into _rows, filtered and sorted
+        self._pred = None
+        self._sort = None        # (column, order)
+        self._services = {}
+
+    # --- Qt model API ---
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._visible)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and index.isValid():
+            return self._rows[self._visible[index.row()]][index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self._sort = (column, order)
+        self._relayout()
+
+    # --- data ---
+    def total(self):
+        return len(self._rows)
+
+    def add_records(self, records):
+        start = len(self._rows)
+        for r in records:
+            if r.is_open:
+                proto = getattr(r, "proto", "tcp")
+                self._rows.append((r.host, r.ip, r.port, proto, self._service(r.port, proto), r.banner))
+        new = range(start, len(self._rows))
+        if self._pred is not None:
+            new = [i for i in new if self._pred(self._rows[i])]
+        if not new:
+            return
+        first = len(self._visible)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(new) - 1)
+        self._visible.extend(new)
+        self.endInsertRows()
+        if self._sort is not None:
+            # Timsort on an already sorted list plus a tail is close to linear
+            self._relayout()
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._visible = []
+        self.endResetModel()
+
+    def set_filter(self, text: str):
+        self._pred = self._compile_filter(text)
+        self.beginResetModel()
+        rows = self._rows
+        if self._pred is None:
+            self._visible = list(range(len(rows)))
+        else:
+            pred = self._pred
+            self._visible = [i for i in range(len(rows)) if pred(rows[i])]
+        self._apply_sort()
+        self.endResetModel()
+
+    def _relayout(self):
+        """Re-sort _visible as a layout change; selection and other persistent indexes follow their rows."""
+        self.layoutAboutToBeChanged.emit()
+        old = self.persistentIndexList()
+        keys = [self._visible[i.row()] for i in old]
+        self._apply_sort()
+        if old:
+            pos = {r: n for n, r in enumerate(self._visible)}
+            self.changePersistentIndexList(old, [self.index(pos[k], i.column()) for k, i in zip(keys, old)])
+        self.layoutChanged.emit()
+
+    def _apply_sort(self):
+        if self._sort is None:
+            return
+        column, order = self._sort
+        rows = self._rows
+        if column == 1:
+            key = lambda i: _ip_sort_key(rows[i][1])
+        elif column == 2:
+            key = lambda i: rows[i][2]
+        else:
+            key = lambda i: str(rows[i][column]).lower()
+        self._visible.sort(key=key, reverse=(order == QtCore.Qt.DescendingOrder))
+
+    def _service(self, port, proto="tcp"):
+        name = self._services.get((port, proto))
+        if name is None:
+            import socket
+            try:
+                name = socket.getservbyport(port, proto)
+            except OSError:
+                name = ""
+            self._services[(port, proto)] = name
+        return name
+
+    @staticmethod
+    def _compile_filter(text: str):
+        import fnmatch
+        checks = []
+        for term in text.split():
+            k, sep, v = term.partition("=")
+            k = k.lower()
+            if sep and k == "host":
+                pat = v.lower()
+                checks.append(lambda r, pat=pat: fnmatch.fnmatchcase(r[0].lower(), pat) or fnmatch.fnmatchcase(r[1], pat))
+            elif sep and k == "port":
+                lo, _, hi = v.partition("-")
+                try:
+                    lo = int(lo)
+                    hi = int(hi) if hi else lo
+                except ValueError:
+                    continue
+                checks.append(lambda r, lo=lo, hi=hi: lo <= r[2] <= hi)
+            elif sep and k == "proto":
+                v = v.lower()
+                checks.append(lambda r, v=v: r[3] == v)
+            elif sep and k == "service":
+                v = v.lower()
+                checks.append(lambda r, v=v: v in r[4].lower())
+            else:
+                t = term.lower()
+                checks.append(lambda r, t=t: t in r[0].lower() or t in r[1] or t in r[4] or t in r[5].lower())
+        if not checks:
+            return None
+        return lambda r: all(c(r) for c in checks)
+
+def _ip_sort_key(ip: str):
+    try:
+        return tuple(int(x) for x in ip.split("."))
+    except ValueError:
+        return (999, ip)
+
+class ScanResultsPanel(QtWidgets.QWidget):
+    """Filter line + table view over ScanResultsModel, shown under the tab output."""
+    def __init__(self, fg: str, bg: str, parent=None):
+        super().__init__(parent)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(4)
+
+        row = QtWidgets.QHBoxLayout()
+        self.filter = QtWidgets.QLineEdit()
+        self.filter.setPlaceholderText("filtre: host=10.0.* port=20-25 proto=udp service=ssh veya metin")
+        self.filter.setStyleSheet(f"background-color:#1a1a1a; color:{fg}; border:1px solid {fg}; padding:2px;")
+        row.addWidget(self.filter, 1)
+        self.count = QtWidgets.QLabel("0 sonuç")
+        self.count.setStyleSheet(f"color:{fg};")
+        row.addWidget(self.count)
+        clear_btn = QtWidgets.QPushButton("Temizle")
+        clear_btn.clicked.connect(self.clear)
+        row.addWidget(clear_btn)
+        hide_btn = QtWidgets.QPushButton("Gizle")
+        hide_btn.clicked.connect(self.hide)
+        row.addWidget(hide_btn)
+        layout.addLayout(row)
+
+        self.model = ScanResultsModel(self)
+        self.view = QtWidgets.QTableView()
+        self.view.setModel(self.model)
+        self.view.setSortingEnabled(True)
+        self.view.horizontalHeader().setSortIndicator(-1, QtCore.Qt.AscendingOrder)
+        self.view.horizontalHeader().setStretchLastSection(True)
+        vh = self.view.verticalHeader()
+        vh.setVisible(False)
+        vh.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)  # uniform rows: no per-row size hints
+        vh.setDefaultSectionSize(self.view.fontMetrics().height() + 6)
+        self.view.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.view.setStyleSheet(f"background-color:{bg}; color:{fg}; gridline-color:#333;")
+        layout.addWidget(self.view, 1)
+
+        # re-filter after typing pauses, not on every key
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(200)
+        self._filter_timer.timeout.connect(lambda: (self.model.set_filter(self.filter.text()), self._update_count()))
+        self.filter.textChanged.connect(lambda _: self._filter_timer.start())
+
+    def add_records(self, records):
+        self.model.add_records(records)
+        self._update_count()
+
+    def clear(self):
+        self.model.clear()
+        self._update_count()
+
+    def _update_count(self):
+        shown, total = self.model.rowCount(), self.model.total()
+        self.count.setText(f"{shown} sonuç" if shown == total else f"{shown}/{total} sonuç")
+
+# --------------------------- In-process scans ---------------------------
+class ScanWorker(QtCore.QObject):
+    """
+    Runs consoleScanner's scan core (scan_hosts) on a daemon thread inside the terminal
+    instead of a separate interpreter. Each probe result is a consoleScanner.ScanResult
+    record; records are collected by the scan threads and emitted in batches every
+    FLUSH_SECONDS through `records`, so the tab gets structured data, not text to decode.
+    """
+    records = QtCore.pyqtSignal(object)          # list of ScanResult
+    host_failed = QtCore.pyqtSignal(str, str)    # host, error
+    done = QtCore.pyqtSignal(float, bool)        # elapsed seconds, stopped by user
+
+    FLUSH_SECONDS = 0.1
+
+    def __init__(self, core, targets, ports, timeout=1.0, workers=50, parent=None):
+        super().__init__(parent)
+        self.core = core
+        self.targets = targets
+        self.ports = ports
+        self.timeout = timeout
+        self.workers = workers
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._buf = []
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="otp-scan", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def _on_result(self, r):
+        with self._lock:
+            self._buf.append(r)
+
+    def _on_error(self, host, e):
+        self.host_failed.emit(host, str(e))
+
+    def _flush(self):
+        with self._lock:
+            buf, self._buf = self._buf, []
+        if buf:
+            self.records.emit(buf)
+
+    def _run(self):
+        t0 = time.monotonic()
+        scan = threading.Thread(
+            target=self.core.scan_hosts, name="otp-scan-core", daemon=True,
+            args=(self.targets, self.ports, self.timeout, self.workers),
+            kwargs={"on_result": self._on_result, "on_error": self._on_error, "stop": self._stop})
+        scan.start()
+        while scan.is_alive():
+            scan.join(self.FLUSH_SECONDS)
+            self._flush()
+        self._flush()
+        try:
+            self.done.emit(time.monotonic() - t0, self._stop.is_set())
+        except RuntimeError:  # tab already deleted
+            pass
+
+# --------------------------- Resource monitor ---------------------------
+ProcSample = collections.namedtuple("ProcSample", "label depth pid name cpu rss fds read_rate write_rate")
+
+class ProcMonitor(QtCore.QObject):
+    """
+    Samples CPU%, RSS, open FDs and I/O rates of a tab's processes and all their descendants
+    on a daemon thread. The tab pushes the root pids with request() (its panel timer sets the
+    interval), the sample comes back through `sampled` as a list of ProcSample rows.
+    Linux reads /proc directly; other platforms use psutil when it is installed.
+    """
+    sampled = QtCore.pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._prev = {}   # (pid, start time) -> (cpu seconds, read bytes, write bytes, monotonic)
+        self._queue = queue.Queue()
+        self._use_proc = os.path.isdir("/proc/self/fd")
+        self._psutil = None
+        self._thread = threading.Thread(target=self._run, name="otp-procmon", daemon=True)
+        self._thread.start()
+
+    def request(self, roots):
+        """roots: [(label, pid)], sampled on the monitor thread (older requests are dropped)."""
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._queue.put(list(roots))
+
+    def stop(self):
+        self._queue.put(None)
+
+    def _run(self):
+        if not self._use_proc:
+            try:
+                import psutil
+                self._psutil = psutil
+            except ImportError:
+                pass
+        while True:
+            roots = self._queue.get()
+            if roots is None:
+                return
+            try:
+                rows = self._sample(roots)
+            except Exception:
+                rows = []
+            try:
+                self.sampled.emit(rows)
+            except RuntimeError:
+                return  # tab deleted
+
+    def _sample(self, roots):
+        if not self._use_proc and self._psutil is None:
+            return None  # nothing to sample with
+        read = self._read_proc if self._use_proc else self._read_psutil
+        now = time.monotonic()
+        rows, seen = [], {}
+        for label, pid in roots:
+            stack = [(pid, 0, label)]
+            while stack:
+                pid, depth, lbl = stack.pop()
+                info = read(pid)
+                if info is None:
+                    continue
+                key, name, cpu_s, rss, fds, rbytes, wbytes, children = info
+                cpu = rrate = wrate = 0.0
+                prev = self._prev.get(key)
+                if prev is not None and now > prev[3]:
+                    dt = now - prev[3]
+                    cpu = (cpu_s - prev[0]) / dt * 100
+                    rrate = max(0, rbytes - prev[1]) / dt
+                    wrate = max(0, wbytes - prev[2]) / dt
+                seen[key] = (cpu_s, rbytes, wbytes, now)
+                rows.append(ProcSample(lbl, depth, pid, name, cpu, rss, fds, rrate, wrate))
+                for child in reversed(children):
+                    stack.append((child, depth + 1, ""))
+        self._prev = seen  # forget exited processes
+        return rows
+
+    _TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+    _PAGE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+    def _read_proc(self, pid):
+        base = f"/proc/{pid}"
+        try:
+            with open(base + "/stat", "rb") as f:
+                stat = f.read().decode("utf-8", "replace")
+        except OSError:
+            return None
+        lp, rp = stat.find("("), stat.rfind(")")
+        name = stat[lp + 1:rp]
+        fields = stat[rp + 2:].split()  # fields[0] is field 3 (state)
+        cpu_s = (int(fields[11]) + int(fields[12])) / self._TICKS
+        rss = int(fields[21]) * self._PAGE
+        key = (pid, fields[19])  # start time tells a reused pid apart
+        try:
+            fds = len(os.listdir(base + "/fd"))
+        except OSError:
+            fds = None
+        rbytes = wbytes = 0
+        try:
+            with open(base + "/io", "rb") as f:
+                for line in f:
+                    if line.startswith(b"rchar:"):
+                        rbytes = int(line[6:])
+                    elif line.startswith(b"wchar:"):
+                        wbytes = int(line[6:])
+        except OSError:
+            pass
+        return key, name, cpu_s, rss, fds, rbytes, wbytes, self._proc_children(pid)
+
+    def _proc_children(self, pid):
+        children = []
+        try:
+            for tid in os.listdir(f"/proc/{pid}/task"):
+                with open(f"/proc/{pid}/task/{tid}/children", "rb") as f:
+                    children.extend(int(c) for c in f.read().split())
+            return children
+        except OSError:
+            pass
+        # kernels without the children file (or a thread gone mid-read): one pass over every
+        # process' parent pid; drop what the partial read found, the walk sees those too
+        children = []
+        for entry in os.listdir("/proc"):
+            if entry.isdigit():
+                try:
+                    with open(f"/proc/{entry}/stat", "rb") as f:
+                        stat = f.read()
+                    if int(stat[stat.rfind(b")") + 2:].split()[1]) == pid:
+                        children.append(int(entry))
+                except (OSError, ValueError, IndexError):
+                    pass
+        return children
+
+    def _read_psutil(self, pid):
+        psutil = self._psutil
+        try:
+            p = psutil.Process(pid)
+            with p.oneshot():
+                t = p.cpu_times()
+                rss = p.memory_info().rss
+                try:
+                    fds = p.num_fds() if hasattr(p, "num_fds") else p.num_handles()
+                except psutil.Error:
+                    fds = None
+                try:
+                    io = p.io_counters()
+                    rbytes, wbytes = io.read_bytes, io.write_bytes
+                except (psutil.Error, AttributeError):
+                    rbytes = wbytes = 0
+                key = (pid, p.create_time())
+                children = [c.pid for c in p.children()]
+                return key, p.name(), t.user + t.system, rss, fds, rbytes, wbytes, children
+        except psutil.Error:
+            return None
+
+
+class ResourcePanel(QtWidgets.QWidget):
+    """Live table of ProcMonitor samples, shown under the tab output (`monitor` builtin)."""
+    COLUMNS = ("Süreç", "PID", "CPU%", "RSS", "FD", "Okuma/s", "Yazma/s")
+
+    def __init__(self, fg: str, bg: str, parent=None):
+        super().__init__(parent)
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(4)
+
+        row = QtWidgets.QHBoxLayout()
+        self.summary = QtWidgets.QLabel("örnekleniyor...")
+        self.summary.setStyleSheet(f"color:{fg};")
+        row.addWidget(self.summary, 1)
+        hide_btn = QtWidgets.QPushButton("Gizle")
+        hide_btn.clicked.connect(self.hide)
+        row.addWidget(hide_btn)
+        layout.addLayout(row)
+
+        self.table = QtWidgets.QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.setStyleSheet(f"background-color:{bg}; color:{fg}; gridline-color:#333;")
+        layout.addWidget(self.table, 1)
+
+    def show_samples(self, rows):
+        if rows is None:
+            self.summary.setText("psutil yüklü değil: bu platformda süreç bilgisi okunamıyor")
+            self.table.setRowCount(0)
+            return
+        self.table.setRowCount(len(rows))
+        for r, s in enumerate(rows):
+            name = ("  " * s.depth) + (f"{s.label}: {s.name}" if s.label else s.name)
+            values = (name, str(s.pid), f"{s.cpu:.1f}", format_bytes(s.rss),
+                      "-" if s.fds is None else str(s.fds),
+                      format_bytes(s.read_rate), format_bytes(s.write_rate))
+            for c, v in enumerate(values):
+                item = self.table.item(r, c)
+                if item is None:
+                    item = QtWidgets.QTableWidgetItem()
+                    if c:
+                        item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+                    self.table.setItem(r, c, item)
+                item.setText(v)
+        cpu = sum(s.cpu for s in rows)
+        rss = sum(s.rss for s in rows)
+        fds = sum(s.fds or 0 for s in rows)
+        self.summary.setText(f"{len(rows)} süreç · CPU {cpu:.1f}% · RSS {format_bytes(rss)} · {fds} FD")
+
+# --------------------------- Command history ---------------------------
+class HistoryStore(QtCore.QObject):
+    """
+    Command history shared by all tabs and kept across sessions.
+    On disk: append-only HISTORY_FILE, one "timestamp<TAB>cwd<TAB>command" line per entry.
+    In memory: the entry list plus two indexes, cmd -> last position (dedupe, recency) and a
+    sorted list of distinct commands (prefix lookup with bisect), so reverse and prefix search
+    stay fast with 100k+ entries. The file is read on a background thread at startup and new
+    entries are appended in batches by a background flush, the input line never waits on disk.
+    path=None keeps history in memory only.
+    """
+    FLUSH_MS = 2000
+    loaded = QtCore.pyqtSignal(object)
+
+    def __init__(self, path: str = HISTORY_FILE, parent=None):
+        super().__init__(parent)
+        self.loaded.connect(self._on_loaded)
+        self.path = path
+        self._entries = []         # (cmd, cwd), oldest first
+        self._last = {}            # cmd -> last index in _entries
+        self._last_in_cwd = {}     # (cwd, cmd) -> last index, for per-cwd ranking
+        self._sorted = []          # distinct commands, sorted
+        self._version = 0          # bumped on every index change, invalidates _hits
+        self._hits = None          # (query, version, sorted indices of matching entries)
+        self._unsaved = []
+        # nothing is written before the file has been read: a line flushed earlier would be
+        # read back by _load and end up twice in memory (_on_loaded starts the timer)
+        self._loading = bool(path)
+        self._io_lock = threading.Lock()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(self.FLUSH_MS)
+        self._timer.timeout.connect(self._flush_async)
+        if path:
+            threading.Thread(target=self._load, name="otp-history", daemon=True).start()
+
+    # --- writing ---
+    def add(self, cmd: str, cwd: str = ""):
+        cmd = cmd.strip()
+        if not cmd:
+            return
+        if self._entries and self._entries[-1][0] == cmd:
+            self._index(len(self._entries) - 1, cmd, cwd)  # same as last: only refresh recency
+            return
+        self._entries.append((cmd, cwd))
+        self._index(len(self._entries) - 1, cmd, cwd)
+        if self.path:
+            self._unsaved.append(f"{int(time.time())}\t{cwd.replace(chr(9), ' ')}\t{cmd}\n")
+
+    def flush(self):
+        if self._loading:
+            return
+        lines, self._unsaved = self._unsaved, []
+        self._append(lines)
+
+    def _flush_async(self):
+        if self._unsaved and not self._loading:
+            lines, self._unsaved = self._unsaved, []
+            threading.Thread(target=self._append, args=(lines,), daemon=True).start()
+
+    def _append(self, lines):
+        if not lines or not self.path:
+            return
+        with self._io_lock:
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("".join(lines))
+            except OSError:
+                pass
+
+    # --- loading ---
+    def _load(self):
+        # read and compaction share one lock hold: a flush landing in between would be
+        # overwritten by the rewrite
+        entries, lines = [], []
+        with self._io_lock:
+            try:
+                with open(self.path, "r", encoding="utf-8", errors="replace") as f:
+                    for line in f:
+                        parts = line.rstrip("\n").split("\t", 2)
+                        if len(parts) == 3 and parts[2]:
+                            entries.append((parts[2], parts[1]))
+                            lines.append(line if line.endswith("\n") else line + "\n")
+            except OSError:
+                pass
+            if len(entries) > HISTORY_MAX:
+                entries = entries[-HISTORY_MAX:]
+                self._compact(lines[-HISTORY_MAX:])
+        try:
+            self.loaded.emit(entries)
+        except RuntimeError:
+            pass
+
+    def _compact(self, lines):
+        """Rewrite the file with only `lines` (kept verbatim, timestamps included); caller holds _io_lock."""
+        try:
+            write_file_atomic(self.path, "".join(lines))
+        except Exception:
+            pass
+
+    def _on_loaded(self, entries):
+        # older entries from disk go before whatever was typed while loading
+        current = self._entries
+        self._entries = entries + current
+        self._last.clear()
+        self._last_in_cwd.clear()
+        for i, (cmd, cwd) in enumerate(self._entries):
+            self._last[cmd] = i
+            self._last_in_cwd[(cwd, cmd)] = i
+        self._sorted = sorted(self._last)
+        self._version += 1
+        self._loading = False
+        if self.path:
+            self._timer.start()
+
+    def _index(self, i, cmd, cwd):
+        if cmd not in self._last:
+            bisect.insort(self._sorted, cmd)
+        self._last[cmd] = i
+        self._last_in_cwd[(cwd, cmd)] = i
+        self._version += 1
+
+    # --- searching ---
+    def __len__(self):
+        return len(self._entries)
+
+    def recent(self, prefix: str = "", cwd: str = None):
+        """
+        Distinct commands for Up-arrow navigation, best first. Without a prefix: most recent
+        first (lazy). With a prefix: commands starting with it, the ones used in cwd first.
+        """
+        if not prefix:
+            return self._iter_recent()
+        lo = bisect.bisect_left(self._sorted, prefix)
+        hi = bisect.bisect_left(self._sorted, prefix + "\U0010ffff")
+        cands = self._sorted[lo:hi]
+        last, in_cwd = self._last, self._last_in_cwd
+        cands.sort(key=lambda c: (in_cwd.get((cwd, c), -1), last[c]), reverse=True)
+        return iter(cands)
+
+    def _iter_recent(self):
+        entries, last = self._entries, self._last
+        for i in range(len(entries) - 1, -1, -1):
+            cmd = entries[i][0]
+            if last.get(cmd) == i:
+                yield cmd
+
+    def reverse_search(self, query: str, before: int = None):
+        """Newest entry containing query older than index `before` -> (index, cmd) or None."""
+        n = len(self._entries)
+        hits = self._search_hits(query)
+        k = bisect.bisect_left(hits, n if before is None else min(before, n))
+        if not k:
+            return None
+        i = hits[k - 1]
+        return i, self._entries[i][0]
+
+    def _search_hits(self, query: str):
+        # Ctrl+R matches substrings, so the prefix range of _sorted can't narrow it; the distinct
+        # commands of _last (one last index each) are scanned once per query instead of every
+        # entry, and repeated Ctrl+R presses only bisect the cached, sorted hit list
+        hit = self._hits
+        if hit is None or hit[0] != query or hit[1] != self._version:
+            hit = self._hits = (query, self._version, sorted(i for c, i in self._last.items() if query in c))
+        return hit[2]
+
+# --------------------------- Completion ---------------------------
+class Completer:
+    """
+    Tab completion for the input line: builtins, executables on PATH, `run` keywords and
+    paths relative to the tab's cwd. Directory listings (PATH entries included) are cached
+    and revalidated with one stat() per directory, so a completion is a few dict lookups
+    and a bisect instead of a directory walk.
+    """
+
+    def __init__(self):
+        self._dirs = {}        # dir -> (mtime, sorted [(name, is_dir, is_exec)])
+        self._commands = None  # (key, sorted command names)
+
+    def _listing(self, d: str):
+        try:
+            mtime = os.stat(d).st_mtime_ns
+        except OSError:
+            return []
+        hit = self._dirs.get(d)
+        if hit and hit[0] == mtime:
+            return hit[1]
+        items = []
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    try:
+                        is_dir = e.is_dir()
+                    except OSError:
+                        is_dir = False
+                    items.append((e.name, is_dir, False if is_dir else self._is_exec(e)))
+        except OSError:
+            pass
+        items.sort()
+        self._dirs[d] = (mtime, items)
+        return items
+
+    @staticmethod
+    def _is_exec(entry) -> bool:
+        if platform.system() == "Windows":
+            exts = os.environ.get("PATHEXT", ".EXE;.BAT;.CMD").lower().split(";")
+            return os.path.splitext(entry.name)[1].lower() in exts
+        try:
+            return entry.is_file() and os.access(entry.path, os.X_OK)
+        except OSError:
+            return False
+
+    def commands(self):
+        dirs = [d for d in os.environ.get("PATH", "").split(os.pathsep) if d]
+        listings = [self._listing(d) for d in dirs]
+        key = tuple(self._dirs[d][0] if d in self._dirs else None for d in dirs)
+        if self._commands is None or self._commands[0] != key:
+            names = {n for l in listings for n, is_dir, is_exec in l if is_exec}
+            names.update(BUILTINS)
+            self._commands = (key, sorted(names))
+        return self._commands[1]
+
+    @staticmethod
+    def _prefixed(names, prefix):
+        lo = bisect.bisect_left(names, prefix)
+        hi = bisect.bisect_left(names, prefix + "\U0010ffff")
+        return names[lo:hi]
+
+    def _paths(self, token: str, cwd: str, dirs_only=False, suffix=None):
+        head, base = os.path.split(token)
+        d = os.path.join(cwd, os.path.expanduser(head)) if head else cwd
+        items = self._listing(d)
+        lo = bisect.bisect_left(items, (base,))
+        out = []
+        for name, is_dir, _ in items[lo:]:
+            if not name.startswith(base):
+                break
+            if name.startswith(".") and not base.startswith("."):
+                continue
+            if dirs_only and not is_dir:
+                continue
+            if suffix and not is_dir and not name.endswith(suffix):
+                continue
+            out.append(os.path.join(head, name) + (os.sep if is_dir else ""))
+        return out
+
+    def complete(self, text: str, cwd: str):
+        """-> (start, candidates): candidates replace text[start:]."""
+        start = max(text.rfind(" "), text.rfind("\t")) + 1
+        token = text[start:]
+        words = text[:start].split()
+        if not words:
+            if os.sep in token or (os.altsep and os.altsep in token):
+                return start, self._paths(token, cwd)
+            return start, self._prefixed(self.commands(), token)
+        first = words[0].lower()
+        if first == "cd":
+            return start, self._paths(token, cwd, dirs_only=True)
+        if first == "run" and len(words) == 1:
+            keys = [k for k in sorted(SCRIPT_KEYWORDS) if k.startswith(token.lower())]
+            return start, keys + self._paths(token, cwd, suffix=".py")
+        return start, self._paths(token, cwd)
+
+
+# --------------------------- Login Dialog ---------------------------
+class LoginDialog(QtWidgets.QDialog):
+    def __init__(self, store: "ConfigStore" = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("fsociety Terminal — Login")
+        self.setFixedSize(420, 260)
+        layout = QtWidgets.QVBoxLayout(self)
+        # main() passes the store it already loaded; login updates it in place
+        self.store = store if store is not None else ConfigStore(load_config())
+        self.cfg = self.store.data
+
+        layout.addWidget(QtWidgets.QLabel("Kullanıcı adı:"))
+        self.username = QtWidgets.QLineEdit()
+        layout.addWidget(self.username)
+
+        layout.addWidget(QtWidgets.QLabel("Şifre:"))
+        pw_row = QtWidgets.QHBoxLayout()
+        self.password = QtWidgets.QLineEdit()
+        self.password.setEchoMode(QtWidgets.QLineEdit.Password)
+        pw_row.addWidget(self.password)
+        self.toggle_pw = QtWidgets.QPushButton("Göster")
+        self.toggle_pw.setCheckable(True)
+        self.toggle_pw.setFixedWidth(80)
+        self.toggle_pw.clicked.connect(self.on_toggle_pw)
+        pw_row.addWidget(self.toggle_pw)
+        layout.addLayout(pw_row)
+
+        # theme selection
+        theme_row = QtWidgets.QHBoxLayout()
+        theme_row.addWidget(QtWidgets.QLabel("Tema:"))
+        self.theme_combo = QtWidgets.QComboBox()
+        self.theme_combo.addItems(["Koyu", "Açık"])
+        theme_row.addWidget(self.theme_combo)
+        theme_row.addStretch()
+        layout.addLayout(theme_row)
+
+        self.status = QtWidgets.QLabel("")
+        layout.addWidget(self.status)
+
+        btn_row = QtWidgets.QHBoxLayout()
+        btn_row.addStretch()
+        self.login_btn = QtWidgets.QPushButton("Giriş / Kaydet")
+        self.login_btn.clicked.connect(self.on_login)
+        btn_row.addWidget(self.login_btn)
+        layout.addLayout(btn_row)
+
+        # populate if exists
+        if isinstance(self.cfg, dict):
+            u = self.cfg.get("username")
+            theme = self.cfg.get("theme", "dark")
+            if u:
+                self.username.setText(u)
+            if theme == "light":
+                self.theme_combo.setCurrentText("Açık")
+            else:
+                self.theme_combo.setCurrentText("Koyu")
+
+    def on_toggle_pw(self):
+        if self.toggle_pw.isChecked():
+            self.password.setEchoMode(QtWidgets.QLineEdit.Normal)
+            self.toggle_pw.setText("Gizle")
+        else:
+            self.password.setEchoMode(QtWidgets.QLineEdit.Password)
+            self.toggle_pw.setText("Göster")
+
+    def on_login(self):
+        user = self.username.text().strip()
+        pw = self.password.text()
+        if not user or not pw:
+            self.status.setText("Kullanıcı adı ve şifre boş olamaz!")
+            return
+
+        cfg = self.cfg
+        pwhash = hash_password(pw)
+        # if config has username+password -> validate
+        if cfg.get("username") and cfg.get("password"):
+            if user == cfg.get("username") and pwhash == cfg.get("password"):
+                # update theme if changed
+                cfg["theme"] = "light" if self.theme_combo.currentText() == "Açık" else "dark"
+                self.store.save()
+                self.accept()
+                return
+            else:
+                self.status.setText("Hatalı kullanıcı adı veya şifre!")
+                return
+        else:
+            # first-time save
+            cfg["username"] = user
+            cfg["password"] = pwhash
+            cfg["theme"] = "light" if self.theme_combo.currentText() == "Açık" else "dark"
+            cfg["fg"] = cfg.get("fg", DEFAULT_FG)
+            cfg["bg"] = cfg.get("bg", DEFAULT_BG)
+            cfg["banner_color"] = cfg.get("banner_color", DEFAULT_BANNER_COLOR)
+            cfg["highlights"] = cfg.get("highlights", DEFAULT_HIGHLIGHTS)
+            self.store.save()
+            self.accept()
+            return
+
+# --------------------------- Terminal Tab (per-tab) ---------------------------
+class TerminalTab(QtWidgets.QWidget):
+    def __init__(self, name: str, username: str, cfg, history: "HistoryStore" = None):
+        super().__init__()
+        self.name = name
+        self.username = username
+        # shared ConfigStore (a plain dict is wrapped in a memory-only store)
+        self.config = cfg if isinstance(cfg, ConfigStore) else ConfigStore(cfg, path=None, parent=self)
+        self.cfg = self.config.data
+        self.cwd = os.getcwd()
+        # shared persistent history; per-tab navigation state (Up/Down, Ctrl+R)
+        self.history = history if history is not None else HistoryStore(path=None, parent=self)
+        self.hist_pos = -1
+        self._hist_iter = None
+        self._hist_seen = []
+        self._hist_draft = ""
+        self._rsearch = None              # Ctrl+R state: {"query", "index", "draft"}
+        self.completer = Completer()
+        self._last_tab = None             # text after the previous Tab, a second Tab lists candidates
+
+        # colors
+        self.fg = self.cfg.get("fg", DEFAULT_FG)
+        self.bg = self.cfg.get("bg", DEFAULT_BG)
+        self.banner_color = self.cfg.get("banner_color", DEFAULT_BANNER_COLOR)
+        self.highlights = self.cfg.get("highlights", DEFAULT_HIGHLIGHTS.copy()).copy()
+
+        # processes
+        self.shell_proc = None            # interactive persistent shell for this tab
+        self._shell_integrated = False    # bash started with the integration rcfile, see _on_shell_osc
+        # command markers (OSC 133): lines sent to the shell wait in _shell_cmds until bash
+        # reports it started one (C), _cmd_open then collects timing/output until D
+        self._shell_cmds = collections.deque()
+        self._cmd_open = None             # [cmd, cwd, wall start, perf start, out bytes]
+        self.command_log = collections.deque(maxlen=int(self.cfg.get("command_log_size", 1000)))
+        self.show_command_status = bool(self.cfg.get("command_status", True))
+        # resource monitor: created on first `monitor`, samples only while its panel is visible
+        self.monitor = None
+        self.monitor_panel = None
+        self.foreground_proc = None       # if a "run" script is foreground, forward stdin to it
+        self.child_procs = []             # background child processes list
+        self.scan_worker = None           # in-process scan ("scan" builtin)
+
+        # output rendering: decode/parse/highlight on a worker, QTextCharFormat cache per SGR key
+        self._formats = {}
+        self._pipeline = OutputPipeline(self.highlights, self)
+        self._pipeline.batch_ready.connect(self._on_output_batch)
+        self._pipeline.records_ready.connect(self._on_scan_records)
+        self.results_panel = None         # created on the first scan result
+
+        # backpressure: past high_water unrendered bytes either stop reading (the pipe/tty
+        # fills and blocks the producer) or drop output and report the skipped line count
+        self.high_water = int(self.cfg.get("output_high_water", OUTPUT_HIGH_WATER))
+        self.overflow_policy = self.cfg.get("output_overflow", "pause")  # "pause" | "drop"
+        self._paused_procs = []
+        self._skipped_lines = 0
+        self._bytes_in = 0
+        self._io_tick = time.monotonic()
+
+        # the shell and welcome banner are created on first show (see showEvent), so
+        # building a tab is cheap and hidden tabs never spawn a shell
+        self._initialized = False
+        self._shell_pending = []          # commands typed while the shell is still starting
+
+        self._build_ui()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._initialized:
+            self._initialized = True
+            # let the window paint first, then spawn
+            QtCore.QTimer.singleShot(0, self._lazy_init)
+
+    def _lazy_init(self):
+        self.show_welcome()
+        self._start_shell()
+
+    def _build_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(6)
+
+        # output: QTextEdit (we will insert HTML for highlights)
+        self.output = QtWidgets.QTextEdit()
+        self.output.setReadOnly(True)
+        self.output.setFont(QtGui.QFont("Courier", 11))
+        self.output.setStyleSheet(f"background-color: {self.bg}; color: {self.fg}; border:none; padding:6px;")
+        self.output.document().setMaximumBlockCount(int(self.cfg.get("scrollback_lines", DEFAULT_SCROLLBACK)))
+        # output on top, scan results table (if any) below
+        self.splitter = QtWidgets.QSplitter(QtCore.Qt.Vertical)
+        self.splitter.addWidget(self.output)
+        layout.addWidget(self.splitter, 1)
+
+        # input row
+        row = QtWidgets.QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        self.prompt = QtWidgets.QLabel(f"{self.username}@fsociety:$")
+        self.prompt.setTextFormat(QtCore.Qt.PlainText)
+        self.prompt.setStyleSheet(f"color: {self.fg}; font-weight: bold;")
+        row.addWidget(self.prompt)
+
+        self.input = QtWidgets.QLineEdit()
+        self.input.setStyleSheet(f"background-color:#1a1a1a; color:{self.fg}; border:1px solid {self.fg}; padding:4px;")
+        self.input.returnPressed.connect(self.on_enter)
+        self.input.textChanged.connect(self._on_input_edited)
+        row.addWidget(self.input, 1)
+
+        # live output rate / buffered bytes indicator
+        self.io_label = QtWidgets.QLabel("")
+        self.io_label.setStyleSheet(f"color: {self.fg}; font-size: 10px;")
+        row.addWidget(self.io_label)
+        layout.addLayout(row)
+        self._io_timer = QtCore.QTimer(self)
+        self._io_timer.timeout.connect(self._update_io_label)
+        self._io_timer.start(1000)
+
+        # allow up/down history
+        self.input.installEventFilter(self)
+
+    # ------------------ shell process ------------------
+    def _start_shell(self):
+        # start persistent shell which we will write commands to
+        try:
+            if self.shell_proc:
+                try:
+                    self.shell_proc.kill()
+                except:
+                    pass
+                self.shell_proc = None
+            self.shell_proc = self._new_process()
+            self._shell_integrated = False
+            self._shell_cmds.clear()
+            self._cmd_open = None
+            self.shell_proc.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+            self.shell_proc.readyReadStandardOutput.connect(lambda p=self.shell_proc: self._on_proc_output(p))
+            self.shell_proc.finished.connect(lambda code, status, p=self.shell_proc: self._on_proc_finished(p, code, status))
+            self.shell_proc.started.connect(lambda p=self.shell_proc: self._on_shell_started(p))
+            self.shell_proc.errorOccurred.connect(lambda err, p=self.shell_proc: self._on_shell_error(p, err))
+            try:
+                self.shell_proc.setWorkingDirectory(self.cwd)
+            except:
+                pass
+
+            if platform.system().lower().startswith("win"):
+                prog = "powershell"
+                args = ["-NoLogo", "-NoExit"]
+            else:
+                prog = "/bin/bash"
+                args = ["-i"]
+                if isinstance(self.shell_proc, PtyProcess):
+                    # no readline on the pty: it would echo and redraw what we write
+                    args = ["--noediting", "-i"]
+                rcfile = bash_integration_rcfile()
+                if rcfile:
+                    # cwd and command start/end reports come back as OSC strings
+                    args = ["--rcfile", rcfile] + args
+                    self._shell_integrated = True
+            # asynchronous: _on_shell_started / _on_shell_error report the outcome
+            self.shell_proc.start(prog, args)
+        except Exception as e:
+            self._append_html(f"[error] Shell başlatma hatası: {e}\n", kind="error")
+
+    def _shell_reports_cwd(self) -> bool:
+        """True when the running shell is bash with the OSC 7 integration (cd goes to the shell)."""
+        return (self.shell_proc is not None and self._shell_integrated
+                and self.shell_proc.state() != QtCore.QProcess.NotRunning)
+
+    def _on_shell_started(self, proc):
+        if proc is not self.shell_proc:
+            return
+        pending, self._shell_pending = self._shell_pending, []
+        for cmd in pending:
+            proc.write((cmd + "\n").encode("utf-8"))
+
+    def _on_shell_error(self, proc, err):
+        if proc is not self.shell_proc or err != QtCore.QProcess.FailedToStart:
+            return
+        self.shell_proc = None
+        self._append_html("[error] Shell başlatılamadı.\n", kind="error")
+        # run what was typed in the meantime as one-shot processes
+        pending, self._shell_pending = self._shell_pending, []
+        for cmd in pending:
+            self._spawn_short(proc_cmd=cmd)
+
+    def _new_process(self):
+        """PTY backed process on Linux (cfg shell_backend = "pty"), pipe QProcess otherwise."""
+        backend = self.cfg.get("shell_backend", "pty" if HAS_PTY else "pipe")
+        if HAS_PTY and backend == "pty":
+            p = PtyProcess(self)
+            p.set_window_size(*self._terminal_size())
+            # bounded tty-side buffer: when the tab stops reading, the child blocks on write
+            p.setReadBufferSize(max(64 * 1024, self.high_water // 4))
+            return p
+        return QtCore.QProcess(self)
+
+    def _terminal_size(self):
+        """Rows/columns that fit in the output view with the current font."""
+        fm = self.output.fontMetrics()
+        vp = self.output.viewport()
+        cols = vp.width() // max(1, fm.horizontalAdvance("M"))
+        rows = vp.height() // max(1, fm.lineSpacing())
+        return max(rows, 10), max(cols, 40)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        rows, cols = self._terminal_size()
+        for p in (self.shell_proc, self.foreground_proc):
+            if isinstance(p, PtyProcess):
+                p.set_window_size(rows, cols)
+
+    def _on_proc_output(self, proc, force: bool = False):
+        # pipe output of any child process (shell_proc or child_procs); only the copy
+        # happens here, decoding and highlighting run in self._pipeline
+        throttled = not force and self._pipeline.pending >= self.high_water
+        # a pipe QProcess keeps draining into its own buffer (Qt has no read limit for it),
+        # so past high_water bytes there it degrades to dropping
+        if throttled and self.overflow_policy != "drop" and (
+                isinstance(proc, PtyProcess) or proc.bytesAvailable() < self.high_water):
+            # leave the data in the process buffer; a PtyProcess stops reading once full
+            if proc not in self._paused_procs:
+                self._paused_procs.append(proc)
+            return
+        try:
+            raw = bytes(proc.readAllStandardOutput())
+        except Exception as e:
+            self._append_html(f"[output read error: {e}]\n", kind="error")
+            return
+        self._bytes_in += len(raw)
+        if throttled:
+            self._skipped_lines += raw.count(b"\n")
+            return
+        self._pipeline.submit(proc, raw)
+
+    def _release_backpressure(self):
+        if self._skipped_lines:
+            n, self._skipped_lines = self._skipped_lines, 0
+            self._append_html(f"[{n} satır atlandı: çıktı görüntülenebilenden hızlı]\n", kind="error")
+        paused, self._paused_procs = self._paused_procs, []
+        for p in paused:
+            if p is self.shell_proc or p in self.child_procs:
+                self._on_proc_output(p)
+
+    def _update_io_label(self):
+        now = time.monotonic()
+        rate = self._bytes_in / max(now - self._io_tick, 1e-3)
+        self._bytes_in = 0
+        self._io_tick = now
+        state = ""
+        if self._paused_procs:
+            state = " [duraklatıldı]"
+        elif self._skipped_lines:
+            state = f" [{self._skipped_lines} satır atlanıyor]"
+        self.io_label.setText(f"{format_bytes(rate)}/s | tampon {format_bytes(self._pipeline.pending)}{state}")
+
+    def _on_proc_finished(self, proc, code, status):
+        # called for any proc that connects to finished -> we'll handle via mapping
+        # Try to remove from child_procs; if it was foreground_proc, clear that
+        try:
+            if proc in self.child_procs:
+                self.child_procs.remove(proc)
+        except Exception:
+            pass
+        foreground = proc is self.foreground_proc
+        if foreground:
+            self.foreground_proc = None
+        # drain what is left and report the exit after the pending output is rendered
+        if proc in self._paused_procs:
+            self._paused_procs.remove(proc)
+        self._on_proc_output(proc, force=True)
+        label = "foreground process exited" if foreground else "process exited"
+        if status == QtCore.QProcess.CrashExit:
+            msg, kind = f"\n[{label}: signal {code}]\n", "error"
+        else:
+            msg, kind = f"\n[{label}: {code}]\n", "success"
+        self._pipeline.post(proc, lambda: self._append_html(msg, kind=kind))
+        self._pipeline.close_source(proc)
+
+    # ------------------ UI helpers ------------------
+    def _append_html(self, text: str, kind: str = None):
+        """Insert text into QTextEdit with basic highlighting for keywords."""
+        # escape html
+        escaped = html.escape(text)
+        # simple highlight mapping
+        mapping = {
+            "fsociety": self.highlights.get("fsociety", DEFAULT_HIGHLIGHTS["fsociety"]),
+            "error": self.highlights.get("error", DEFAULT_HIGHLIGHTS["error"]),
+            "success": self.highlights.get("success", DEFAULT_HIGHLIGHTS["success"]),
+        }
+        # do a simple case-insensitive tokenized replacement
+        lower = escaped.lower()
+        i = 0
+        out = ""
+        kws = sorted(mapping.keys(), key=lambda x: -len(x))
+        while i < len(escaped):
+            matched = False
+            for kw in kws:
+                L = len(kw)
+                if lower.startswith(kw, i):
+                    color = mapping[kw]
+                    piece = escaped[i:i+L]
+                    out += f'<span style="color:{color}; font-weight:700;">{piece}</span>'
+                    i += L
+                    matched = True
+                    break
+            if not matched:
+                out += escaped[i]
+                i += 1
+        # wrap in pre to preserve formatting
+        pre = f'<pre style="font-family:Courier, monospace; margin:0; color:{self.fg};">{out}</pre>'
+        cursor = self.output.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.insertHtml(pre)
+        self.output.ensureCursorVisible()
+
+    def _on_output_batch(self, batch, nbytes):
+        """GUI side of OutputPipeline: insert prepared runs in one edit block."""
+        cursor = self.output.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.beginEditBlock()
+        for source, runs in batch:
+            if callable(runs):
+                cursor.endEditBlock()
+                runs()
+                cursor.movePosition(QtGui.QTextCursor.End)
+                cursor.beginEditBlock()
+                continue
+            for piece, key in runs:
+                if key is None:
+                    # OSC strings: shell integration reports, window title etc.
+                    if source is self.shell_proc:
+                        note = self._on_shell_osc(piece)
+                        if note:
+                            if not cursor.atBlockStart():
+                                note = "\n" + note
+                            cursor.insertText(note, self._status_format())
+                    continue
+                if self._cmd_open is not None and source is self.shell_proc:
+                    self._cmd_open[4] += len(piece) if piece.isascii() else len(piece.encode("utf-8"))
+                cursor.insertText(piece, self._char_format(key))
+        cursor.endEditBlock()
+        self._scroll_to_end()
+        self._pipeline.rendered(nbytes)
+        if (self._paused_procs or self._skipped_lines) and self._pipeline.pending < self.high_water // 4:
+            self._release_backpressure()
+
+    def _on_shell_osc(self, payload):
+        """Shell integration report; returns a status line to show inline, if any."""
+        if payload.startswith("133;"):
+            return self._on_command_marker(payload[4:])
+        path = parse_osc7(payload)
+        if path and path != self.cwd:
+            self.cwd = path
+            self.prompt.setToolTip(path)
+        return None
+
+    def _on_command_marker(self, mark):
+        if mark == "C" or mark.startswith("C;"):
+            cmd = mark[2:]
+            if cmd:
+                # bash named the command itself, lines queued up to here all belong to it
+                # (continuation lines of a multi-line command)
+                self._shell_cmds.clear()
+            else:
+                cmd = self._shell_cmds.popleft() if self._shell_cmds else "?"
+            self._cmd_open = [cmd, self.cwd, time.time(), time.perf_counter(), 0]
+            return None
+        if not mark.startswith("D"):
+            return None
+        if self._cmd_open is None:
+            # D without C: the first prompt, or a line bash rejected (syntax error) and
+            # never ran; drop its queued entry so later commands keep their names
+            if self._shell_cmds:
+                self._shell_cmds.popleft()
+            return None
+        cmd, cwd, started, t0, out_bytes = self._cmd_open
+        self._cmd_open = None
+        try:
+            code = int(mark.split(";")[1])
+        except (IndexError, ValueError):
+            code = None
+        rec = CommandRecord(cmd, cwd, started, time.perf_counter() - t0, code, out_bytes)
+        self.command_log.append(rec)
+        if self.show_command_status:
+            return self._format_command_status(rec) + "\n"
+        return None
+
+    @staticmethod
+    def _format_command_status(rec):
+        if rec.duration < 1:
+            took = f"{rec.duration * 1000:.0f} ms"
+        else:
+            took = f"{rec.duration:.2f} s"
+        code = "?" if rec.exit_code is None else rec.exit_code
+        return f"[çıkış {code} · {took} · {format_bytes(rec.out_bytes)}]"
+
+    def _status_format(self):
+        fmt = self._formats.get("status")
+        if fmt is None:
+            fmt = QtGui.QTextCharFormat()
+            fmt.setForeground(QtGui.QColor("#808080"))
+            fmt.setFontItalic(True)
+            self._formats["status"] = fmt
+        return fmt
+
+    def show_command_log(self, arg: str = ""):
+        """`cmdlog [N]`: the last N shell commands with exit status, wall time and output size."""
+        try:
+            n = int(arg) if arg else 20
+        except ValueError:
+            self._append_html("Kullanım: cmdlog [N]\n", kind="error")
+            return
+        recs = list(self.command_log)[-n:] if n > 0 else []
+        if not recs:
+            self._append_html("Komut kaydı boş.\n")
+            return
+        lines = []
+        for rec in recs:
+            stamp = time.strftime("%H:%M:%S", time.localtime(rec.started))
+            lines.append(f"{stamp}  {self._format_command_status(rec)}  {rec.cmd}")
+        failed = sum(1 for r in self.command_log if r.exit_code)
+        total = sum(r.duration for r in self.command_log)
+        lines.append(f"{len(self.command_log)} komut, {failed} hatalı, toplam {total:.2f} s")
+        self._append_html("\n".join(lines) + "\n")
+
+    def _char_format(self, key):
+        fmt = self._formats.get(key)
+        if fmt is None:
+            fg, bg, bold, italic, underline = key
+            fmt = QtGui.QTextCharFormat()
+            fmt.setForeground(QtGui.QColor(fg or self.fg))
+            if bg:
+                fmt.setBackground(QtGui.QColor(bg))
+            if bold:
+                fmt.setFontWeight(QtGui.QFont.Bold)
+            fmt.setFontItalic(italic)
+            fmt.setFontUnderline(underline)
+            self._formats[key] = fmt
+        return fmt
+
+    def _scroll_to_end(self):
+        sb = self.output.verticalScrollBar()
+        sb.setValue(sb.maximum())
+
+    def show_welcome(self):
+        # Welcome message using username
+        welcome = f"Merhaba {self.username}! fsociety terminaline hoşgeldin.\nVersiyon: {APP_VERSION} (App)\n"
+        self._append_html(welcome, kind="success")
+        # banner colored
+        banner_html = f'<pre style="font-family:Courier, monospace; margin:0; color:{self.banner_color};">{html.escape(BANNER)}</pre>'
+        cursor = self.output.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        cursor.insertHtml(banner_html + "<br/>")
+        cursor.insertHtml(f'<div style="color:{self.fg};">{html.escape(CREDIT_LINE)}</div><br/>')
+        self.output.ensureCursorVisible()
+
+    # ------------------ input & command handling ------------------
+    def on_enter(self):
+        text = self.input.text()
+        if text is None:
+            return
+        cmdline = text.rstrip("\n")
+        # If a foreground interactive child is running, forward stdin to it
+        if self.foreground_proc and self.foreground_proc.state() != QtCore.QProcess.NotRunning:
+            try:
+                self.foreground_proc.write((cmdline + "\n").encode("utf-8"))
+                self.foreground_proc.waitForBytesWritten(100)
+            except Exception as e:
+                self._append_html(f"[error] foreground stdin yazılamadı: {e}\n", kind="error")
+            # echo locally
+            self._append_html(f"{self.username}@fsociety:$ {html.escape(cmdline)}\n")
+            self.input.clear()
+            return
+
+        # No foreground -> interpret builtins or send to shell_proc
+        self._append_html(f"{self.username}@fsociety:$ {html.escape(cmdline)}\n")
+        self.history.add(cmdline, self.cwd)
+        self._reset_history_nav()
+        self.input.clear()
+
+        cmd = cmdline.strip()
+        if not cmd:
+            return
+
+        # builtins
+        if cmd.lower() == "clear":
+            self.output.clear()
+            self.show_welcome()
+            return
+
+        if cmd.lower() == "help":
+            self._append_html("Builtin: " + " ".join(BUILTINS) + "\n")
+            return
+
+        # EXIT: if foreground exists -> send exit to child; else close app
+        if cmd.lower() == "exit":
+            if self.foreground_proc and self.foreground_proc.state() == QtCore.QProcess.Running:
+                try:
+                    self.foreground_proc.write(b"exit\n")
+                    self.foreground_proc.waitForBytesWritten(100)
+                    self._append_html("[info] Foreground process'a 'exit' gönderildi.\n")
+                except Exception as e:
+                    self._append_html(f"[error] Foreground'a exit gönderilemedi: {e}\n", kind="error")
+                return
+            # no foreground -> close app
+            QtWidgets.qApp.quit()
+            return
+
+        if cmd.lower() == "sysinfo":
+            try:
+                import psutil
+                info = f"Platform: {platform.platform()}\nCPU count: {psutil.cpu_count(logical=True)}\nMemory: {round(psutil.virtual_memory().total/1024/1024)} MB\n"
+            except Exception:
+                info = f"Platform: {platform.platform()}\nCPU count: {os.cpu_count()}\n"
+            self._append_html(info)
+            return
+
+        if cmd.lower().startswith("cd ") and not self._shell_reports_cwd():
+            # no bash integration (Windows, pipe fallback without rcfile): track cwd ourselves,
+            # per tab only -- os.chdir would move every tab
+            tgt = os.path.expanduser(cmd[3:].strip().strip('"'))
+            newdir = os.path.normpath(os.path.join(self.cwd, tgt))
+            if not os.path.isdir(newdir):
+                self._append_html(f"Hata: klasör yok: {newdir}\n", kind="error")
+                return
+            self.cwd = newdir
+            self.prompt.setToolTip(newdir)
+            if self.shell_proc is not None and self.shell_proc.state() == QtCore.QProcess.Running:
+                self.shell_proc.write((cmd + "\n").encode("utf-8"))
+            else:
+                self._append_html(f"Klasör değiştirildi: {self.cwd}\n", kind="success")
+            return
+
+        if cmd.lower().startswith("color "):
+            color = cmd[6:].strip()
+            # allow color names or hex; user responsibility
+            self.fg = color
+            self._formats.clear()
+            # apply to UI
+            self.output.setStyleSheet(f"background-color: {self.bg}; color: {self.fg}; border:none; padding:6px;")
+            self.prompt.setStyleSheet(f"color: {self.fg}; font-weight:bold;")
+            self.input.setStyleSheet(f"background-color:#1a1a1a; color:{self.fg}; border:1px solid {self.fg}; padding:4px;")
+            # save preference
+            self.cfg["fg"] = self.fg
+            self.config.save()
+            return
+
+        if cmd.lower() == "color-change":
+            self.open_color_dialog()
+            return
+
+        if cmd.lower().startswith("start "):
+            target = cmd[6:].strip()
+            ok = platform_open(target)
+            if ok:
+                self._append_html(f"[opened] {html.escape(target)}\n", kind="success")
+            else:
+                self._append_html(f"[error] Açılamadı: {html.escape(target)}\n", kind="error")
+            return
+
+        if cmd.lower() == "scan" or cmd.lower().startswith("scan "):
+            self.run_inprocess_scan(cmd[4:].strip())
+            return
+
+        if cmd.lower() == "results" or cmd.lower().startswith("results "):
+            sub = cmd[7:].strip().lower()
+            if sub == "clear":
+                if self.results_panel:
+                    self.results_panel.clear()
+            elif sub == "hide":
+                if self.results_panel:
+                    self.results_panel.hide()
+            else:
+                self._results_panel().show()
+            return
+
+        if cmd.lower().startswith("run "):
+            kw = cmd[4:].strip()
+            self.run_script(kw, foreground=True)
+            return
+
+        if cmd.lower() == "cmdlog" or cmd.lower().startswith("cmdlog "):
+            self.show_command_log(cmd[6:].strip())
+            return
+
+        if cmd.lower() == "monitor" or cmd.lower().startswith("monitor "):
+            self.show_monitor(cmd[7:].strip().lower())
+            return
+
+        # default: send to shell_proc (persistent interactive shell)
+        if self._shell_integrated and self._cmd_open is None:
+            # a line typed while a command runs is its input, not a new command
+            self._shell_cmds.append(cmd)
+        try:
+            if self.shell_proc and self.shell_proc.state() == QtCore.QProcess.Running:
+                # write command + newline
+                self.shell_proc.write((cmd + "\n").encode("utf-8"))
+                self.shell_proc.waitForBytesWritten(100)
+            elif self.shell_proc and self.shell_proc.state() == QtCore.QProcess.Starting:
+                self._shell_pending.append(cmd)
+            else:
+                # fallback: spawn short-lived process
+                self._spawn_short(proc_cmd=cmd)
+        except Exception as e:
+            self._append_html(f"[error] Shell write hatası: {e}\n", kind="error")
+
+    def _spawn_short(self, proc_cmd):
+        """Spawn a short lived process (used as fallback)."""
+        p = QtCore.QProcess(self)
+        p.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+        p.setWorkingDirectory(self.cwd)
+        p.readyReadStandardOutput.connect(lambda p=p: self._on_proc_output(p))
+        p.finished.connect(lambda code, status, p=p: self._on_proc_finished(p, code, status))
+        if platform.system().lower().startswith("win"):
+            p.start("cmd", ["/c", proc_cmd])
+        else:
+            p.start("/bin/sh", ["-c", proc_cmd])
+        self.child_procs.append(p)
+
+    # ------------------ run script handling ------------------
+    def run_script(self, keyword: str, foreground: bool = False):
+        # map keywords to filenames (search flexible)
+        mapping = SCRIPT_KEYWORDS
+        script_file = None
+        for k, v in mapping.items():
+            if k in keyword.lower():
+                script_file = v
+                break
+        if not script_file:
+            script_file = keyword  # allow direct filename
+
+        # resolve path: first check bundled app dir (for exe), then cwd
+        candidates = [os.path.join(d, script_file) for d in scanner_dirs()] + [
+            os.path.join(self.cwd, script_file),
+            os.path.join(os.getcwd(), script_file),
+        ]
+        script_path = None
+        for c in candidates:
+            if os.path.isfile(c):
+                script_path = c
+                break
+        if not script_path:
+            self._append_html(f"[error] Script bulunamadı: {html.escape(script_file)}\n", kind="error")
+            return
+
+        # start script as separate QProcess (pty backed when available: line buffered input() prompts)
+        p = self._new_process()
+        p.setProcessChannelMode(QtCore.QProcess.MergedChannels)
+        p.readyReadStandardOutput.connect(lambda p=p: self._on_proc_output(p))
+        p.finished.connect(lambda code, status, p=p: self._on_proc_finished(p, code, status))
+        p.errorOccurred.connect(lambda err, p=p, path=script_path: self._on_script_error(p, err, path))
+        try:
+            p.setWorkingDirectory(os.path.dirname(script_path))
+        except Exception:
+            pass
+
+        # Use sys.executable so packaged exe calls embedded interpreter when available
+        # (not waiting for the start here; failures arrive through errorOccurred)
+        if os.path.basename(script_path) in mapping.values():
+            # bundled scanner: its [OPEN] lines go to the results table
+            self._pipeline.watch_records(p)
+        p.start(sys.executable, [script_path])
+
+        self.child_procs.append(p)
+        if foreground:
+            self.foreground_proc = p
+            self._append_html(f"[running foreground] {html.escape(script_path)} (pid: {p.processId()})\n", kind="success")
+        else:
+            self._append_html(f"[running] {html.escape(script_path)}\n", kind="success")
+
+    # ------------------ in-process scan ------------------
+    def run_inprocess_scan(self, arg: str):
+        """scan <hedef|CIDR|aralık> [portlar] | scan stop -- consoleScanner core in a worker thread."""
+        if arg.lower() == "stop":
+            if self.scan_worker and self.scan_worker.is_running():
+                self.scan_worker.stop()
+                self._append_html("[scan] durduruluyor...\n")
+            else:
+                self._append_html("[scan] çalışan tarama yok.\n")
+            return
+        if self.scan_worker and self.scan_worker.is_running():
+            self._append_html("[error] Zaten bir tarama çalışıyor (scan stop ile durdurun).\n", kind="error")
+            return
+        parts = arg.split()
+        if not parts:
+            self._append_html("Kullanım: scan 192.168.1.0/28 [22,80,1000-1010] | scan stop\n")
+            return
+        try:
+            core = load_scanner_module("consoleScanner")
+        except Exception as e:
+            self._append_html(f"[error] Tarayıcı yüklenemedi: {e}\n", kind="error")
+            return
+        targets = core.expand_targets(parts[0])
+        ports = core.parse_ports(",".join(parts[1:])) if len(parts) > 1 else list(core.DEFAULT_PORTS)
+        if not targets or not ports:
+            self._append_html("[error] Geçersiz hedef veya port listesi.\n", kind="error")
+            return
+        self._scan_open = 0
+        self._scan_probes = 0
+        w = ScanWorker(core, targets, ports,
+                       timeout=float(self.cfg.get("scan_timeout", 1.0)),
+                       workers=int(self.cfg.get("scan_workers", 50)), parent=self)
+        w.records.connect(self._on_inproc_records)
+        w.host_failed.connect(lambda host, err: self._append_html(f"{host} çözümlenemedi: {err}\n", kind="error"))
+        w.done.connect(self._on_scan_done)
+        self.scan_worker = w
+        self._append_html(f"[scan] {len(targets)} hedef x {len(ports)} port (süreç içi, açık portlar tabloda)\n", kind="success")
+        w.start()
+
+    def _on_inproc_records(self, records):
+        self._scan_probes += len(records)
+        self._scan_open += sum(1 for r in records if r.is_open)
+        self._on_scan_records(records)
+
+    def _on_scan_records(self, records):
+        """Scan results (in-process scan or parsed from a scanner script) go to the table."""
+        if not any(r.is_open for r in records):
+            return
+        panel = self._results_panel()
+        if not panel.isVisible():
+            panel.show()
+        panel.add_records(records)
+
+    def _results_panel(self):
+        if self.results_panel is None:
+            self.results_panel = ScanResultsPanel(self.fg, self.bg)
+            self.splitter.addWidget(self.results_panel)
+            self.splitter.setSizes([self.height() * 3 // 5, self.height() * 2 // 5])
+        return self.results_panel
+
+    # ------------------ resource monitor ------------------
+    def show_monitor(self, arg: str = ""):
+        """`monitor [show|hide]`: live CPU/RSS/FD/I/O of this tab's processes and their children."""
+        if arg == "hide":
+            if self.monitor_panel:
+                self.monitor_panel.hide()
+            return
+        if self.monitor is None:
+            self.monitor = ProcMonitor(self)
+            self.monitor.sampled.connect(self._on_monitor_sample)
+            self.monitor_panel = ResourcePanel(self.fg, self.bg)
+            self.splitter.addWidget(self.monitor_panel)
+            self._monitor_timer = QtCore.QTimer(self)
+            interval = float(self.cfg.get("monitor_interval", 1.0))
+            self._monitor_timer.setInterval(max(100, int(interval * 1000)))
+            self._monitor_timer.timeout.connect(self._monitor_tick)
+        self.monitor_panel.show()
+        self._monitor_timer.start()
+        self._monitor_tick()
+
+    def _monitor_roots(self):
+        # foreground scripts are in child_procs as well
+        roots = [("shell", self.shell_proc)] if self.shell_proc is not None else []
+        for i, p in enumerate(self.child_procs, 1):
+            roots.append(("ön plan" if p is self.foreground_proc else f"iş {i}", p))
+        out = []
+        for label, p in roots:
+            try:
+                pid = int(p.processId())
+            except Exception:
+                continue
+            if pid > 0:
+                out.append((label, pid))
+        return out
+
+    def _monitor_tick(self):
+        if self.monitor_panel is None or not self.monitor_panel.isVisible():
+            self._monitor_timer.stop()  # hidden panel: stop sampling
+            return
+        self.monitor.request(self._monitor_roots())
+
+    def _on_monitor_sample(self, rows):
+        if self.monitor_panel is not None and self.monitor_panel.isVisible():
+            self.monitor_panel.show_samples(rows)
+
+    def _on_scan_done(self, elapsed, stopped):
+        state = "durduruldu" if stopped else "tamamlandı"
+        self._append_html(f"[scan] Tarama {state}: {self._scan_open} açık / {self._scan_probes} deneme, "
+                          f"süre {elapsed:.2f}s\n", kind="success")
+
+    def _on_script_error(self, proc, err, script_path):
+        if err != QtCore.QProcess.FailedToStart:
+            return
+        if proc in self.child_procs:
+            self.child_procs.remove(proc)
+        if proc is self.foreground_proc:
+            self.foreground_proc = None
+        self._append_html(f"[error] Script başlatılamadı: {html.escape(script_path)}\n", kind="error")
+
+    # ------------------ color / banner / highlight dialogs ------------------
+    def open_color_dialog(self):
+        fg = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.fg), self, "Yazı Rengi Seç")
+        if not fg.isValid():
+            return
+        bg = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.bg), self, "Arka Plan Rengi Seç")
+        if not bg.isValid():
+            return
+        self.fg = fg.name()
+        self.bg = bg.name()
+        self._formats.clear()
+        self._apply_colors_and_save()
+
+    def _apply_colors_and_save(self):
+        self.output.setStyleSheet(f"background-color: {self.bg}; color: {self.fg}; border:none; padding:6px;")
+        self.prompt.setStyleSheet(f"color: {self.fg}; font-weight:bold;")
+        self.input.setStyleSheet(f"background-color:#1a1a1a; color:{self.fg}; border:1px solid {self.fg}; padding:4px;")
+        # persist to config
+        self.cfg["fg"] = self.fg
+        self.cfg["bg"] = self.bg
+        self.config.save()
+
+    def open_banner_color_dialog(self):
+        c = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.banner_color), self, "Banner Rengi Seç")
+        if not c.isValid():
+            return
+        self.banner_color = c.name()
+        self.cfg["banner_color"] = self.banner_color
+        self.config.save()
+        # redraw banner at end
+        cursor = self.output.textCursor()
+        cursor.movePosition(QtGui.QTextCursor.End)
+        banner_html = f'<pre style="font-family:Courier, monospace; margin:0; color:{self.banner_color};">{html.escape(BANNER)}</pre>'
+        cursor.insertHtml(banner_html + "<br/>")
+        self.output.ensureCursorVisible()
+
+    def open_highlight_dialog(self):
+        err = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.highlights.get("error")), self, "Error rengi")
+        if err.isValid():
+            self.highlights["error"] = err.name()
+        suc = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.highlights.get("success")), self, "Success rengi")
+        if suc.isValid():
+            self.highlights["success"] = suc.name()
+        fso = QtWidgets.QColorDialog.getColor(QtGui.QColor(self.highlights.get("fsociety")), self, "fsociety rengi")
+        if fso.isValid():
+            self.highlights["fsociety"] = fso.name()
+        self.cfg["highlights"] = self.highlights
+        self.config.save()
+
+    # ------------------ history nav ------------------
+    def eventFilter(self, source, event):
+        if source is self.input and event.type() == QtCore.QEvent.KeyPress:
+            key = event.key()
+            ctrl = bool(event.modifiers() & QtCore.Qt.ControlModifier)
+            if ctrl and key == QtCore.Qt.Key_R:
+                self._reverse_search_step()
+                return True
+            if self._rsearch is not None:
+                if key == QtCore.Qt.Key_Escape or (ctrl and key == QtCore.Qt.Key_G):
+                    self._reverse_search_end(accept=False)
+                    return True
+                if key in (QtCore.Qt.Key_Up, QtCore.Qt.Key_Down, QtCore.Qt.Key_Left, QtCore.Qt.Key_Right, QtCore.Qt.Key_Tab):
+                    self._reverse_search_end(accept=True)
+                    return True
+                if key in (QtCore.Qt.Key_Return, QtCore.Qt.Key_Enter):
+                    # like bash: accept the match and run it
+                    self._reverse_search_end(accept=True)
+                    self.on_enter()
+                    return True
+                return False  # typing edits the query, see _on_input_edited
+            if key == QtCore.Qt.Key_Tab:
+                self._complete()
+                return True
+            if key == QtCore.Qt.Key_Up:
+                if self._hist_iter is None:
+                    # prefix search on what is typed so far (empty -> plain recency)
+                    self._hist_draft = self.input.text()
+                    self._hist_iter = self.history.recent(self._hist_draft, self.cwd)
+                    self._hist_seen = []
+                    self.hist_pos = -1
+                if self.hist_pos + 1 >= len(self._hist_seen):
+                    nxt = next(self._hist_iter, None)
+                    if nxt is not None:
+                        self._hist_seen.append(nxt)
+                if self.hist_pos + 1 < len(self._hist_seen):
+                    self.hist_pos += 1
+                    self._set_input_silently(self._hist_seen[self.hist_pos])
+                return True
+            elif key == QtCore.Qt.Key_Down:
+                if self._hist_iter is not None and self.hist_pos > 0:
+                    self.hist_pos -= 1
+                    self._set_input_silently(self._hist_seen[self.hist_pos])
+                elif self._hist_iter is not None:
+                    self._set_input_silently(self._hist_draft)
+                    self._reset_history_nav()
+                else:
+                    self.input.clear()
+                return True
+        return super().eventFilter(source, event)
+
+    # ------------------ completion ------------------
+    def _complete(self):
+        text = self.input.text()[:self.input.cursorPosition()]
+        rest = self.input.text()[len(text):]
+        start, cands = self.completer.complete(text, self.cwd)
+        if not cands:
+            QtWidgets.QApplication.beep()
+            return
+        if len(cands) > 1 and self._last_tab != text:
+            QtWidgets.QApplication.beep()
+        if len(cands) == 1:
+            new = cands[0] if cands[0].endswith(os.sep) else cands[0] + " "
+        else:
+            new = os.path.commonprefix(cands)
+        completed = text[:start] + new
+        if completed != text:
+            self.input.setText(completed + rest)
+            self.input.setCursorPosition(len(completed))
+            self._last_tab = completed
+            return
+        if self._last_tab == text:
+            # Tab again without progress: show the candidates like bash does
+            shown = [os.path.basename(c.rstrip(os.sep)) + (os.sep if c.endswith(os.sep) else "") for c in cands[:200]]
+            more = f"\n... (+{len(cands) - 200})" if len(cands) > 200 else ""
+            self._append_html("  ".join(shown) + more + "\n")
+        self._last_tab = text
+
+    def _reset_history_nav(self):
+        self._hist_iter = None
+        self._hist_seen = []
+        self.hist_pos = -1
+
+    def _set_input_silently(self, text):
+        self._nav_edit = True
+        self.input.setText(text)
+        self._nav_edit = False
+
+    def _on_input_edited(self, text):
+        if getattr(self, "_nav_edit", False):
+            return
+        if self._rsearch is not None:
+            self._rsearch["query"] = text
+            self._rsearch["index"] = None
+            self._reverse_search_update()
+        elif self._hist_iter is not None:
+            self._reset_history_nav()  # typing after Up starts a new prefix search
+
+    def _reverse_search_step(self):
+        """Ctrl+R: start incremental reverse search, or jump to the next older match."""
+        if self._rsearch is None:
+            self._rsearch = {"query": "", "index": None, "match": "", "draft": self.input.text()}
+            self._set_input_silently("")
+        self._reverse_search_update(older=self._rsearch["index"] is not None)
+
+    def _reverse_search_update(self, older=False):
+        rs = self._rsearch
+        found = None
+        if rs["query"]:
+            found = self.history.reverse_search(rs["query"], rs["index"] if older else None)
+        if found is not None:
+            rs["index"], rs["match"] = found
+        elif not older:
+            rs["index"], rs["match"] = None, ""
+        label = "(reverse-i-search)" if found is not None or not rs["query"] else "(failed reverse-i-search)"
+        self.prompt.setText(f"{label}`{rs['query']}': {rs['match']}")
+
+    def _reverse_search_end(self, accept: bool):
+        rs, self._rsearch = self._rsearch, None
+        self.prompt.setText(f"{self.username}@fsociety:$")
+        if accept:
+            self._set_input_silently(rs["match"] or rs["query"])
+        else:
+            self._set_input_silently(rs["draft"])
+        self._reset_history_nav()
+
+    # ------------------ cleanup ------------------
+    def close(self):
+        try:
+            # terminate child processes
+            if self.foreground_proc:
+                try:
+                    self.foreground_proc.terminate()
+                except:
+                    pass
+                self.foreground_proc = None
+            for p in list(self.child_procs):
+                try:
+                    p.terminate()
+                except:
+                    pass
+            # shell proc
+            if self.shell_proc:
+                try:
+                    self.shell_proc.terminate()
+                except:
+                    pass
+                self.shell_proc = None
+            self._pipeline.stop()
+            if self.scan_worker:
+                self.scan_worker.stop()
+            if self.monitor:
+                self.monitor.stop()
+        except Exception:
+            pass
+        super().close()
+
+# --------------------------- Main Window ---------------------------
+class FsocietyTerminal(QtWidgets.QMainWindow):
+    def __init__(self, username: str, cfg):
+        super().__init__()
+        self.username = username
+        self.config = cfg if isinstance(cfg, ConfigStore) else ConfigStore(cfg, path=None, parent=self)
+        self.cfg = self.config.data
+        # one history for all tabs; persisted only for the real config
+        self.history = HistoryStore(HISTORY_FILE if self.config.path else None, parent=self)
+        QtWidgets.QApplication.instance().aboutToQuit.connect(self.history.flush)
+        self.setWindowTitle(f"fsociety terminal — {self.username}")
+        self.resize(1200, 780)
+        # theme
+        theme = self.cfg.get("theme", "dark")
+        if theme == "light":
+            self.setStyleSheet("background-color: #f6f6f6; color: #002b22;")
+        else:
+            self.setStyleSheet("background-color: #0d0d0d; color: #00ff9e;")
+
+        main = QtWidgets.QWidget()
+        self.setCentralWidget(main)
+        layout = QtWidgets.QHBoxLayout(main)
+        layout.setContentsMargins(10, 10, 10, 10)
+        layout.setSpacing(10)
+
+        # tabs
+        self.tabs = QtWidgets.QTabWidget()
+        self.tabs.setTabsClosable(True)
+        self.tabs.tabCloseRequested.connect(self.close_tab)
+        self.tabs.setStyleSheet(
+            'QTabBar::tab {background:#1a1a1a;color:#00ff9e;padding:8px;}'
+            'QTabBar::tab:selected{background:#00ff9e;color:#0d0d0d;font-weight:bold;}'
+        )
+        layout.addWidget(self.tabs, 1)
+
+        # corner add button
+        add_btn = QtWidgets.QPushButton("+")
+        add_btn.setFixedWidth(30)
+        add_btn.setStyleSheet("background:#1a1a1a; color:#00ff9e; font-weight:bold;")
+        add_btn.clicked.connect(lambda: self.add_tab(f"Terminal {self.tabs.count()+1}"))
+        self.tabs.setCornerWidget(add_btn, QtCore.Qt.TopRightCorner)
+
+        # menu
+        menu = self.menuBar()
+        file_menu = menu.addMenu("Dosya")
+        new_tab_action = QtWidgets.QAction("Yeni Sekme", self)
+        new_tab_action.triggered.connect(lambda: self.add_tab(f"Terminal {self.tabs.count()+1}"))
+        file_menu.addAction(new_tab_action)
+        exit_action = QtWidgets.QAction("Çıkış", self)
+        exit_action.triggered.connect(QtWidgets.qApp.quit)
+        file_menu.addAction(exit_action)
+
+        view_menu = menu.addMenu("Görünüm")
+        color_action = QtWidgets.QAction("Renkleri Değiştir (Sekme)", self)
+        color_action.triggered.connect(self.menu_color)
+        view_menu.addAction(color_action)
+        banner_action = QtWidgets.QAction("Banner Rengini Değiştir (Sekme)", self)
+        banner_action.triggered.connect(self.menu_banner)
+        view_menu.addAction(banner_action)
+        hl_action = QtWidgets.QAction("Vurgu Renklerini Değiştir (Sekme)", self)
+        hl_action.triggered.connect(self.menu_highlight)
+        view_menu.addAction(hl_action)
+        theme_action = QtWidgets.QAction("Temayı Değiştir", self)
+        theme_action.triggered.connect(self.toggle_theme)
+        view_menu.addAction(theme_action)
+
+        # first tab
+        self.add_tab("Terminal 1")
+
+    def add_tab(self, title: str):
+        tab = TerminalTab(title, self.username, self.config, self.history)
+        idx = self.tabs.addTab(tab, title)
+        self.tabs.setCurrentIndex(idx)
+        # randomize banner color mildly
+        import random
+        tab.banner_color = random.choice([DEFAULT_BANNER_COLOR, "#00ffd1", "#39ff14", "#7afcff", "#b3ff66"])
+
+    def close_tab(self, index: int):
+        if self.tabs.count() > 1:
+            w = self.tabs.widget(index)
+            try:
+                w.close()
+            except:
+                pass
+            self.tabs.removeTab(index)
+            w.deleteLater()
+
+    # menu handlers
+    def _current_tab(self):
+        return self.tabs.currentWidget()
+
+    def menu_color(self):
+        tab = self._current_tab()
+        if isinstance(tab, TerminalTab):
+            tab.open_color_dialog()
+
+    def menu_banner(self):
+        tab = self._current_tab()
+        if isinstance(tab, TerminalTab):
+            tab.open_banner_color_dialog()
+
+    def menu_highlight(self):
+        tab = self._current_tab()
+        if isinstance(tab, TerminalTab):
+            tab.open_highlight_dialog()
+
+    def toggle_theme(self):
+        cur = self.cfg.get("theme", "dark")
+        new = "light" if cur == "dark" else "dark"
+        self.cfg["theme"] = new
+        self.config.save()
+        if new == "light":
+            self.setStyleSheet("background-color: #f6f6f6; color: #002b22;")
+        else:
+            self.setStyleSheet("background-color: #0d0d0d; color: #00ff9e;")
+
+# --------------------------- Entrypoint ---------------------------
+class StartupProfile:
+    """Per-phase launch timings for --profile-startup, printed to stderr once the window is up."""
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.phases = []
+        self._last = _T_START
+
+    def mark(self, name: str, waiting: bool = False):
+        now = time.perf_counter()
+        self.phases.append((name, (now - self._last) * 1000, waiting))
+        self._last = now
+
+    def report(self):
+        if not self.enabled:
+            return
+        lines = ["[startup] açılış profili:"]
+        for name, ms, waiting in self.phases:
+            lines.append(f"  {name:<32}{ms:9.1f} ms" + ("  (kullanıcı bekleme, toplam dışı)" if waiting else ""))
+        total = sum(ms for _, ms, waiting in self.phases if not waiting)
+        lines.append(f"  {'toplam':<32}{total:9.1f} ms")
+        print("\n".join(lines), file=sys.stderr, flush=True)
+
+def main():
+    import argparse
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--profile-startup", action="store_true")
+    opts, qt_args = parser.parse_known_args(sys.argv[1:])
+    prof = StartupProfile(opts.profile_startup)
+    prof.mark("imports")
+
+    if hasattr(QtCore.Qt, "AA_EnableHighDpiScaling"):
+        QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling)
+    app = QtWidgets.QApplication(sys.argv[:1] + qt_args)
+    prof.mark("QApplication")
+
+    # single config load, one store shared by the login dialog, the window and all tabs
+    store = ConfigStore(load_config())
+    app.aboutToQuit.connect(store.flush)
+    prof.mark("config")
+    dlg = LoginDialog(store)
+    prof.mark("login dialog")
+    if dlg.exec_() != QtWidgets.QDialog.Accepted:
+        sys.exit(0)
+    prof.mark("login", waiting=True)
+
+    username = dlg.username.text().strip()
+    w = FsocietyTerminal(username, store)
+    prof.mark("main window")
+    w.show()
+    prof.mark("show")
+
+    def first_tab_ready():
+        # queued behind the first tab's lazy init (scheduled from its showEvent)
+        prof.mark("first tab (banner + shell spawn)")
+        prof.report()
+    QtCore.QTimer.singleShot(0, first_tab_ready)
+    sys.exit(app.exec_())
+
+if __name__ == "__main__":
+    main()